@@ -0,0 +1,143 @@
+"""
+Scaling benchmark for the preprocessing stages and analyses on synthetic Superstore data.
+
+    python benchmarks/bench_pipeline.py --rows 10000 1000000 10000000
+    python benchmarks/bench_pipeline.py --compare results/<old>.json results/<new>.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+import src
+from src.preprocessing_pipeline import parse_dates, add_derived_columns, categorize_order_size
+from src.schema import compact_dtypes
+
+DEFAULT_ROWS = [10_000, 1_000_000, 10_000_000]
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Stages run in order on the same frame, as in run_preprocessing
+STAGES = [
+    ('parse_dates', parse_dates),
+    ('add_derived_columns', add_derived_columns),
+    ('categorize_order_size', categorize_order_size),
+    ('compact_dtypes', lambda df: compact_dtypes(df, report=False)),
+]
+ANALYSES = [
+    ('profitability_metrics', src.profitability_metrics),
+    ('RFM_Analysis', src.RFM_Analysis),
+    ('product_analysis', src.product_analysis),
+]
+
+
+def _fresh(args):
+    # Stages modify their frame in place, so each pass gets its own copy of the inputs
+    return [arg.copy() if isinstance(arg, pd.DataFrame) else io.StringIO() if isinstance(arg, io.StringIO) else arg
+            for arg in args]
+
+
+def measure(func, *args):
+    # Peak traced allocation in one pass, then wall and CPU time in a separate untraced
+    # pass: tracemalloc hooks every allocation and would inflate the timings
+    traced_args = _fresh(args)
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func(*traced_args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    return result, {'wall_s': round(wall, 6), 'cpu_s': round(cpu, 6), 'peak_mb': round(peak / 1e6, 3)}
+
+
+def bench_size(rows, customers, seed):
+    raw = src.generate_orders(rows, customers=customers, seed=seed)
+    results = []
+    df = raw
+    for name, stage in STAGES:
+        df, stats = measure(stage, df)
+        results.append({'rows': rows, 'stage': name, **stats})
+    for name, analysis in ANALYSES:
+        _, stats = measure(analysis, df, io.StringIO())
+        results.append({'rows': rows, 'stage': name, **stats})
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run(rows_list, customers, seed, output):
+    meta = {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+    results = []
+    for rows in rows_list:
+        print(f"Benchmarking {rows:,} rows...")
+        for record in bench_size(rows, customers, seed):
+            print(f"  {record['stage']:<24} {record['wall_s']:>10.4f}s wall {record['cpu_s']:>10.4f}s cpu {record['peak_mb']:>10.1f} MB peak")
+            results.append(record)
+    output = output or os.path.join(RESULTS_DIR, f"{meta['commit']}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as result_file:
+        json.dump({'meta': meta, 'results': results}, result_file, indent=2)
+    print(f"\nResults written to {output}")
+
+
+def compare(old_path, new_path, threshold):
+    # Print per-stage ratios and return the number of wall-time regressions above threshold
+    with open(old_path) as old_file, open(new_path) as new_file:
+        old, new = json.load(old_file), json.load(new_file)
+    baseline = {(r['rows'], r['stage']): r for r in old['results']}
+    regressions = 0
+    print(f"{'rows':>10} {'stage':<24} {'old s':>10} {'new s':>10} {'ratio':>7} {'old MB':>9} {'new MB':>9}")
+    for record in new['results']:
+        before = baseline.get((record['rows'], record['stage']))
+        if before is None:
+            continue
+        ratio = record['wall_s'] / before['wall_s'] if before['wall_s'] else float('inf')
+        flag = ''
+        if ratio > 1 + threshold:
+            regressions += 1
+            flag = '  REGRESSION'
+        print(f"{record['rows']:>10,} {record['stage']:<24} {before['wall_s']:>10.4f} {record['wall_s']:>10.4f} "
+              f"{ratio:>7.2f} {before['peak_mb']:>9.1f} {record['peak_mb']:>9.1f}{flag}")
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS, help='Row counts to benchmark')
+    parser.add_argument('--customers', type=int, default=800, help='Distinct customers in the synthetic data')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Result JSON path (default: benchmarks/results/<commit>.json)')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='Compare two result files')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed slowdown before flagging a regression')
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) else 0)
+    run(args.rows, args.customers, args.seed, args.output)
@@ -1,14 +1,98 @@
-import pandas as pd
+import argparse
+import contextlib
 import src
 import os
 
+DATA_PATH = os.path.join("data", "Sample - Superstore.csv")
+CACHE_DIR = os.path.join("data", "cache")
+RFM_STATE_PATH = os.path.join("data", "rfm_state.parquet")
+CUBE_PATH = os.path.join("data", "cube.parquet")
+BATCH_OUTPUT_DIR = os.path.join("data", "batch")
+RESULT_CACHE_DIR = os.path.join("data", "cache", "results")
+COLUMN_STORE_DIR = os.path.join("data", "columns")
+
 if __name__ == "__main__":
-    path = src.fetch_data("vivek468/superstore-dataset-final")
-    df = pd.read_csv(f'data/Sample - Superstore.csv', encoding='latin1')
+    parser = argparse.ArgumentParser(description="Superstore sales analysis")
+    parser.add_argument("--no-cache", action="store_true", help="Rebuild the preprocessed frame and results without the on-disk caches")
+    parser.add_argument("--stream", action="store_true", help="Process the sales file in chunks instead of loading it whole")
+    parser.add_argument("--chunksize", type=int, default=src.streaming.DEFAULT_CHUNKSIZE, help="Rows per chunk in --stream mode and per block in --mmap mode")
+    parser.add_argument("--approximate", nargs="?", type=float, const=src.sketches.DEFAULT_DISTINCT_ERROR, metavar="ERROR",
+                        help="In --stream/--mmap/--batch mode, estimate distinct counts with HyperLogLog at this relative error")
+    parser.add_argument("--mmap", action="store_true", help="Analyze out of core from the memory-mapped column store (built when missing or stale)")
+    parser.add_argument("--parallel", action="store_true", help="Run the analyses concurrently in a process pool")
+    parser.add_argument("--analyses", nargs="+", choices=list(src.ANALYSES), help="Run only these analyses, preprocessing only the columns they need")
+    parser.add_argument("--rfm-delta", metavar="CSV", help="Apply a file of new orders to the stored RFM state and report RFM only")
+    parser.add_argument("--source", help="Use a local dataset file or directory instead of downloading")
+    parser.add_argument("--offline", action="store_true", help="Never download; require a verified local copy")
+    parser.add_argument("--refresh-data", action="store_true", help="Re-download the dataset even if a verified copy exists")
+    parser.add_argument("--build-cube", action="store_true", help="Also build and save the pre-aggregated time cube")
+    parser.add_argument("--json", metavar="PATH", help="Also write every result table to a JSON file")
+    parser.add_argument("--parquet", metavar="DIR", help="Also write every result table as Parquet files in DIR")
+    parser.add_argument("--profile", metavar="DIR", help="Record per-stage timing and memory and write traces to DIR")
+    parser.add_argument("--batch", metavar="DIR_OR_MANIFEST", help="Run the analyses over every CSV in a directory or listed in a manifest")
+    parser.add_argument("--batch-output", default=BATCH_OUTPUT_DIR, help="Directory for per-input summaries, rollup.txt and batch_report.json")
+    parser.add_argument("--workers", type=int, help="Worker processes in --batch mode (default: CPU count)")
+    parser.add_argument("--worker-memory", type=int, metavar="MB", help="Virtual address-space (RLIMIT_AS) limit per --batch worker, not an RSS limit")
+    parser.add_argument("--retries", type=int, default=src.batch.DEFAULT_RETRIES, help="Retries per input after a transient failure in --batch mode")
+    parser.add_argument("--serve", action="store_true", help="Keep the preprocessed data in memory and serve analyses over HTTP")
+    parser.add_argument("--port", type=int, default=src.server.DEFAULT_PORT, help="Port for --serve")
+    parser.add_argument("--socket", metavar="PATH", help="Serve on a Unix socket instead of a TCP port")
+    parser.add_argument("--quiet", action="store_true", help="Do not print results to the console")
+    args = parser.parse_args()
+
+    if args.batch:
+        batch_report = src.run_batch(src.discover_inputs(args.batch), args.batch_output, max_workers=args.workers,
+                                     worker_memory_mb=args.worker_memory, retries=args.retries,
+                                     approximate_error=args.approximate)
+        raise SystemExit(1 if batch_report['failed'] else 0)
+
+    src.fetch_data("vivek468/superstore-dataset-final", source=args.source,
+                   offline=args.offline or None, refresh=args.refresh_data)
+    if args.serve:
+        src.serve(DATA_PATH, cache_dir=None if args.no_cache else CACHE_DIR, port=args.port, socket_path=args.socket,
+                  result_cache=src.ResultCache())
+        raise SystemExit(0)
+
     # Create summary file  as well
     summary_path = os.path.join("data", "summary.txt")
     with open(summary_path, "w") as summary_file:
-        src.run_preprocessing(df)
-        src.profitability_metrics(df, summary_file)
-        src.RFM_Analysis(df, summary_file)
-        src.product_analysis(df, summary_file)
\ No newline at end of file
+        sinks = [src.TextSink(summary_file)]
+        if not args.quiet:
+            sinks.append(src.ConsoleSink())
+        if args.json:
+            sinks.append(src.JSONSink(args.json))
+        if args.parquet:
+            sinks.append(src.ParquetSink(args.parquet))
+
+        profiling = src.profile() if args.profile else contextlib.nullcontext()
+        with profiling as profiler, src.Report(sinks) as report:
+            if args.rfm_delta:
+                src.run_incremental_rfm(RFM_STATE_PATH, args.rfm_delta, report, source_path=DATA_PATH)
+            elif args.analyses:
+                columns = src.analysis_source_columns(args.analyses)
+                src.run_analyses_lazily(src.load_orders(DATA_PATH, columns=columns, parse_dates=False), report, args.analyses)
+            elif args.mmap:
+                fingerprint = src.source_fingerprint(DATA_PATH)
+                # Built chunk by chunk, so the source never has to fit in memory
+                if args.no_cache or src.store_fingerprint(COLUMN_STORE_DIR) != fingerprint:
+                    src.build_column_store(src.iter_chunks(DATA_PATH, args.chunksize), COLUMN_STORE_DIR, fingerprint)
+                src.run_column_store_analysis(COLUMN_STORE_DIR, report, block_rows=args.chunksize,
+                                              approximate_error=args.approximate)
+            elif args.stream:
+                src.run_streaming_analysis(DATA_PATH, report, chunksize=args.chunksize, approximate_error=args.approximate)
+            else:
+                # Taken before loading, so a file changed mid-load can't key results for newer data
+                fingerprint = src.source_fingerprint(DATA_PATH)
+                df = src.run_preprocessing(source_path=DATA_PATH, cache_dir=None if args.no_cache else CACHE_DIR)
+                if args.build_cube:
+                    print(f"Time cube saved to {src.TimeCube.build(df).save(CUBE_PATH)}")
+                if args.parallel:
+                    src.run_parallel_analyses(df, report)
+                elif args.no_cache:
+                    src.profitability_metrics(df, report)
+                    src.RFM_Analysis(df, report)
+                    src.product_analysis(df, report)
+                else:
+                    src.run_cached_analyses(df, report, src.ResultCache(RESULT_CACHE_DIR), fingerprint=fingerprint)
+        if profiler is not None:
+            profiler.save(args.profile)
@@ -1,7 +1,44 @@
 from .analysis import (
     profitability_metrics,
     product_analysis,
-    RFM_Analysis
+    RFM_Analysis,
+    report_profitability,
+    report_rfm,
+    report_products,
+    register_analysis,
+    ANALYSES,
+    ANALYSIS_COLUMNS
 )
-from .utils import fetch_data, calculate_profitability_metrics
-from .preprocessing_pipeline import run_preprocessing
\ No newline at end of file
+from .utils import fetch_data, calculate_profitability_metrics, calculate_rfm, calculate_product_metrics
+from .preprocessing_pipeline import run_preprocessing
+from .derivations import derived_column, apply_derivations, DERIVED_COLUMNS
+from .metrics import (
+    aggregate,
+    summarize,
+    partial_aggregate,
+    merge_partials,
+    finalize,
+    approximate,
+    approx_nunique_of,
+    Metric,
+    PROFITABILITY_METRICS,
+    RFM_METRICS,
+    PRODUCT_METRICS
+)
+from .cache import load_cached, store_cached, source_fingerprint
+from .streaming import run_streaming_analysis, stream_state, finalize_state, iter_chunks
+from .rfm_store import update_rfm_state, apply_order_delta, rfm_from_state, run_incremental_rfm
+from .parallel import run_parallel_analyses
+from .segmentation import segment_rfm, classify, bin_scores, RFM_SCORE_BINS, RFM_SEGMENT_RULES
+from .schema import compact_dtypes, frame_memory
+from .synthetic import generate_orders
+from .dataset_store import ensure_dataset, verify_dataset
+from .dag import PreprocessingDAG, preprocessing_step, run_analyses_lazily, analysis_source_columns
+from .report import Report, ConsoleSink, TextSink, JSONSink, ParquetSink
+from .cube import TimeCube
+from .profiling import profile, profiled, span
+from .loader import load_orders, parse_date_series, SUPERSTORE_SCHEMA
+from .batch import run_batch, discover_inputs
+from .server import AnalysisService, serve
+from .result_cache import ResultCache, cached_analysis, run_cached_analyses, frame_fingerprint
+from .column_store import ColumnStore, build_column_store, store_fingerprint, run_column_store_analysis
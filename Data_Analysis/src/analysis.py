@@ -1,88 +1,64 @@
 import pandas as pd
 import numpy as np
-from .utils import calculate_profitability_metrics, calculate_rfm, calculate_product_metrics
+from .profiling import profiled
+from .report import as_report
+from .segmentation import segment_rfm
+from .metrics import aggregate, spec_columns, PROFITABILITY_METRICS, RFM_METRICS, PRODUCT_METRICS
 
+PROFITABILITY_GROUPS = ['Region', 'Category', 'Sub-Category']
+RFM_GROUPS = ['Customer ID', 'Customer Name', 'Segment']
+PRODUCT_GROUPS = ['Category', 'Sub-Category']
+CONCENTRATION_SIZES = [3, 5, 10]
+PERFORMANCE_TIERS = ['Needs Improvement', 'Average', 'Good', 'Top']
 
+
+@profiled('profitability_metrics', 'analysis')
 def profitability_metrics(df, summary_file):
     # Calculate profitability metrics by Region, Category, and Sub-Category
-    profit_analysis = (df
-        .groupby(['Region', 'Category', 'Sub-Category'])
-        .apply(calculate_profitability_metrics, include_groups=False)
+    report_profitability(aggregate(df, PROFITABILITY_GROUPS, PROFITABILITY_METRICS), summary_file)
+
+def report_profitability(profit_metrics, summary_file):
+    # Tier and report per-group profitability metrics (from memory or merged chunks)
+    profit_analysis = (profit_metrics
         .reset_index()
         .sort_values('Total_Profit', ascending=False)
     )
-    profit_analysis['Performance_Tier'] = pd.cut(
-        profit_analysis['Total_Profit'],
-        bins=[-np.inf] + profit_analysis['Total_Profit'].quantile([0.25, 0.50, 0.75]).tolist() + [np.inf],
-        labels=['Needs Improvement', 'Average', 'Good', 'Top']
+    # Same bins as pd.cut over the quartile edges, but tied edges (one group) and an empty
+    # frame (a filter matching nothing) just leave some tiers empty instead of raising
+    edges = profit_analysis['Total_Profit'].quantile([0.25, 0.50, 0.75]).to_numpy()
+    profit_analysis['Performance_Tier'] = pd.Categorical.from_codes(
+        np.searchsorted(edges, profit_analysis['Total_Profit'].to_numpy(), side='left'),
+        categories=PERFORMANCE_TIERS, ordered=True
     )
 
-    print("===== Profitability Analysis By Region, Category & Sub-Category =====")
-    print("\nTop 10 Most Profitable Product Lines:")
-    print(profit_analysis.head(10).to_string(index=False))
-
-    print("\n\nBottom 10 Least Profitable Product Lines:")
-    print(profit_analysis.tail(10).to_string(index=False))
-
-    #Write to file
-    summary_file.write("===== Profitability Analysis By Region, Category & Sub-Category =====\n")
-    summary_file.write("\nTop 10 Most Profitable Product Lines:\n")
-    summary_file.write(profit_analysis.head(10).to_string(index=False))
-    summary_file.write("\n\nBottom 10 Least Profitable Product Lines:\n")
-    summary_file.write(profit_analysis.tail(10).to_string(index=False))
-
     tier_summary = (profit_analysis
-        .groupby('Performance_Tier')
+        .groupby('Performance_Tier', observed=False)
         .agg({'Total_Profit': 'sum', 'Total_Sales': 'sum', 'Sub-Category': 'count'})
         .rename(columns={'Sub-Category': 'Count'})
     )
-    print(f"\n\nPerformance Tier Summary:\n{tier_summary}")
-    summary_file.write(f"\n\nPerformance Tier Summary:\n{tier_summary.to_string()}\n")
-
-def RFM_Analysis(df, summary_file):
-    # Calculate RFM metrics for each customer
-    reference_date = df['Order Date'].max() + pd.Timedelta(days=1)
-    
-    rfm_data = (df
-        .groupby(['Customer ID', 'Customer Name', 'Segment'])
-        .apply(calculate_rfm, reference_date=reference_date, include_groups=False)
-        .reset_index()
-    )
-
-    rfm_data['R_Score'] = pd.cut(
-        rfm_data['Recency'], 
-        bins=[-1, 90, 180, 365, 730, np.inf],
-        labels=[5, 4, 3, 2, 1]
-    ).astype(int)
-    
-    rfm_data['F_Score'] = pd.cut(
-        rfm_data['Frequency'],
-        bins=[0, 1, 4, 9, 19, np.inf],
-        labels=[1, 2, 3, 4, 5]
-    ).astype(int)
-    
-    rfm_data['M_Score'] = pd.cut(
-        rfm_data['Monetary'],
-        bins=[0, 499, 1999, 4999, 9999, np.inf],
-        labels=[1, 2, 3, 4, 5]
-    ).astype(int)
-    
-    rfm_data['RFM_Score'] = rfm_data['R_Score'] + rfm_data['F_Score'] + rfm_data['M_Score']
-
-    segment_customer = lambda row: (
-        'Champions' if row['RFM_Score'] >= 13
-        else 'Loyal Customers' if row['RFM_Score'] >= 10 and row['R_Score'] >= 4
-        else 'Big Spenders' if row['RFM_Score'] >= 10
-        else 'Frequent Buyers' if row['F_Score'] >= 4
-        else 'Recent Customers' if row['R_Score'] >= 4
-        else 'Potential Loyalists' if row['RFM_Score'] >= 7
-        else 'At Risk' if row['R_Score'] <= 2
-        else 'Needs Attention'
-    )
-    
-    rfm_data['Customer_Segment'] = rfm_data.apply(segment_customer, axis=1)
 
-    print("===== RFM Customer Analysis ======")
+    report = as_report(summary_file)
+    report.text("===== Profitability Analysis By Region, Category & Sub-Category =====\n")
+    report.text("\nTop 10 Most Profitable Product Lines:\n")
+    report.table('top_profit_lines', profit_analysis.head(10))
+    report.text("\n\nBottom 10 Least Profitable Product Lines:\n")
+    report.table('bottom_profit_lines', profit_analysis.tail(10))
+    report.text("\n\nPerformance Tier Summary:\n")
+    report.table('performance_tiers', tier_summary, index=True)
+    report.text("\n")
+
+@profiled('RFM_Analysis', 'analysis')
+def RFM_Analysis(df, summary_file, score_bins=None, segment_rules=None, reference_date=None):
+    # Calculate RFM metrics for each customer; recency defaults to the day after the last order
+    if reference_date is None:
+        reference_date = df['Order Date'].max() + pd.Timedelta(days=1)
+    reference_date = pd.Timestamp(reference_date)
+    customer_metrics = aggregate(df, RFM_GROUPS, RFM_METRICS, reference_date=reference_date)
+    report_rfm(customer_metrics, summary_file, score_bins, segment_rules)
+
+def report_rfm(customer_metrics, summary_file, score_bins=None, segment_rules=None):
+    # Score, segment and report per-customer RFM metrics
+    rfm_data = segment_rfm(customer_metrics.reset_index(), score_bins, segment_rules)
 
     segment_summary = (rfm_data
         .groupby('Customer_Segment')
@@ -99,26 +75,28 @@ def RFM_Analysis(df, summary_file):
                             'Total_Profit', 'Avg_Profit', 'Avg_Frequency', 'Avg_Recency']
     segment_summary = segment_summary.sort_values('Total_Revenue', ascending=False)
 
-    print(f"\nCustomer Segment Summary:\n{segment_summary}")
-    summary_file.write(f"\nCustomer Segment Summary:\n{segment_summary.to_string()}\n")
-
-    print("\n\nTop 10 Most Valuable Customers:")
     top_customers = rfm_data.nlargest(10, 'Monetary')[
         ['Customer Name', 'Segment', 'Customer_Segment', 'Monetary', 'Total_Profit', 
         'Frequency', 'Recency', 'RFM_Score']
     ]
-    print(top_customers.to_string(index=False))
-    summary_file.write("\n\nTop 10 Most Valuable Customers:\n")
-    summary_file.write(top_customers.to_string(index=False))
 
+    report = as_report(summary_file)
+    report.text("\n===== RFM Customer Analysis ======\n")
+    report.text("\nCustomer Segment Summary:\n")
+    report.table('customer_segments', segment_summary, index=True)
+    report.text("\n\n\nTop 10 Most Valuable Customers:\n")
+    report.table('top_customers', top_customers)
+
+@profiled('product_analysis', 'analysis')
 def product_analysis(df, summary_file):
     # Calculate total sales for revenue share calculation
     total_sales = df['Sales'].sum()
     
+    report_products(aggregate(df, PRODUCT_GROUPS, PRODUCT_METRICS, totals={'Sales': total_sales}), summary_file)
+
+def report_products(product_metrics, summary_file):
     # Analyze product performance and classify using BCG matrix
-    product_analysis = (df
-        .groupby(['Category', 'Sub-Category'])
-        .apply(calculate_product_metrics, total_sales=total_sales, include_groups=False)
+    product_analysis = (product_metrics
         .reset_index()
         .sort_values('Revenue', ascending=False)
     )
@@ -133,36 +111,61 @@ def product_analysis(df, summary_file):
     ]
     choices = ['Star', 'Question Mark', 'Cash Cow']
     product_analysis['BCG_Category'] = np.select(conditions, choices, default='Dog')
-    print("\n===== Product Analysis =====")
-    print("\nTop 10 Categories by Revenue:")
-    print(product_analysis.head(10).to_string(index=False))
-    
-    summary_file.write("\n===== Product Analysis =====\n")
-    summary_file.write("\nTop 10 Categories by Revenue:\n")
-    summary_file.write(product_analysis.head(10).to_string(index=False))
-    
     bcg_summary = (product_analysis
         .groupby('BCG_Category')
         .agg({'Revenue': 'sum', 'Profit': 'sum', 'Sub-Category': 'count', 'Profit_Margin': 'mean'})
         .rename(columns={'Sub-Category': 'Product_Count'})
         .round(2)
     )
-    print(f"\n\nBCG Matrix Classification:")
-    print(bcg_summary)
-    summary_file.write(f"\n\nBCG Matrix Classification:\n{bcg_summary.to_string()}\n")
-    print("\n\nProduct Concentration:")
+
+    # Cumulative sums give every "top n" figure from one pass over the sorted table
     total_profit = product_analysis['Profit'].sum()
-    
-    list(map(
-        lambda n: print(f"Top {n} products: "
-                       f"{product_analysis.head(n)['Revenue_Share'].sum():.2f}% revenue, "
-                       f"{product_analysis.head(n)['Profit'].sum() / total_profit * 100:.2f}% profit"),
-        [3, 5, 10]
-    ))
-    summary_file.write("\n\nProduct Concentration:\n")
-    list(map(
-        lambda n: summary_file.write(f"Top {n} products: "
-                       f"{product_analysis.head(n)['Revenue_Share'].sum():.2f}% revenue, "
-                       f"{product_analysis.head(n)['Profit'].sum() / total_profit * 100:.2f}% profit\n"),
-        [3, 5, 10]
-    ))
\ No newline at end of file
+    positions = [min(n, len(product_analysis)) for n in CONCENTRATION_SIZES]
+    cumulative_share = np.concatenate([[0.0], product_analysis['Revenue_Share'].cumsum().to_numpy()])
+    cumulative_profit = np.concatenate([[0.0], product_analysis['Profit'].cumsum().to_numpy()])
+    with np.errstate(divide='ignore', invalid='ignore'):  # NaN when there are no products
+        concentration = pd.DataFrame({
+            'Top_N': CONCENTRATION_SIZES,
+            'Revenue_Pct': cumulative_share[positions],
+            'Profit_Pct': cumulative_profit[positions] / total_profit * 100,
+        })
+
+    report = as_report(summary_file)
+    report.text("\n===== Product Analysis =====\n")
+    report.text("\nTop 10 Categories by Revenue:\n")
+    report.table('top_products', product_analysis.head(10))
+    report.text("\n\nBCG Matrix Classification:\n")
+    report.table('bcg_matrix', bcg_summary, index=True)
+    report.text("\n\n\nProduct Concentration:\n")
+    report.table('product_concentration', concentration, formatter=format_concentration)
+
+
+def format_concentration(concentration):
+    return ''.join(
+        f"Top {row.Top_N} products: {row.Revenue_Pct:.2f}% revenue, {row.Profit_Pct:.2f}% profit\n"
+        for row in concentration.itertuples()
+    )
+
+
+# name -> analysis(df, summary_file); registration order is the report order
+ANALYSES = {
+    'profitability': profitability_metrics,
+    'rfm': RFM_Analysis,
+    'product': product_analysis,
+}
+
+# name -> columns of the preprocessed frame the analysis reads (None means all of them)
+ANALYSIS_COLUMNS = {
+    'profitability': PROFITABILITY_GROUPS + spec_columns(PROFITABILITY_METRICS),
+    'rfm': RFM_GROUPS + spec_columns(RFM_METRICS),
+    'product': PRODUCT_GROUPS + spec_columns(PRODUCT_METRICS),
+}
+
+
+def register_analysis(name, columns=None):
+    # Decorator for analyses; keep them module-level so process pools can pickle them by reference
+    def register(func):
+        ANALYSES[name] = func
+        ANALYSIS_COLUMNS[name] = None if columns is None else list(columns)
+        return func
+    return register
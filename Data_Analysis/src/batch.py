@@ -0,0 +1,203 @@
+"""Batch mode: run the analysis suite over many store extracts in a bounded process pool."""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from .analysis import ANALYSES, report_profitability, report_rfm, report_products
+from .preprocessing_pipeline import run_preprocessing
+from .report import Report, TextSink
+from .streaming import chunk_state, merge_states, finalize_state, streamed_analyses
+
+try:
+    import resource
+except ImportError:  # Windows: no per-process limits
+    resource = None
+
+DEFAULT_RETRIES = 1
+# Failures worth another attempt: a killed worker, memory pressure, I/O hiccups.
+# Bad input (ValueError, KeyError, parser errors...) fails the same way every time.
+TRANSIENT_ERRORS = (BrokenProcessPool, MemoryError, OSError)
+PERMANENT_OS_ERRORS = (FileNotFoundError, IsADirectoryError, NotADirectoryError, PermissionError)
+# Output files run_batch writes itself; an input with one of these stems is renamed
+RESERVED_NAMES = {'rollup', 'batch_report'}
+
+
+def discover_inputs(source):
+    """
+    CSV files to process: every *.csv in a directory, or the entries of a manifest
+    (one path per line, or a JSON list / {"inputs": [...]}) resolved relative to it.
+    """
+    if os.path.isdir(source):
+        return sorted(os.path.join(source, name) for name in os.listdir(source) if name.lower().endswith('.csv'))
+    with open(source) as manifest_file:
+        text = manifest_file.read()
+    if source.endswith('.json'):
+        entries = json.loads(text)
+        entries = entries['inputs'] if isinstance(entries, dict) else entries
+    else:
+        entries = [line.strip() for line in text.splitlines() if line.strip() and not line.startswith('#')]
+    base = os.path.dirname(os.path.abspath(source))
+    return [entry if os.path.isabs(entry) else os.path.join(base, entry) for entry in entries]
+
+
+def output_name(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def output_names(inputs):
+    """
+    Summary file stem per input: the file's own stem, unless another input shares it
+    (compared case-insensitively) or it is reserved, in which case a short hash of the
+    absolute path is appended so every input gets its own summary.
+    """
+    stems = {path: output_name(path) for path in inputs}
+    counts = Counter(stem.lower() for stem in stems.values())
+    names = {}
+    for path, stem in stems.items():
+        if counts[stem.lower()] > 1 or stem.lower() in RESERVED_NAMES:
+            path_hash = hashlib.blake2b(os.path.abspath(path).encode(), digest_size=4).hexdigest()
+            stem = f"{stem}-{path_hash}"
+        names[path] = stem
+    return names
+
+
+def is_transient(error):
+    return isinstance(error, TRANSIENT_ERRORS) and not isinstance(error, PERMANENT_OS_ERRORS)
+
+
+def _limit_memory(limit_bytes):
+    # Worker initializer: cap the virtual address space (RLIMIT_AS, not RSS) so a runaway
+    # input fails with MemoryError instead of pushing the whole host into swap. numpy and
+    # pyarrow reserve address space well beyond what they touch, so the cap must leave
+    # generous headroom over the expected resident size
+    if resource is not None and limit_bytes:
+        resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+
+
+def _worker_peak_rss_mb():
+    # High-water mark of the worker process so far, not of this input alone: a reused
+    # worker reports the largest input it has run (per input with max_tasks_per_child=1).
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _run_input(path, name, output_dir, analyses, approximate_error=None):
+    # Worker entry point: full suite for one input, its summary file, and a mergeable state.
+    # analyses are the functions themselves, so runtime registrations reach spawned workers
+    start = time.perf_counter()
+    summary_path = os.path.join(output_dir, f"{name}.txt")
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = run_preprocessing(source_path=path)
+        with open(summary_path, 'w') as summary_file, Report([TextSink(summary_file)]) as report:
+            for analysis in analyses:
+                analysis(df, report)
+        state = chunk_state(df, streamed_analyses(approximate_error))
+    return state, {
+        'rows': len(df),
+        'seconds': round(time.perf_counter() - start, 3),
+        'worker_pid': os.getpid(),
+        'worker_peak_rss_mb': _worker_peak_rss_mb(),
+        'summary': summary_path,
+    }
+
+
+def run_batch(inputs, output_dir, max_workers=None, worker_memory_mb=None, retries=DEFAULT_RETRIES,
+              max_tasks_per_child=None, mp_context=None, approximate_error=None):
+    """
+    Process every input once (retrying transient failures up to `retries` times), write one summary per
+    input (named by output_names) plus a combined rollup.txt, and return the batch report also
+    saved as batch_report.json.
+    approximate_error keeps the rollup's distinct counts as HyperLogLog sketches.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+    attempts = {path: 0 for path in inputs}
+    results, errors, state = {}, {}, None
+    pending = list(dict.fromkeys(inputs))
+    names = output_names(pending)
+    analyses = list(ANALYSES.values())
+    limit = worker_memory_mb * 1024 * 1024 if worker_memory_mb else None
+    pool_options = {'max_workers': max_workers, 'mp_context': mp_context,
+                    'initializer': _limit_memory, 'initargs': (limit,)}
+    if max_tasks_per_child:
+        pool_options['max_tasks_per_child'] = max_tasks_per_child
+
+    # Each round is (inputs, isolated). A worker killed mid-task breaks its pool for every
+    # outstanding future, so a shared-pool BrokenProcessPool is charged to no one: those
+    # inputs rerun one per pool, where a crash can only be the input's own
+    rounds = [(pending, False)]
+    while rounds:
+        paths, isolated = rounds.pop(0)
+        retry, suspects = [], []
+        options = dict(pool_options, max_workers=1) if isolated else pool_options
+        with ProcessPoolExecutor(**options) as pool:
+            futures = {pool.submit(_run_input, path, names[path], output_dir, analyses, approximate_error): path
+                       for path in paths}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    input_state, result = future.result()
+                except BrokenProcessPool:
+                    if not isolated:
+                        suspects.append(path)
+                        continue
+                    attempts[path] += 1
+                    errors[path] = "BrokenProcessPool: worker process died while running this input"
+                    if attempts[path] <= retries:
+                        retry.append(path)
+                    continue
+                except Exception as error:
+                    attempts[path] += 1
+                    errors[path] = f"{type(error).__name__}: {error}"
+                    if is_transient(error) and attempts[path] <= retries:
+                        retry.append(path)
+                    continue
+                attempts[path] += 1
+                results[path] = result
+                errors.pop(path, None)
+                state = merge_states(state, input_state)
+                print(f"[batch] {names[path]}: {results[path]['rows']:,} rows in {results[path]['seconds']}s")
+        rounds += [([path], True) for path in suspects]
+        if retry:
+            rounds.append((retry, False))
+
+    if state is not None:
+        with open(os.path.join(output_dir, 'rollup.txt'), 'w') as rollup_file, \
+                Report([TextSink(rollup_file)]) as report:
+            report.text(f"Combined rollup of {len(results)} inputs, {state['rows']:,} records\n\n")
+            tables = finalize_state(state, streamed_analyses(approximate_error))
+            report_profitability(tables['profitability'], report)
+            report_rfm(tables['rfm'], report)
+            report_products(tables['product'], report)
+
+    elapsed = time.perf_counter() - start
+    rows = sum(result['rows'] for result in results.values())
+    batch_report = {
+        'inputs': len(attempts),
+        'succeeded': len(results),
+        'failed': len(errors),
+        'retries': sum(attempts.values()) - len(attempts),
+        'rows': rows,
+        'seconds': round(elapsed, 3),
+        'rows_per_second': round(rows / elapsed, 1) if elapsed else None,
+        'inputs_per_second': round(len(results) / elapsed, 3) if elapsed else None,
+        'results': {path: dict(result, attempts=attempts[path]) for path, result in results.items()},
+        'failures': {path: {'error': error, 'attempts': attempts[path]} for path, error in errors.items()},
+    }
+    with open(os.path.join(output_dir, 'batch_report.json'), 'w') as report_file:
+        json.dump(batch_report, report_file, indent=2)
+    print(f"\nBatch: {batch_report['succeeded']}/{batch_report['inputs']} inputs, "
+          f"{rows:,} rows in {batch_report['seconds']}s ({batch_report['rows_per_second']:,} rows/s), "
+          f"{batch_report['failed']} failed, {batch_report['retries']} retries")
+    return batch_report
@@ -0,0 +1,85 @@
+"""On-disk columnar cache of the preprocessed frame, keyed by source fingerprint."""
+
+import hashlib
+import os
+import re
+import time
+import pandas as pd
+
+from .derivations import DERIVED_COLUMNS
+
+# Bump whenever parse/derivation logic changes output for the same source file
+PIPELINE_VERSION = 2
+SAMPLE_BYTES = 64 * 1024
+
+
+def parquet_available():
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def source_fingerprint(source_path):
+    """
+    Cheap fingerprint: file size, mtime, the first and last 64KB and the pipeline version.
+    Not a content hash: an edit in the middle of the file that keeps both its size and its
+    mtime (e.g. a copy with preserved timestamps) is not detected. Delete the cache or run
+    with --no-cache after such an edit.
+    """
+    stat = os.stat(source_path)
+    digest = hashlib.blake2b(digest_size=12)
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}:v{PIPELINE_VERSION}".encode())
+    digest.update(",".join(sorted(DERIVED_COLUMNS)).encode())
+    with open(source_path, 'rb') as source:
+        digest.update(source.read(SAMPLE_BYTES))
+        if stat.st_size > SAMPLE_BYTES:
+            source.seek(max(stat.st_size - SAMPLE_BYTES, SAMPLE_BYTES))
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+def _cache_prefix(source_path):
+    # Readable stem plus a hash of the absolute path: same-named files in different
+    # directories get separate entries and never evict each other
+    stem = os.path.splitext(os.path.basename(source_path))[0].replace(' ', '_')
+    path_hash = hashlib.blake2b(os.path.abspath(source_path).encode(), digest_size=4).hexdigest()
+    return f"{stem}-{path_hash}"
+
+
+def cache_path(source_path, cache_dir, fingerprint=None):
+    fingerprint = fingerprint or source_fingerprint(source_path)
+    return os.path.join(cache_dir, f"{_cache_prefix(source_path)}-{fingerprint}.parquet")
+
+
+def load_cached(source_path, cache_dir, columns=None, fingerprint=None):
+    """Return the cached preprocessed frame for source_path, or None on a miss."""
+    if not parquet_available():
+        print("Cache disabled: pyarrow is not installed")
+        return None
+    path = cache_path(source_path, cache_dir, fingerprint)
+    if not os.path.exists(path):
+        print(f"Cache miss: {os.path.basename(path)}")
+        return None
+    start = time.perf_counter()
+    df = pd.read_parquet(path, columns=columns)
+    print(f"Cache hit: loaded {len(df):,} rows x {df.shape[1]} columns in {time.perf_counter() - start:.3f}s")
+    return df
+
+
+def store_cached(df, source_path, cache_dir, fingerprint=None):
+    """Persist the preprocessed frame, replacing stale entries for the same source."""
+    if not parquet_available():
+        return None
+    os.makedirs(cache_dir, exist_ok=True)
+    path = cache_path(source_path, cache_dir, fingerprint)
+    stale = re.compile(re.escape(_cache_prefix(source_path)) + r'-[0-9a-f]{24}\.parquet$')
+    for name in os.listdir(cache_dir):
+        if stale.match(name):
+            os.remove(os.path.join(cache_dir, name))
+    # Write to a temporary file first so readers never see a partial cache entry
+    tmp_path = path + '.tmp'
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    return path
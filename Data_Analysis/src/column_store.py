@@ -0,0 +1,254 @@
+"""
+Out-of-core columnar store: one memory-mapped raw column file per column, strings dictionary-encoded,
+dates as datetime64. Analyses read fixed-size row blocks of only the columns they need, and
+read-only mappings share the OS page cache across every process reading the same store.
+"""
+
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from .analysis import report_profitability, report_rfm, report_products
+from .metrics import spec_columns
+from .streaming import chunk_state, merge_states, finalize_state, streamed_analyses
+
+STORE_VERSION = 2
+META_FILE = 'meta.json'
+DEFAULT_BLOCK_ROWS = 1_000_000
+COPY_BLOCK_ROWS = 1_000_000
+
+
+def _codes_dtype(categories):
+    for dtype in (np.int8, np.int16, np.int32):
+        if len(categories) < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _map_file(path, dtype, rows, mode='r'):
+    if rows == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode, shape=(rows,))
+
+
+def _rewrite(path, dtype, rows, new_dtype, transform=None):
+    # Stream a column file into a new dtype (and optionally remap values), block by block
+    source = _map_file(path, dtype, rows)
+    with open(f"{path}.new", 'wb') as target:
+        for start in range(0, rows, COPY_BLOCK_ROWS):
+            block = np.asarray(source[start:start + COPY_BLOCK_ROWS])
+            if transform is not None:
+                block = transform(block)
+            target.write(block.astype(new_dtype, copy=False).tobytes())
+    del source
+    os.replace(f"{path}.new", path)
+
+
+class _ColumnWriter:
+    """Appends one column's chunks to a raw file; dictionary columns grow their category list."""
+
+    def __init__(self, path, series):
+        self.path = path
+        self.rows = 0
+        self.dtype = None
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            self.kind = 'datetime'
+        elif isinstance(series.dtype, pd.CategoricalDtype) or not pd.api.types.is_numeric_dtype(series.dtype):
+            self.kind = 'dictionary'
+            # Declared categories keep their order; inferred ones are sorted when the store is finished
+            self.declared = isinstance(series.dtype, pd.CategoricalDtype)
+            self.ordered = bool(series.cat.ordered) if self.declared else False
+            self.codes = {}
+            self.dtype = np.dtype(np.int64)
+        else:
+            self.kind = 'numeric'
+        self.file = open(path, 'wb')
+
+    def append(self, series):
+        if self.kind == 'datetime':
+            values = series.to_numpy(dtype='datetime64[ns]')
+            self.dtype = values.dtype
+        elif self.kind == 'dictionary':
+            values = self._encode(series)
+        else:
+            values = series.to_numpy()
+            if self.dtype is None:
+                self.dtype = values.dtype
+            elif values.dtype != self.dtype:
+                # e.g. an int column whose later chunk has NaN: widen what was written so far
+                widened = np.result_type(self.dtype, values.dtype)
+                if widened != self.dtype:
+                    self.file.close()
+                    _rewrite(self.path, self.dtype, self.rows, widened)
+                    self.file = open(self.path, 'ab')
+                    self.dtype = widened
+                values = values.astype(self.dtype)
+        self.file.write(np.ascontiguousarray(values).tobytes())
+        self.rows += len(values)
+
+    def _encode(self, series):
+        categorical = series if isinstance(series.dtype, pd.CategoricalDtype) else series.astype('category')
+        lookup = np.array([self.codes.setdefault(value, len(self.codes)) for value in categorical.cat.categories],
+                          dtype=np.int64)
+        codes = categorical.cat.codes.to_numpy()
+        if not len(lookup):
+            return np.full(len(codes), -1, dtype=np.int64)
+        return np.where(codes >= 0, lookup[np.maximum(codes, 0)], -1)
+
+    def finish(self):
+        self.file.close()
+        entry = {'kind': self.kind}
+        if self.kind == 'dictionary':
+            categories = pd.Index(list(self.codes))
+            remap = np.arange(len(categories), dtype=np.int64)
+            if not self.declared and len(categories):
+                order = categories.argsort()
+                remap[order] = np.arange(len(categories))
+                categories = categories[order]
+            codes_dtype = _codes_dtype(categories)
+            # Append-time codes are int64 in first-seen order; shrink and sort them in one pass
+            _rewrite(self.path, self.dtype, self.rows, codes_dtype,
+                     lambda block: np.where(block >= 0, remap[np.maximum(block, 0)], -1))
+            self.dtype = np.dtype(codes_dtype)
+            entry.update(categories=categories.tolist(), ordered=self.ordered)
+        entry['dtype'] = np.dtype(self.dtype if self.dtype is not None else np.float64).str
+        return entry
+
+
+def build_column_store(data, directory, fingerprint=None):
+    """
+    Write a column store in `directory` from a DataFrame or an iterable of DataFrame chunks
+    (e.g. iter_chunks), appending each chunk to per-column files so the data never has to fit
+    in memory. Any previous store is replaced only once the new one is complete.
+    `fingerprint` (e.g. the source file's) is kept to detect staleness.
+    """
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    staging = f"{directory}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    writers = {}
+    rows = 0
+    try:
+        for chunk in chunks:
+            if not writers:
+                writers = {name: _ColumnWriter(os.path.join(staging, f"{position:03d}.bin"), series)
+                           for position, (name, series) in enumerate(chunk.items())}
+            for name, writer in writers.items():
+                writer.append(chunk[name])
+            rows += len(chunk)
+        columns = {}
+        for name, writer in writers.items():
+            columns[name] = {'file': os.path.basename(writer.path), **writer.finish()}
+    except BaseException:
+        for writer in writers.values():
+            writer.file.close()
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    meta = {'version': STORE_VERSION, 'rows': rows, 'fingerprint': fingerprint, 'columns': columns}
+    with open(os.path.join(staging, META_FILE), 'w') as meta_file:
+        json.dump(meta, meta_file, default=str)
+
+    # Directories cannot be renamed over non-empty ones, so move the old store aside first
+    previous = f"{directory}.old"
+    shutil.rmtree(previous, ignore_errors=True)
+    if os.path.exists(directory):
+        os.replace(directory, previous)
+    os.replace(staging, directory)
+    shutil.rmtree(previous, ignore_errors=True)
+    print(f"Column store written to {directory}: {rows:,} rows, {len(columns)} columns")
+    return ColumnStore(directory)
+
+
+def store_fingerprint(directory):
+    try:
+        with open(os.path.join(directory, META_FILE)) as meta_file:
+            meta = json.load(meta_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    return meta['fingerprint'] if meta.get('version') == STORE_VERSION else None
+
+
+class ColumnStore:
+    """Read side of a column store; columns are mapped lazily and never copied whole."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, META_FILE)) as meta_file:
+            self.meta = json.load(meta_file)
+        if self.meta.get('version') != STORE_VERSION:
+            raise ValueError(f"Unsupported column store version in {directory}")
+        self.rows = self.meta['rows']
+        self._arrays = {}
+        self._dtypes = {}
+
+    @property
+    def columns(self):
+        return list(self.meta['columns'])
+
+    def array(self, name):
+        # Raw mapped values (codes for dictionary columns)
+        if name not in self._arrays:
+            entry = self.meta['columns'][name]
+            self._arrays[name] = _map_file(os.path.join(self.directory, entry['file']), np.dtype(entry['dtype']), self.rows)
+        return self._arrays[name]
+
+    def categories(self, name):
+        if name not in self._dtypes:
+            entry = self.meta['columns'][name]
+            self._dtypes[name] = pd.CategoricalDtype(entry['categories'], ordered=entry['ordered'])
+        return self._dtypes[name]
+
+    def column(self, name, start=0, stop=None):
+        stop = self.rows if stop is None else min(stop, self.rows)
+        # A plain ndarray view over the mapping; pandas does not expect the memmap subclass
+        values = np.asarray(self.array(name)[start:stop])
+        index = pd.RangeIndex(start, stop)
+        if self.meta['columns'][name]['kind'] == 'dictionary':
+            return pd.Series(pd.Categorical.from_codes(values, dtype=self.categories(name), validate=False),
+                             index=index, name=name)
+        return pd.Series(values, index=index, name=name, copy=False)
+
+    def frame(self, columns, start=0, stop=None):
+        missing = [name for name in columns if name not in self.meta['columns']]
+        if missing:
+            raise KeyError(f"Columns not in column store {self.directory}: {missing}")
+        return pd.DataFrame({name: self.column(name, start, stop) for name in columns}, copy=False)
+
+    def blocks(self, columns, block_rows=DEFAULT_BLOCK_ROWS):
+        for start in range(0, self.rows, block_rows):
+            yield self.frame(columns, start, start + block_rows)
+
+
+def analysis_columns(analyses):
+    # Group keys and measures of every streamed analysis, plus the chunk-state columns
+    columns = ['Sales', 'Order Date']
+    for by, spec in analyses.values():
+        columns += [column for column in by + spec_columns(spec) if column not in columns]
+    return columns
+
+
+def column_store_state(store, block_rows=DEFAULT_BLOCK_ROWS, analyses=None):
+    # Fold per-block partial aggregates; memory is bounded by block size and group count
+    analyses = streamed_analyses() if analyses is None else analyses
+    state = None
+    for block in store.blocks(analysis_columns(analyses), block_rows):
+        state = merge_states(state, chunk_state(block, analyses))
+    if state is None:
+        raise ValueError(f"Column store {store.directory} has no rows")
+    return state
+
+
+def run_column_store_analysis(directory, summary_file, block_rows=DEFAULT_BLOCK_ROWS, approximate_error=None):
+    store = ColumnStore(directory)
+    analyses = streamed_analyses(approximate_error)
+    state = column_store_state(store, block_rows, analyses)
+    print(f"Analyzed {state['rows']:,} records from {directory} in blocks of {block_rows:,}")
+
+    tables = finalize_state(state, analyses)
+    report_profitability(tables['profitability'], summary_file)
+    report_rfm(tables['rfm'], summary_file)
+    report_products(tables['product'], summary_file)
+    return tables
@@ -0,0 +1,108 @@
+"""Pre-aggregated Region x Category x Sub-Category x Segment x time cube with a query API."""
+
+import os
+import numpy as np
+import pandas as pd
+
+from .metrics import aggregate, sum_of, count
+from .derivations import QUARTER_LABELS
+
+CUBE_DIMENSIONS = ['Region', 'Category', 'Sub-Category', 'Segment', 'Order Year', 'Order Quarter', 'Order Month']
+CUBE_MEASURES = {
+    'Sales': sum_of('Sales'),
+    'Profit': sum_of('Profit'),
+    'Quantity': sum_of('Quantity'),
+    'Discount_Sum': sum_of('Discount'),
+    'Orders': count(),
+}
+# Time grain -> columns identifying one period
+PERIODS = {
+    'year': ['Order Year'],
+    'quarter': ['Order Year', 'Order Quarter'],
+    'month': ['Order Year', 'Order Month'],
+}
+# Time grain -> sub-periods per year, to number periods consecutively
+PERIODS_PER_YEAR = {'year': 1, 'quarter': 4, 'month': 12}
+
+
+class TimeCube:
+    """
+    Additive measures (sums and counts) at the finest dimension grain.
+    Every roll-up, slice or period comparison re-aggregates cube cells, not raw orders.
+    """
+
+    def __init__(self, cells):
+        self.cells = cells
+
+    @classmethod
+    def build(cls, df):
+        cells = aggregate(df, CUBE_DIMENSIONS, CUBE_MEASURES).reset_index()
+        return cls(cells)
+
+    @classmethod
+    def load(cls, path):
+        return cls(pd.read_parquet(path))
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = path + '.tmp'
+        self.cells.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        return path
+
+    def slice(self, where):
+        """Cube restricted to cells matching `where` ({dimension: value or list of values})."""
+        return TimeCube(self.cells[self._mask(where)])
+
+    def rollup(self, by=(), where=None):
+        """Totals by the given dimensions, with margin and average discount derived from sums."""
+        by = [by] if isinstance(by, str) else list(by)
+        cells = self.cells[self._mask(where)] if where else self.cells
+        measures = list(CUBE_MEASURES)
+        if by:
+            result = cells.groupby(by, sort=True, observed=True)[measures].sum()
+        else:
+            result = cells[measures].sum().to_frame().T
+        return _with_ratios(result)
+
+    def period_over_period(self, by=(), period='year', measure='Sales', where=None):
+        """Each period's measure next to the previous period's, with absolute and % change."""
+        by = [by] if isinstance(by, str) else list(by)
+        keys = by + PERIODS[period]
+        totals = self.rollup(keys, where)[[measure]].reset_index().sort_values(keys)
+        # Match on the period just before, not the previous row: a slice with no cells in
+        # some period must compare against nothing rather than an older period
+        ordinal = _period_ordinal(totals, period)
+        prior = totals[by + [measure]].assign(_ordinal=ordinal + 1).rename(columns={measure: 'Previous'})
+        matched = totals[by].assign(_ordinal=ordinal).merge(prior, on=by + ['_ordinal'], how='left')
+        previous = pd.Series(matched['Previous'].to_numpy(), index=totals.index)
+        totals['Previous'] = previous
+        totals['Change'] = totals[measure] - previous
+        with np.errstate(divide='ignore', invalid='ignore'):
+            totals['Change_Pct'] = totals['Change'] / previous.abs() * 100
+        return totals.reset_index(drop=True)
+
+    def _mask(self, where):
+        mask = np.ones(len(self.cells), dtype=bool)
+        for column, value in where.items():
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            mask &= self.cells[column].isin(values).to_numpy()
+        return mask
+
+
+def _period_ordinal(totals, period):
+    ordinal = totals['Order Year'].astype('int64') * PERIODS_PER_YEAR[period]
+    if period == 'quarter':
+        # Quarters are labels (Q1..Q4); their position in QUARTER_LABELS is the offset
+        labels = pd.Categorical(totals['Order Quarter'].astype(str), categories=QUARTER_LABELS)
+        ordinal += labels.codes
+    elif period == 'month':
+        ordinal += totals['Order Month'].astype('int64') - 1
+    return ordinal
+
+
+def _with_ratios(totals):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        totals['Profit_Margin'] = (totals['Profit'] / totals['Sales'] * 100).where(totals['Sales'] > 0, 0.0)
+        totals['Avg_Discount'] = totals['Discount_Sum'] / totals['Orders']
+    return totals
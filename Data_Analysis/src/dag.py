@@ -0,0 +1,129 @@
+"""Lazy, dependency-aware preprocessing: compute only the steps requested columns need."""
+
+from functools import partial
+
+from .analysis import ANALYSES, ANALYSIS_COLUMNS
+from .derivations import DERIVED_COLUMNS, apply_derivations
+from .preprocessing_pipeline import parse_date_column, DATE_COLUMNS
+from .schema import compact_dtypes
+
+# Extra steps registered by callers: name -> (func, inputs, outputs)
+PREPROCESSING_STEPS = {}
+
+
+def preprocessing_step(name, inputs, outputs):
+    # Decorator to register a step that reads `inputs` and writes `outputs` in place
+    def register(func):
+        PREPROCESSING_STEPS[name] = (func, tuple(inputs), tuple(outputs))
+        return func
+    return register
+
+
+def build_steps():
+    # Date parsing and every registered derived column become graph nodes
+    steps = {
+        f"parse {column}": (partial(parse_date_column, column=column), (column,), (column,))
+        for column in DATE_COLUMNS
+    }
+    for name, (_, inputs) in DERIVED_COLUMNS.items():
+        steps[f"derive {name}"] = (partial(apply_derivations, names=[name]), inputs, (name,))
+    steps.update(PREPROCESSING_STEPS)
+    return steps
+
+
+class PreprocessingDAG:
+    """
+    Wraps a raw frame and materializes preprocessed columns on demand.
+    Each step runs at most once; results are shared by every later request.
+    """
+
+    def __init__(self, df, compact=True):
+        self.df = df
+        self.compact = compact
+        self.steps = build_steps()
+        self.producers = {column: name for name, (_, _, outputs) in self.steps.items() for column in outputs}
+        self.completed = []
+        self.compacted = set()
+
+    def plan(self, columns):
+        """Steps (in dependency order) still needed to produce `columns`."""
+        order, visiting = [], set()
+
+        def visit(name):
+            if name in self.completed or name in order:
+                return
+            if name in visiting:
+                raise ValueError(f"Preprocessing steps form a cycle at '{name}'")
+            visiting.add(name)
+            _, inputs, _ = self.steps[name]
+            for column in inputs:
+                producer = self.producers.get(column)
+                if producer is not None and producer != name:
+                    visit(producer)
+            visiting.discard(name)
+            order.append(name)
+
+        for column in columns:
+            if column in self.producers:
+                visit(self.producers[column])
+            elif column not in self.df.columns:
+                raise KeyError(f"Column '{column}' is neither in the data nor produced by a step")
+        return order
+
+    def require(self, columns=None):
+        """Return a frame with the requested columns, running only the missing steps."""
+        if columns is None:
+            columns = list(self.df.columns) + [c for c in self.producers if c not in self.df.columns]
+        columns = list(columns)
+        for name in self.plan(columns):
+            func, _, _ = self.steps[name]
+            self.df = func(self.df)
+            self.completed.append(name)
+        if self.compact:
+            pending = [column for column in columns if column not in self.compacted]
+            if pending:
+                compacted = compact_dtypes(self.df[pending].copy(), report=False)
+                for column in pending:
+                    self.df[column] = compacted[column]
+                self.compacted.update(pending)
+        return self.df[columns]
+
+
+def source_columns(columns, steps=None):
+    """Raw input columns needed to produce `columns`, for projecting the CSV read."""
+    steps = build_steps() if steps is None else steps
+    producers = {column: name for name, (_, _, outputs) in steps.items() for column in outputs}
+    needed, seen = [], set()
+
+    def visit(column):
+        if column in seen:
+            return
+        seen.add(column)
+        producer = producers.get(column)
+        inputs = () if producer is None else steps[producer][1]
+        # Columns no step produces, or that a step rewrites in place (date parsing), are read from the file
+        if producer is None or column in inputs:
+            needed.append(column)
+        for source in inputs:
+            visit(source)
+
+    for column in columns:
+        visit(column)
+    return needed
+
+
+def analysis_source_columns(names=None):
+    """Raw columns the named analyses need, or None if any of them reads the whole frame."""
+    names = list(ANALYSES) if names is None else names
+    if any(ANALYSIS_COLUMNS.get(name) is None for name in names):
+        return None
+    return source_columns([column for name in names for column in ANALYSIS_COLUMNS[name]])
+
+
+def run_analyses_lazily(df, summary_file, names=None):
+    """Run analyses, preprocessing only the columns each one declares it needs."""
+    dag = PreprocessingDAG(df)
+    for name in (list(ANALYSES) if names is None else names):
+        ANALYSES[name](dag.require(ANALYSIS_COLUMNS.get(name)), summary_file)
+    print(f"\nPreprocessing steps run: {dag.completed}")
+    return dag
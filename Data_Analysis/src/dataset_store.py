@@ -0,0 +1,135 @@
+"""Local dataset store with content checksums, local sources and an offline mode."""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+
+MANIFEST_NAME = 'manifest.json'
+HASH_BLOCK = 1 << 20
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as data:
+        for block in iter(lambda: data.read(HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _manifest_path(data_dir):
+    return os.path.join(data_dir, MANIFEST_NAME)
+
+
+def load_manifest(data_dir):
+    path = _manifest_path(data_dir)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as manifest:
+        return json.load(manifest)
+
+
+def _write_manifest(data_dir, manifest):
+    tmp_path = _manifest_path(data_dir) + '.tmp'
+    with open(tmp_path, 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    os.replace(tmp_path, _manifest_path(data_dir))
+
+
+def verify_dataset(dataset, data_dir):
+    """
+    True if every file recorded for the dataset is present with its recorded checksum.
+    Files whose size and mtime match the manifest are trusted without rehashing; a file
+    that was only touched has its new mtime recorded, so it is hashed once, not every run.
+    """
+    manifest = load_manifest(data_dir)
+    entry = manifest.get(dataset)
+    if not entry:
+        return False
+    touched = False
+    for name, recorded in entry['files'].items():
+        path = os.path.join(data_dir, name)
+        if not os.path.exists(path):
+            return False
+        stat = os.stat(path)
+        if stat.st_size != recorded['size']:
+            return False
+        if stat.st_mtime_ns != recorded['mtime_ns']:
+            if file_sha256(path) != recorded['sha256']:
+                return False
+            recorded['mtime_ns'] = stat.st_mtime_ns
+            touched = True
+    if touched:
+        _write_manifest(data_dir, manifest)
+    return True
+
+
+def _source_files(source):
+    if os.path.isdir(source):
+        return [os.path.join(source, name) for name in sorted(os.listdir(source))
+                if os.path.isfile(os.path.join(source, name)) and name != MANIFEST_NAME]
+    if os.path.isfile(source):
+        return [source]
+    raise FileNotFoundError(f"Dataset source not found: {source}")
+
+
+def _matches(path, recorded):
+    # Same size and mtime is trusted (copy2 preserves mtime); otherwise compare contents
+    stat = os.stat(path)
+    if stat.st_size != recorded['size']:
+        return False
+    return stat.st_mtime_ns == recorded['mtime_ns'] or file_sha256(path) == recorded['sha256']
+
+
+def import_dataset(dataset, source, data_dir):
+    """
+    Copy a local file or directory into the store and record its checksums.
+    Files whose stored copy already matches the source are neither copied nor rehashed.
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    previous = load_manifest(data_dir).get(dataset, {}).get('files', {})
+    files = {}
+    for path in _source_files(source):
+        name = os.path.basename(path)
+        target = os.path.join(data_dir, name)
+        recorded = previous.get(name)
+        if recorded and os.path.exists(target) and _matches(target, recorded) and _matches(path, recorded):
+            files[name] = dict(recorded, mtime_ns=os.stat(target).st_mtime_ns)
+            print(f"{name} (unchanged)")
+            continue
+        if os.path.abspath(path) != os.path.abspath(target):
+            shutil.copy2(path, target + '.tmp')
+            os.replace(target + '.tmp', target)
+        stat = os.stat(target)
+        files[name] = {'sha256': file_sha256(target), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        print(name)
+    manifest = load_manifest(data_dir)
+    manifest[dataset] = {'source': source, 'fetched_at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'files': files}
+    _write_manifest(data_dir, manifest)
+    return data_dir
+
+
+def download_dataset(dataset, data_dir, refresh=False):
+    # kagglehub is only needed when a download actually happens
+    import kagglehub
+    path = kagglehub.dataset_download(dataset, force_download=refresh)
+    return import_dataset(dataset, path, data_dir)
+
+
+def ensure_dataset(dataset, data_dir='data', source=None, offline=False, refresh=False):
+    """
+    Return data_dir holding a verified copy of the dataset.
+    Order: explicit local source, existing verified copy, then download (unless offline).
+    """
+    if source is not None:
+        return import_dataset(dataset, source, data_dir)
+    if not refresh and verify_dataset(dataset, data_dir):
+        print(f"Using verified local copy of {dataset} in {data_dir}")
+        return data_dir
+    if offline:
+        raise FileNotFoundError(
+            f"No verified copy of {dataset} in {data_dir} and offline mode is on; "
+            f"pass a local source file or directory"
+        )
+    return download_dataset(dataset, data_dir, refresh=refresh)
@@ -0,0 +1,75 @@
+"""Columnar derived-column registry used by the preprocessing pipeline."""
+
+import numpy as np
+import pandas as pd
+
+# name -> (function computing the whole column, input columns it reads)
+DERIVED_COLUMNS = {}
+
+
+def derived_column(name, inputs):
+    # Decorator to declare a derived column computed from whole columns
+    def register(func):
+        DERIVED_COLUMNS[name] = (func, tuple(inputs))
+        return func
+    return register
+
+
+def apply_derivations(df, names):
+    # Compute each requested derived column in order and assign it in place
+    for name in names:
+        if name not in DERIVED_COLUMNS:
+            raise KeyError(f"Unknown derived column '{name}'")
+        func, inputs = DERIVED_COLUMNS[name]
+        missing = [col for col in inputs if col not in df.columns]
+        if missing:
+            raise KeyError(f"Derived column '{name}' needs missing columns {missing}")
+        df[name] = func(df)
+    return df
+
+
+@derived_column('Profit Margin', inputs=['Profit', 'Sales'])
+def profit_margin(df):
+    sales = df['Sales']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        margin = df['Profit'] / sales * 100
+    return margin.where(sales > 0, 0.0)
+
+
+@derived_column('Shipping Days', inputs=['Ship Date', 'Order Date'])
+def shipping_days(df):
+    return (df['Ship Date'] - df['Order Date']).dt.days
+
+
+@derived_column('Order Year', inputs=['Order Date'])
+def order_year(df):
+    return df['Order Date'].dt.year.astype('int64')
+
+
+@derived_column('Order Month', inputs=['Order Date'])
+def order_month(df):
+    return df['Order Date'].dt.month.astype('int64')
+
+
+QUARTER_LABELS = ['Q1', 'Q2', 'Q3', 'Q4']
+
+
+@derived_column('Order Quarter', inputs=['Order Date'])
+def order_quarter(df):
+    # Labels are stored as categorical codes; missing dates map to code -1 (NaN)
+    codes = df['Order Date'].dt.quarter.fillna(0).astype('int8') - 1
+    return pd.Series(pd.Categorical.from_codes(codes, categories=QUARTER_LABELS), index=df.index)
+
+
+ORDER_SIZE_LABELS = ['Small', 'Medium', 'Large', 'Extra Large']
+ORDER_SIZE_THRESHOLDS = [100, 500, 2000]
+
+
+@derived_column('Order Size', inputs=['Sales'])
+def order_size(df):
+    sales = df['Sales'].to_numpy()
+    conditions = [sales < threshold for threshold in ORDER_SIZE_THRESHOLDS]
+    codes = np.select(conditions, range(len(ORDER_SIZE_THRESHOLDS)), default=len(ORDER_SIZE_THRESHOLDS))
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=ORDER_SIZE_LABELS, ordered=True), index=df.index
+    )
@@ -0,0 +1,278 @@
+"""Declarative metric specs compiled into a single groupby().agg() pass."""
+
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+
+from . import sketches
+from .sketches import DEFAULT_DISTINCT_ERROR
+
+# `param` carries sketch settings for the approximate kinds
+Metric = namedtuple('Metric', ['kind', 'column', 'other', 'scale', 'param'], defaults=(None,))
+
+
+# Spec constructors
+def sum_of(column, scale=1):
+    return Metric('sum', column, None, scale)
+
+def mean_of(column, scale=1):
+    return Metric('mean', column, None, scale)
+
+def max_of(column):
+    return Metric('max', column, None, 1)
+
+def min_of(column):
+    return Metric('min', column, None, 1)
+
+def count():
+    return Metric('count', None, None, 1)
+
+def nunique_of(column):
+    return Metric('nunique', column, None, 1)
+
+def approx_nunique_of(column, error=DEFAULT_DISTINCT_ERROR):
+    # HyperLogLog distinct count with the given relative standard error
+    return Metric('approx_nunique', column, None, 1, sketches.hll_precision(error))
+
+def ratio_of_sums(numerator, denominator, scale=1):
+    # sum(numerator) / sum(denominator), 0 where the denominator sum is not positive
+    return Metric('ratio', numerator, denominator, scale)
+
+def share_of_total(column, scale=1):
+    # sum(column) per group / sum(column) overall (or the supplied total)
+    return Metric('share', column, None, scale)
+
+def fraction_positive(column, scale=1):
+    return Metric('positive', column, None, scale)
+
+def fraction_negative(column, scale=1):
+    return Metric('negative', column, None, scale)
+
+def days_since(column):
+    # Days between the reference date and the latest value in the group
+    return Metric('days_since', column, None, 1)
+
+
+# How each metric kind maps onto mergeable partial aggregates (sum/count/size/max/min).
+# Means divide by the non-null count, as pandas does; count() and fractions use group size.
+# Distinct counts are kept as the set of distinct (group, value) rows instead, and
+# approximate kinds as sketch frames (see sketches.py).
+_PARTIALS = {
+    'sum': lambda m: [(m.column, 'sum')],
+    'mean': lambda m: [(m.column, 'sum'), (m.column, 'count')],
+    'max': lambda m: [(m.column, 'max')],
+    'min': lambda m: [(m.column, 'min')],
+    'days_since': lambda m: [(m.column, 'max')],
+    'count': lambda m: [(None, 'size')],
+    'nunique': lambda m: [],
+    'approx_nunique': lambda m: [],
+    'ratio': lambda m: [(m.column, 'sum'), (m.other, 'sum')],
+    'share': lambda m: [(m.column, 'sum')],
+    'positive': lambda m: [(_flag_name(m), 'sum'), (None, 'size')],
+    'negative': lambda m: [(_flag_name(m), 'sum'), (None, 'size')],
+}
+
+# How partial aggregates from different chunks combine
+_MERGE_FUNCS = {'sum': 'sum', 'count': 'sum', 'size': 'sum', 'max': 'max', 'min': 'min'}
+
+# Sketch kind -> (partial(df, by, metric), estimate(frame, by, metric)); merging is sketches.merge_sketch
+_SKETCHES = {
+    'approx_nunique': (
+        lambda df, by, m: sketches.hll_partial(df, by, m.column, m.param),
+        lambda frame, by, m: sketches.hll_estimate(frame, by, m.param),
+    ),
+}
+
+Partials = namedtuple('Partials', ['by', 'frame', 'distinct', 'sketches'], defaults=({},))
+
+
+def _flag_name(metric):
+    return f"__{metric.kind}__{metric.column}"
+
+def _partial_name(column, func):
+    return f"__{func}__{column}"
+
+
+def _build_frame(df, by, spec):
+    # Collect only the columns the spec reads, plus boolean flags for fraction metrics
+    columns = {key: df[key] for key in by}
+    for metric in spec.values():
+        if metric.kind in ('positive', 'negative'):
+            values = df[metric.column]
+            columns[_flag_name(metric)] = values > 0 if metric.kind == 'positive' else values < 0
+        elif metric.kind != 'nunique' and metric.kind not in _SKETCHES:
+            for column in (metric.column, metric.other):
+                if column is not None:
+                    columns[column] = _widen(df[column])
+    return pd.DataFrame(columns)
+
+
+def _widen(series):
+    # Downcast integer columns are summed in int64 so group totals cannot overflow
+    if pd.api.types.is_integer_dtype(series.dtype) and series.dtype.itemsize < 8:
+        return series.astype('int64')
+    return series
+
+
+def _named_aggregations(frame, by, spec):
+    size_column = next((c for c in frame.columns if c not in by), by[0])
+    named = {}
+    for metric in spec.values():
+        for column, func in _PARTIALS[metric.kind](metric):
+            named[_partial_name(column, func)] = pd.NamedAgg(
+                column=size_column if column is None else column, aggfunc=func
+            )
+    return named
+
+
+def partial_aggregate(df, by, spec):
+    """Compute mergeable partial aggregates of a spec for one frame (or chunk)."""
+    by = [by] if isinstance(by, str) else list(by)
+    frame = _build_frame(df, by, spec)
+    named = _named_aggregations(frame, by, spec)
+    grouped = frame.groupby(by, sort=True, observed=True)
+    partials = grouped.agg(**named) if named else grouped.size().to_frame(_partial_name(None, 'size'))
+    # Missing values are not distinct values (pandas nunique drops them too)
+    distinct = {
+        metric.column: df[by + [metric.column]].dropna(subset=[metric.column]).drop_duplicates()
+        for metric in spec.values() if metric.kind == 'nunique'
+    }
+    sketch_frames = {
+        name: _SKETCHES[metric.kind][0](df, by, metric)
+        for name, metric in spec.items() if metric.kind in _SKETCHES
+    }
+    return Partials(by, partials, distinct, sketch_frames)
+
+
+def merge_partials(parts):
+    """Combine partial aggregates computed over disjoint chunks of the same data."""
+    parts = list(parts)
+    by = parts[0].by
+    frame = pd.concat([part.frame for part in parts])
+    merge = {name: _MERGE_FUNCS[name.split('__')[1]] for name in frame.columns}
+    merged = frame.groupby(level=by, sort=True, observed=True).agg(merge)
+    distinct = {
+        column: pd.concat([part.distinct[column] for part in parts]).drop_duplicates()
+        for column in parts[0].distinct
+    }
+    sketch_frames = {
+        name: sketches.merge_sketch([part.sketches[name] for part in parts], by)
+        for name in parts[0].sketches
+    }
+    return Partials(by, merged, distinct, sketch_frames)
+
+
+def finalize(partials, spec, totals=None, reference_date=None):
+    """Turn (merged) partial aggregates into the final metric table."""
+    if reference_date is None and any(m.kind == 'days_since' for m in spec.values()):
+        raise ValueError("reference_date is required for days_since metrics")
+    totals = totals or {}
+    frame = partials.frame
+    result = pd.DataFrame(index=frame.index)
+    for name, metric in spec.items():
+        kind, scale = metric.kind, metric.scale
+        if kind == 'count':
+            values = frame[_partial_name(None, 'size')]
+        elif kind == 'mean':
+            values = frame[_partial_name(metric.column, 'sum')] / frame[_partial_name(metric.column, 'count')] * scale
+        elif kind == 'days_since':
+            values = (reference_date - frame[_partial_name(metric.column, 'max')]).dt.days
+        elif kind == 'ratio':
+            numerator = frame[_partial_name(metric.column, 'sum')]
+            denominator = frame[_partial_name(metric.other, 'sum')]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values = (numerator / denominator * scale).where(denominator > 0, 0.0)
+        elif kind == 'share':
+            column_sum = frame[_partial_name(metric.column, 'sum')]
+            total = totals.get(metric.column, column_sum.sum())
+            values = column_sum / total * scale if total > 0 else column_sum * 0.0
+        elif kind in ('positive', 'negative'):
+            values = frame[_partial_name(_flag_name(metric), 'sum')] / frame[_partial_name(None, 'size')] * scale
+        elif kind == 'nunique':
+            counts = partials.distinct[metric.column].groupby(partials.by, sort=True, observed=True).size()
+            values = counts.reindex(frame.index, fill_value=0)
+        elif kind in _SKETCHES:
+            values = _SKETCHES[kind][1](partials.sketches[name], partials.by, metric).reindex(frame.index)
+            if scale != 1:
+                values = values * scale
+        else:
+            values = frame[_partial_name(metric.column, kind)]
+            if scale != 1:
+                values = values * scale
+        result[name] = values
+    return result
+
+
+def approximate(spec, error=DEFAULT_DISTINCT_ERROR):
+    """Copy of a spec with exact distinct counts replaced by HyperLogLog estimates."""
+    return {
+        name: approx_nunique_of(metric.column, error) if metric.kind == 'nunique' else metric
+        for name, metric in spec.items()
+    }
+
+
+def partial_columns(spec):
+    """Partial-aggregate columns partial_aggregate produces for a spec."""
+    return list(dict.fromkeys(
+        _partial_name(column, func) for metric in spec.values() for column, func in _PARTIALS[metric.kind](metric)
+    ))
+
+
+def spec_columns(spec):
+    """Input columns a metric spec reads, in first-use order."""
+    columns = []
+    for metric in spec.values():
+        for column in (metric.column, metric.other):
+            if column is not None and column not in columns:
+                columns.append(column)
+    return columns
+
+
+def aggregate(df, by, spec, totals=None, reference_date=None):
+    """
+    Evaluate a metric spec ({output name: Metric}) for every group of `by`
+    using one vectorized groupby().agg() pass.
+    """
+    if reference_date is None and any(m.kind == 'days_since' for m in spec.values()):
+        raise ValueError("reference_date is required for days_since metrics")
+    return finalize(partial_aggregate(df, by, spec), spec, totals, reference_date)
+
+
+def summarize(df, spec, totals=None, reference_date=None):
+    """Evaluate a metric spec over the whole frame as a single group."""
+    keyed = df.assign(__group__=0)
+    return aggregate(keyed, '__group__', spec, totals, reference_date).iloc[0].rename(None)
+
+
+PROFITABILITY_METRICS = {
+    'Total_Sales': sum_of('Sales'),
+    'Total_Profit': sum_of('Profit'),
+    'Avg_Profit_Margin': mean_of('Profit Margin'),
+    'Order_Count': count(),
+    'Avg_Order_Value': mean_of('Sales'),
+    'Total_Quantity': sum_of('Quantity'),
+    'Profitable_Orders_Pct': fraction_positive('Profit', scale=100),
+    'Avg_Discount': mean_of('Discount', scale=100),
+}
+
+RFM_METRICS = {
+    'Recency': days_since('Order Date'),
+    'Frequency': count(),
+    'Monetary': sum_of('Sales'),
+    'Avg_Order_Value': mean_of('Sales'),
+    'Total_Profit': sum_of('Profit'),
+    'Lifetime_Quantity': sum_of('Quantity'),
+    'Avg_Discount': mean_of('Discount'),
+}
+
+PRODUCT_METRICS = {
+    'Revenue': sum_of('Sales'),
+    'Revenue_Share': share_of_total('Sales', scale=100),
+    'Profit': sum_of('Profit'),
+    'Units_Sold': sum_of('Quantity'),
+    'Orders': count(),
+    'Avg_Price': mean_of('Sales'),
+    'Profit_Margin': ratio_of_sums('Profit', 'Sales', scale=100),
+    'Return_Rate': fraction_negative('Profit', scale=100),
+    'Unique_Customers': nunique_of('Customer ID'),
+}
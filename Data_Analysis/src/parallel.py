@@ -0,0 +1,110 @@
+"""Run independent analyses concurrently in a process pool over a shared-memory frame."""
+
+import contextlib
+import io
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+from .analysis import ANALYSES
+from .report import Report, as_report
+
+ALIGNMENT = 64
+
+
+def _column_buffers(df):
+    # Split every column into raw numpy buffers; strings are dictionary-encoded
+    for name in df.columns:
+        series = df[name]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            yield name, series.cat.codes.to_numpy(), ('category', series.cat.categories, series.cat.ordered)
+        elif isinstance(series.dtype, np.dtype) and series.dtype.kind != 'O':
+            values = series.to_numpy()
+            if values.dtype.kind in 'mM':
+                yield name, values.view('int64'), ('datetime', values.dtype.str, None)
+            else:
+                yield name, values, ('numeric', None, None)
+        else:
+            codes, uniques = pd.factorize(series, sort=True)
+            yield name, codes, ('category', pd.Index(uniques), False)
+
+
+def share_frame(df):
+    """
+    Copy the frame's columns once into a single shared-memory block.
+    Returns the block (caller must close/unlink it) and a small picklable layout.
+    """
+    buffers = list(_column_buffers(df))
+    offsets, size = [], 0
+    for _, values, _ in buffers:
+        size = -(-size // ALIGNMENT) * ALIGNMENT
+        offsets.append(size)
+        size += values.nbytes
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    layout = []
+    for (name, values, kind), offset in zip(buffers, offsets):
+        target = np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf, offset=offset)
+        target[:] = values
+        layout.append((name, values.dtype.str, len(values), offset, kind))
+    return block, {'block': block.name, 'columns': layout, 'index': df.index}
+
+
+def _attach(block_name):
+    # Pool workers share the parent's resource tracker, which unlinks the block once
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=block_name, track=False)
+    return shared_memory.SharedMemory(name=block_name)
+
+
+def attach_frame(layout):
+    """Rebuild a DataFrame whose columns are views onto the shared block (no copies)."""
+    block = _attach(layout['block'])
+    columns = {}
+    for name, dtype, length, offset, (kind, meta, ordered) in layout['columns']:
+        values = np.ndarray((length,), dtype=np.dtype(dtype), buffer=block.buf, offset=offset)
+        values.flags.writeable = False
+        if kind == 'category':
+            values = pd.Categorical.from_codes(values, categories=meta, ordered=ordered)
+        elif kind == 'datetime':
+            values = values.view(meta)
+        columns[name] = pd.Series(values, index=layout['index'], copy=False)
+    return block, pd.DataFrame(columns, copy=False)
+
+
+def _run_shared(analysis, layout):
+    # Worker entry point: run one analysis, recording its report operations for the parent.
+    # The analysis arrives as the function itself, not a registry name: a spawned or
+    # forkserver worker re-imports the package and would not see analyses registered at runtime
+    block, df = attach_frame(layout)
+    console, report = io.StringIO(), Report([], record=True)
+    try:
+        with contextlib.redirect_stdout(console):
+            analysis(df, report)
+    finally:
+        del df
+        block.close()
+    return console.getvalue(), report.operations
+
+
+def run_parallel_analyses(df, summary_file, names=None, max_workers=None, mp_context=None):
+    """
+    Run the registered analyses concurrently and emit their output in registration order.
+    Analyses are pickled by reference, so they must be module-level functions; this holds
+    under every start method (fork, spawn, forkserver).
+    """
+    names = list(ANALYSES) if names is None else list(names)
+    report = as_report(summary_file)
+    block, layout = share_frame(df)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers or len(names), mp_context=mp_context) as pool:
+            futures = [pool.submit(_run_shared, ANALYSES[name], layout) for name in names]
+            # Collect in submission order so output is deterministic regardless of finish order
+            for future in futures:
+                console, operations = future.result()
+                print(console, end='')
+                report.replay(operations)
+    finally:
+        block.close()
+        block.unlink()
@@ -3,39 +3,60 @@ from itertools import groupby
 from operator import itemgetter
 import pandas as pd
 import warnings
+from .derivations import apply_derivations
+from .cache import load_cached, store_cached, source_fingerprint
+from .schema import compact_dtypes
+from .loader import load_orders, parse_date_series, DATE_FORMAT, DATE_FORMATS
+from .profiling import profiled
 warnings.filterwarnings('ignore')
 
-def run_preprocessing(df):
+def run_preprocessing(df=None, source_path=None, cache_dir=None, columns=None, fingerprint=None):
+    # Reuse the cached preprocessed frame when the source file is unchanged
+    use_cache = source_path is not None and cache_dir is not None
+    if use_cache:
+        # Fingerprint once, before reading: the entry is stored under the key of the bytes
+        # that were actually loaded, even if the file changes during preprocessing
+        fingerprint = fingerprint or source_fingerprint(source_path)
+        cached = load_cached(source_path, cache_dir, columns=columns, fingerprint=fingerprint)
+        if cached is not None:
+            return cached
+    if df is None:
+        df = load_orders(source_path, parse_dates=False)
+
     # Data Preparation using functional programming
     df_processed = (df
         .pipe(parse_dates)
         .pipe(add_derived_columns)
         .pipe(categorize_order_size)
+        .pipe(compact_dtypes)
     )
     print("Data processed successfully!")
     print(f"Total Records: {len(df_processed):,}")
     print(f"\nNew columns added: {['Profit Margin', 'Shipping Days', 'Order Year', 'Order Month', 'Order Quarter', 'Order Size']}")
     print(f"\nDate range: {df_processed['Order Date'].min()} to {df_processed['Order Date'].max()}")
+    if use_cache:
+        store_cached(df_processed, source_path, cache_dir, fingerprint=fingerprint)
+    return df_processed if columns is None else df_processed[columns]
 
 # Define transformation functions
-def parse_dates(df):
-    df['Order Date'] = pd.to_datetime(df['Order Date'])
-    df['Ship Date'] = pd.to_datetime(df['Ship Date'])
-    return df
+BASE_DERIVED_COLUMNS = ['Profit Margin', 'Shipping Days', 'Order Year', 'Order Month', 'Order Quarter']
 
-def add_derived_columns(df):
-    df['Profit Margin'] = df.apply(lambda row: (row['Profit'] / row['Sales'] * 100) if row['Sales'] > 0 else 0, axis=1)
-    df['Shipping Days'] = df.apply(lambda row: (row['Ship Date'] - row['Order Date']).days, axis=1)
-    df['Order Year'] = df['Order Date'].apply(lambda x: x.year)
-    df['Order Month'] = df['Order Date'].apply(lambda x: x.month)
-    df['Order Quarter'] = df['Order Date'].apply(lambda x: f"Q{x.quarter}")
-    return df
+DATE_COLUMNS = ['Order Date', 'Ship Date']
 
-def categorize_order_size(df):
-    df['Order Size'] = df['Sales'].apply(
-        lambda x: 'Small' if x < 100 else 'Medium' if x < 500 else 'Large' if x < 2000 else 'Extra Large'
-    )
+def parse_date_column(df, column):
+    df[column] = parse_date_series(df[column], DATE_FORMATS.get(column, DATE_FORMAT))
     return df
 
+@profiled('parse_dates')
+def parse_dates(df):
+    for column in DATE_COLUMNS:
+        parse_date_column(df, column)
+    return df
 
+@profiled('add_derived_columns')
+def add_derived_columns(df):
+    return apply_derivations(df, BASE_DERIVED_COLUMNS)
 
+@profiled('categorize_order_size')
+def categorize_order_size(df):
+    return apply_derivations(df, ['Order Size'])
@@ -0,0 +1,155 @@
+"""Opt-in per-stage profiling: wall/CPU time, rows in/out and peak memory per span."""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+# The active profiler, or None. Instrumented code only checks this when disabled.
+_active = None
+_DISABLED = contextlib.nullcontext()
+
+
+def _rows(value):
+    try:
+        return len(value) if hasattr(value, 'columns') else None
+    except TypeError:
+        return None
+
+
+class Profiler:
+    """Collects one record per span; spans nest and each reports its own peak memory."""
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.records = []
+        self._stack = []
+        self._origin = time.perf_counter()
+        self._started_tracing = False
+
+    def start(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _memory(self):
+        return tracemalloc.get_traced_memory() if self.trace_memory and tracemalloc.is_tracing() else (0, 0)
+
+    @contextlib.contextmanager
+    def span(self, name, category='stage', rows_in=None):
+        current, peak = self._memory()
+        if self._stack:
+            # Fold the parent's peak so far before resetting the peak counter for this span
+            self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        frame = {'peak': current, 'rows_out': None}
+        self._stack.append(frame)
+        start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield frame
+        finally:
+            wall, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+            self._stack.pop()
+            _, peak = self._memory()
+            frame['peak'] = max(frame['peak'], peak)
+            if self._stack:
+                self._stack[-1]['peak'] = max(self._stack[-1]['peak'], frame['peak'])
+            if self.trace_memory and tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            self.records.append({
+                'name': name,
+                'category': category,
+                'depth': len(self._stack),
+                'start_s': round(start - self._origin, 6),
+                'wall_s': round(wall, 6),
+                'cpu_s': round(cpu, 6),
+                'rows_in': rows_in,
+                'rows_out': frame['rows_out'],
+                'peak_mb': round((frame['peak'] - current) / 1e6, 3) if self.trace_memory else None,
+            })
+
+    def summary(self):
+        """Per-span totals as a DataFrame, slowest first."""
+        import pandas as pd
+        table = pd.DataFrame(self.records)
+        if table.empty:
+            return table
+        return (table
+            .groupby(['category', 'name'], sort=False)
+            .agg(calls=('wall_s', 'size'), wall_s=('wall_s', 'sum'), cpu_s=('cpu_s', 'sum'),
+                 rows_in=('rows_in', 'max'), rows_out=('rows_out', 'max'), peak_mb=('peak_mb', 'max'))
+            .sort_values('wall_s', ascending=False)
+        )
+
+    def write_json(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as trace_file:
+            json.dump({'spans': self.records}, trace_file, indent=2)
+
+    def write_chrome_trace(self, path):
+        # Complete ("X") events, viewable in chrome://tracing or Perfetto
+        events = [{
+            'name': record['name'],
+            'cat': record['category'],
+            'ph': 'X',
+            'ts': record['start_s'] * 1e6,
+            'dur': record['wall_s'] * 1e6,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': {key: record[key] for key in ('cpu_s', 'rows_in', 'rows_out', 'peak_mb')},
+        } for record in self.records]
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as trace_file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
+
+    def save(self, directory):
+        """Write trace.json and chrome_trace.json to directory and print the summary table."""
+        self.write_json(os.path.join(directory, 'trace.json'))
+        self.write_chrome_trace(os.path.join(directory, 'chrome_trace.json'))
+        print("\nProfile (slowest first):")
+        print(self.summary().to_string())
+        print(f"Traces written to {directory}")
+
+
+@contextlib.contextmanager
+def profile(trace_memory=True):
+    """Enable profiling for the duration of the block and yield the Profiler."""
+    global _active
+    previous, _active = _active, Profiler(trace_memory).start()
+    try:
+        yield _active
+    finally:
+        _active.stop()
+        _active = previous
+
+
+def span(name, category='stage', rows_in=None):
+    # A no-op context manager unless profiling is enabled
+    if _active is None:
+        return _DISABLED
+    return _active.span(name, category, rows_in)
+
+
+def profiled(name, category='stage'):
+    """Decorator recording a span per call; the first DataFrame argument counts as rows in."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with _active.span(name, category, _rows(args[0]) if args else None) as frame:
+                result = func(*args, **kwargs)
+                frame['rows_out'] = _rows(result)
+                return result
+        return wrapper
+    return decorate
@@ -0,0 +1,140 @@
+"""Report layer: each result table is computed once and streamed to any set of sinks."""
+
+import json
+import os
+import sys
+
+from .profiling import span
+
+
+class ConsoleSink:
+    """Writes rendered text to stdout."""
+    renders_text = True
+
+    def write_text(self, text):
+        sys.stdout.write(text)
+
+    def write_table(self, name, frame, index, render):
+        sys.stdout.write(render())
+
+    def close(self):
+        sys.stdout.flush()
+
+
+class TextSink:
+    """Writes rendered text to an open file (the summary file)."""
+    renders_text = True
+
+    def __init__(self, file):
+        self.file = file
+
+    def write_text(self, text):
+        self.file.write(text)
+
+    def write_table(self, name, frame, index, render):
+        self.file.write(render())
+
+    def close(self):
+        self.file.flush()
+
+
+class JSONSink:
+    """Collects every table as JSON records and writes one document on close (path=None keeps them in .tables)."""
+    renders_text = False
+
+    def __init__(self, path):
+        self.path = path
+        self.tables = {}
+
+    def write_text(self, text):
+        pass
+
+    def write_table(self, name, frame, index, render):
+        data = frame.reset_index() if index else frame
+        self.tables[name] = json.loads(data.to_json(orient='records', date_format='iso'))
+
+    def close(self):
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'w') as json_file:
+            json.dump(self.tables, json_file, indent=2)
+
+
+class ParquetSink:
+    """Writes every table to <directory>/<name>.parquet."""
+    renders_text = False
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def write_text(self, text):
+        pass
+
+    def write_table(self, name, frame, index, render):
+        os.makedirs(self.directory, exist_ok=True)
+        data = frame.reset_index() if index else frame
+        data.to_parquet(os.path.join(self.directory, f"{name}.parquet"), index=False)
+
+    def close(self):
+        pass
+
+
+class Report:
+    """
+    Dispatches report text and tables to sinks. A table is rendered with
+    to_string() at most once, and only if some sink renders text.
+    """
+
+    def __init__(self, sinks, record=False):
+        self.sinks = list(sinks)
+        self.renders_text = any(sink.renders_text for sink in self.sinks)
+        # Recorded operations can be shipped to another process and replayed there
+        self.operations = [] if record else None
+
+    def text(self, text):
+        if self.operations is not None:
+            self.operations.append(('text', text))
+        if self.renders_text:
+            for sink in self.sinks:
+                sink.write_text(text)
+
+    def write(self, text):
+        # File-like alias so analyses written against a summary file keep working
+        self.text(text)
+
+    def table(self, name, frame, index=False, formatter=None):
+        # formatter(frame) -> str overrides the default to_string() rendering
+        if self.operations is not None:
+            self.operations.append(('table', name, frame, index, formatter))
+        rendered = []
+
+        def render():
+            if not rendered:
+                with span(f"render {name}", 'render'):
+                    rendered.append(formatter(frame) if formatter else frame.to_string(index=index))
+            return rendered[0]
+
+        for sink in self.sinks:
+            sink.write_table(name, frame, index, render)
+
+    def replay(self, operations):
+        for kind, *args in operations:
+            getattr(self, kind)(*args)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def as_report(summary_file):
+    # Analyses accept either a Report or a plain summary file (console + file, as before)
+    if isinstance(summary_file, Report):
+        return summary_file
+    return Report([ConsoleSink(), TextSink(summary_file)])
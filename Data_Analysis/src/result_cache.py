@@ -0,0 +1,201 @@
+"""Memoized analysis results: in-memory LRU over an on-disk tier, keyed by data fingerprint and parameters."""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from .analysis import ANALYSES
+from .cache import PIPELINE_VERSION
+from .report import Report, as_report
+
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_DISK_BYTES = 512 * 1024 * 1024
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@functools.lru_cache(maxsize=None)
+def _package_version():
+    # Hash of every module in the package: analyses call into metrics, report and friends,
+    # so any code change there must invalidate cached output too
+    digest = hashlib.blake2b(f"v{PIPELINE_VERSION}".encode(), digest_size=12)
+    for name in sorted(os.listdir(PACKAGE_DIR)):
+        if name.endswith('.py'):
+            with open(os.path.join(PACKAGE_DIR, name), 'rb') as module:
+                digest.update(name.encode() + module.read())
+    return digest.hexdigest()
+
+
+def analysis_version(name):
+    """
+    Version of the code behind ANALYSES[name]: the package source plus the analysis
+    function's own name and bytecode, which covers analyses registered from outside.
+    """
+    func = ANALYSES[name]
+    code = getattr(func, '__code__', None)
+    digest = hashlib.blake2b(_package_version().encode(), digest_size=12)
+    digest.update(f"{func.__module__}.{func.__qualname__}".encode())
+    if code is not None:
+        digest.update(code.co_code + repr(code.co_consts).encode())
+    return digest.hexdigest()
+
+
+def frame_fingerprint(df):
+    """
+    Content fingerprint: shape, columns and dtypes, plus a hash of every row (index included),
+    so a change to any cell of any column gives a different key.
+    """
+    digest = hashlib.blake2b(digest_size=12)
+    digest.update(f"{df.shape}:v{PIPELINE_VERSION}".encode())
+    digest.update(repr(list(zip(df.columns, map(str, df.dtypes)))).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def result_key(*parts):
+    # Parameters may hold tuples, numpy scalars or inf; repr keeps them distinct and stable
+    text = json.dumps(parts, sort_keys=True, default=repr)
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """
+    Two tiers: an in-memory LRU bounded by pickled size, over an optional directory of
+    pickles bounded by total file size. Disk hits are promoted to memory.
+    """
+
+    def __init__(self, cache_dir=None, max_memory_bytes=DEFAULT_MEMORY_BYTES, max_disk_bytes=DEFAULT_DISK_BYTES):
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.memory = OrderedDict()
+        self.memory_bytes = 0
+        self.hits = {'memory': 0, 'disk': 0}
+        self.misses = 0
+        self.evictions = {'memory': 0, 'disk': 0}
+        self._lock = threading.Lock()
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key):
+        with self._lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                self.hits['memory'] += 1
+                return pickle.loads(self.memory[key])
+        payload = self._read_disk(key)
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits['disk'] += 1
+            self._remember(key, payload)
+        return pickle.loads(payload)
+
+    def put(self, key, value):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remember(key, payload)
+        if self.cache_dir is not None and len(payload) <= self.max_disk_bytes:
+            path = self._path(key)
+            with open(f"{path}.tmp", 'wb') as cache_file:
+                cache_file.write(payload)
+            os.replace(f"{path}.tmp", path)
+            self._evict_disk()
+
+    def _remember(self, key, payload):
+        # Caller holds the lock. Values larger than the whole tier are only kept on disk
+        if len(payload) > self.max_memory_bytes:
+            return
+        if key in self.memory:
+            self.memory_bytes -= len(self.memory.pop(key))
+        self.memory[key] = payload
+        self.memory_bytes += len(payload)
+        while self.memory_bytes > self.max_memory_bytes:
+            _, evicted = self.memory.popitem(last=False)
+            self.memory_bytes -= len(evicted)
+            self.evictions['memory'] += 1
+
+    def _read_disk(self, key):
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._path(key), 'rb') as cache_file:
+                payload = cache_file.read()
+        except FileNotFoundError:
+            return None
+        # Touch so disk eviction is least-recently-used too
+        os.utime(self._path(key))
+        return payload
+
+    def _evict_disk(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pkl'):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime_ns, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                continue
+            total -= size
+            self.evictions['disk'] += 1
+
+    def clear(self):
+        with self._lock:
+            self.memory.clear()
+            self.memory_bytes = 0
+        if self.cache_dir is not None:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.pkl'):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def stats(self):
+        lookups = sum(self.hits.values()) + self.misses
+        return {
+            'hits': dict(self.hits),
+            'misses': self.misses,
+            'hit_rate': round(sum(self.hits.values()) / lookups, 4) if lookups else None,
+            'evictions': dict(self.evictions),
+            'memory_entries': len(self.memory),
+            'memory_bytes': self.memory_bytes,
+        }
+
+
+def cached_analysis(cache, name, df, summary_file, fingerprint=None, **params):
+    """
+    Run ANALYSES[name] through the cache. The recorded report operations are what is
+    cached, and they are replayed into summary_file whether they came from cache or not.
+    """
+    key = result_key(name, analysis_version(name), fingerprint or frame_fingerprint(df), params)
+    operations = cache.get(key)
+    if operations is None:
+        recorder = Report([], record=True)
+        ANALYSES[name](df, recorder, **params)
+        operations = recorder.operations
+        cache.put(key, operations)
+    as_report(summary_file).replay(operations)
+    return operations
+
+
+def run_cached_analyses(df, summary_file, cache, names=None, fingerprint=None):
+    # Callers that loaded df from a file pass the source fingerprint taken before loading;
+    # otherwise the frame is hashed once for every analysis
+    fingerprint = fingerprint or frame_fingerprint(df)
+    for name in (list(ANALYSES) if names is None else names):
+        cached_analysis(cache, name, df, summary_file, fingerprint=fingerprint)
+    stats = cache.stats()
+    print(f"\nResult cache: {sum(stats['hits'].values())} hits, {stats['misses']} misses")
+    return stats
@@ -0,0 +1,107 @@
+"""Persistent per-customer RFM state updated incrementally from order deltas."""
+
+import os
+import pandas as pd
+
+from .analysis import report_rfm, RFM_GROUPS
+from .dataset_store import file_sha256
+from .metrics import partial_aggregate, merge_partials, finalize, partial_columns, Partials, RFM_METRICS
+from .loader import load_orders
+from .streaming import iter_chunks, DEFAULT_CHUNKSIZE
+
+# State columns are the mergeable RFM partials: last order date, order count,
+# and sums of sales, profit, quantity and discount per customer.
+LAST_ORDER_COLUMN = '__max__Order Date'
+# Content hashes of the applied deltas, kept in the state file's own metadata so the
+# state and its ledger are replaced together in one atomic rename
+APPLIED_DELTAS_KEY = 'applied_deltas'
+
+
+def build_rfm_state(source_path, chunksize=DEFAULT_CHUNKSIZE):
+    # Build the full-history state in chunks so the history never sits in memory at once
+    parts = (partial_aggregate(chunk, RFM_GROUPS, RFM_METRICS) for chunk in iter_chunks(source_path, chunksize))
+    state = None
+    for part in parts:
+        state = part if state is None else merge_partials([state, part])
+    if state is None:
+        # No orders yet: an empty state with the same columns, for deltas to fold into
+        state = partial_aggregate(load_orders(source_path), RFM_GROUPS, RFM_METRICS)
+    return state.frame
+
+
+def apply_order_delta(state, delta_df):
+    """Fold new orders into the state, touching only the customers in the delta."""
+    delta = partial_aggregate(delta_df, RFM_GROUPS, RFM_METRICS).frame
+    existing = delta.index.intersection(state.index)
+    added = delta.index.difference(state.index)
+
+    state = state.copy()
+    for column in state.columns:
+        current, incoming = state.loc[existing, column], delta.loc[existing, column]
+        if column.startswith('__max__'):
+            state.loc[existing, column] = current.where(current >= incoming, incoming)
+        else:
+            state.loc[existing, column] = current + incoming
+    print(f"RFM delta: {len(delta_df):,} orders, {len(existing):,} existing and {len(added):,} new customers")
+    return pd.concat([state, delta.loc[added]]).sort_index()
+
+
+def load_rfm_state(state_path):
+    """(state, applied delta hashes), or (None, []) when there is no state yet."""
+    if not os.path.exists(state_path):
+        return None, []
+    frame = pd.read_parquet(state_path)
+    missing = set(partial_columns(RFM_METRICS)) - set(frame.columns)
+    if missing:
+        # Rebuilding from the history alone would drop the applied deltas, so never do it silently
+        raise ValueError(f"RFM state at {state_path} lacks columns {sorted(missing)} required by RFM_METRICS; "
+                         "rebuild it from the history plus every delta applied so far")
+    applied = frame.attrs.get(APPLIED_DELTAS_KEY, [])
+    state = frame.set_index(RFM_GROUPS)
+    state.attrs = {}
+    return state, list(applied)
+
+
+def save_rfm_state(state, state_path, applied=()):
+    os.makedirs(os.path.dirname(state_path) or '.', exist_ok=True)
+    frame = state.reset_index()
+    frame.attrs = {APPLIED_DELTAS_KEY: list(applied)}
+    tmp_path = state_path + '.tmp'
+    frame.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, state_path)
+
+
+def update_rfm_state(state_path, delta_path, source_path=None):
+    """
+    Apply a delta CSV of new orders to the stored state and persist it.
+    The state is built from source_path on first use. A delta is applied at most once,
+    recognised by the sha256 of its contents, so a copied or touched file is still a repeat.
+    """
+    state, applied = load_rfm_state(state_path)
+    if state is None:
+        if source_path is None:
+            raise ValueError(f"No RFM state at {state_path} and no source_path to build it from")
+        state = build_rfm_state(source_path)
+        print(f"RFM state built from {source_path}: {len(state):,} customers")
+
+    content_hash = file_sha256(delta_path)
+    if content_hash in applied:
+        print(f"RFM delta already applied: {delta_path}")
+        return state
+
+    delta_df = load_orders(delta_path)
+    state = apply_order_delta(state, delta_df)
+    save_rfm_state(state, state_path, applied + [content_hash])
+    return state
+
+
+def rfm_from_state(state):
+    # Final per-customer RFM metrics; the reference date is the day after the latest order
+    reference_date = state[LAST_ORDER_COLUMN].max() + pd.Timedelta(days=1)
+    return finalize(Partials(RFM_GROUPS, state, {}), RFM_METRICS, reference_date=reference_date)
+
+
+def run_incremental_rfm(state_path, delta_path, summary_file, source_path=None):
+    state = update_rfm_state(state_path, delta_path, source_path=source_path)
+    report_rfm(rfm_from_state(state), summary_file)
+    return state
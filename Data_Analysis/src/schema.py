@@ -0,0 +1,50 @@
+"""Compact dtypes for the sales frame: categoricals for labels, downcast numerics."""
+
+import pandas as pd
+
+from .profiling import profiled
+
+# Low-cardinality string columns of the Superstore extract
+CATEGORICAL_COLUMNS = [
+    'Ship Mode', 'Segment', 'Country', 'City', 'State', 'Region',
+    'Category', 'Sub-Category', 'Customer ID', 'Customer Name', 'Product ID', 'Product Name',
+]
+# Convert only when distinct values are at most this fraction of the rows
+MAX_CARDINALITY_RATIO = 0.5
+
+
+def frame_memory(df):
+    return df.memory_usage(index=True, deep=True).sum()
+
+
+def to_categorical(series, max_ratio=MAX_CARDINALITY_RATIO):
+    if isinstance(series.dtype, pd.CategoricalDtype) or len(series) == 0:
+        return series
+    if series.nunique(dropna=True) > max_ratio * len(series):
+        return series
+    return series.astype('category')
+
+
+def downcast_numeric(series):
+    # Integers shrink to the smallest type holding their range. Floats stay float64:
+    # group sums over float32 would lose precision even when every value fits.
+    if pd.api.types.is_integer_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        return pd.to_numeric(series, downcast='integer')
+    return series
+
+
+@profiled('compact_dtypes')
+def compact_dtypes(df, categorical_columns=None, report=True):
+    """Pipe stage: categorical label columns and downcast numerics, in place."""
+    before = frame_memory(df) if report else None
+    categorical_columns = CATEGORICAL_COLUMNS if categorical_columns is None else categorical_columns
+    for column in df.columns:
+        if column in categorical_columns:
+            df[column] = to_categorical(df[column])
+        elif pd.api.types.is_numeric_dtype(df[column].dtype):
+            df[column] = downcast_numeric(df[column])
+    if report:
+        after = frame_memory(df)
+        print(f"\nMemory: {before / 1e6:.2f} MB -> {after / 1e6:.2f} MB "
+              f"({(1 - after / before) * 100 if before else 0:.1f}% smaller)")
+    return df
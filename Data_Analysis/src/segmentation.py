@@ -0,0 +1,72 @@
+"""Vectorized score binning and ordered rule-based segmentation."""
+
+import operator
+import numpy as np
+import pandas as pd
+
+# score column -> (source column, right-closed bin edges, score per bin)
+RFM_SCORE_BINS = {
+    'R_Score': ('Recency', [-1, 90, 180, 365, 730, np.inf], [5, 4, 3, 2, 1]),
+    'F_Score': ('Frequency', [0, 1, 4, 9, 19, np.inf], [1, 2, 3, 4, 5]),
+    'M_Score': ('Monetary', [0, 499, 1999, 4999, 9999, np.inf], [1, 2, 3, 4, 5]),
+}
+
+# Ordered (label, [(column, op, value), ...]) rules; the first rule whose conditions all hold wins
+RFM_SEGMENT_RULES = [
+    ('Champions', [('RFM_Score', '>=', 13)]),
+    ('Loyal Customers', [('RFM_Score', '>=', 10), ('R_Score', '>=', 4)]),
+    ('Big Spenders', [('RFM_Score', '>=', 10)]),
+    ('Frequent Buyers', [('F_Score', '>=', 4)]),
+    ('Recent Customers', [('R_Score', '>=', 4)]),
+    ('Potential Loyalists', [('RFM_Score', '>=', 7)]),
+    ('At Risk', [('R_Score', '<=', 2)]),
+]
+RFM_DEFAULT_SEGMENT = 'Needs Attention'
+
+OPERATORS = {
+    '>=': operator.ge,
+    '>': operator.gt,
+    '<=': operator.le,
+    '<': operator.lt,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+
+def bin_scores(values, edges, scores):
+    # Equivalent to pd.cut(values, edges, labels=scores) with right-closed bins, on raw arrays
+    values = np.asarray(values, dtype=float)
+    positions = np.searchsorted(np.asarray(edges, dtype=float), values, side='left') - 1
+    out_of_range = (positions < 0) | (positions >= len(scores)) | np.isnan(values)
+    if out_of_range.any():
+        raise ValueError(f"{out_of_range.sum()} value(s) fall outside score bins {edges}")
+    return np.asarray(scores, dtype='int64')[positions]
+
+
+def score_columns(df, score_bins=RFM_SCORE_BINS):
+    for score, (column, edges, scores) in score_bins.items():
+        df[score] = bin_scores(df[column].to_numpy(), edges, scores)
+    return df
+
+
+def classify(df, rules, default):
+    # Evaluate every rule as a whole-column mask; np.select picks the first match per row
+    masks = [
+        np.logical_and.reduce([OPERATORS[op](df[column].to_numpy(), value) for column, op, value in conditions])
+        for _, conditions in rules
+    ]
+    labels = [label for label, _ in rules]
+    return np.select(masks, labels, default=default).astype(object) if rules else np.full(len(df), default, dtype=object)
+
+
+def segment_rfm(rfm_data, score_bins=None, segment_rules=None, default_segment=None):
+    """Add score columns, RFM_Score and Customer_Segment to per-customer RFM metrics."""
+    score_bins = RFM_SCORE_BINS if score_bins is None else score_bins
+    rfm_data = score_columns(rfm_data, score_bins)
+    rfm_data['RFM_Score'] = sum(rfm_data[score] for score in score_bins)
+    rfm_data['Customer_Segment'] = classify(
+        rfm_data,
+        RFM_SEGMENT_RULES if segment_rules is None else segment_rules,
+        RFM_DEFAULT_SEGMENT if default_segment is None else default_segment,
+    )
+    return rfm_data
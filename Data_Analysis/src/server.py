@@ -0,0 +1,260 @@
+"""Resident analysis service: preprocess once, keep the frame hot, serve analyses over HTTP."""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections import namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from .analysis import ANALYSES
+from .cache import source_fingerprint
+from .preprocessing_pipeline import run_preprocessing
+from .report import Report, TextSink, JSONSink
+from .result_cache import analysis_version, result_key
+
+DEFAULT_HOST, DEFAULT_PORT = '127.0.0.1', 8765
+DEFAULT_POLL_INTERVAL = 2.0
+DATE_FILTER_COLUMN = 'Order Date'
+
+Snapshot = namedtuple('Snapshot', ['df', 'fingerprint', 'loaded_at', 'load_seconds'])
+
+
+def apply_filters(df, filters=None):
+    """
+    Rows matching every filter: {column: value or [values]}, plus 'start'/'end'
+    bounds on Order Date. Values are coerced to numbers for numeric columns.
+    """
+    if not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for column, values in filters.items():
+        if column in ('start', 'end'):
+            bound = pd.Timestamp(values[0] if isinstance(values, list) else values)
+            dates = df[DATE_FILTER_COLUMN]
+            mask &= dates >= bound if column == 'start' else dates <= bound
+            continue
+        if column not in df.columns:
+            raise KeyError(f"Unknown filter column '{column}'")
+        values = values if isinstance(values, list) else [values]
+        if pd.api.types.is_numeric_dtype(df[column].dtype):
+            values = pd.to_numeric(values)
+        mask &= df[column].isin(values)
+    return df[mask]
+
+
+class AnalysisService:
+    """
+    Holds the current preprocessed frame. A reload builds the new frame off to the side and
+    swaps a single reference, so in-flight requests finish on the snapshot they started with.
+    """
+
+    def __init__(self, source_path, cache_dir=None, poll_interval=DEFAULT_POLL_INTERVAL, result_cache=None):
+        self.source_path = source_path
+        self.cache_dir = cache_dir
+        self.result_cache = result_cache
+        self.poll_interval = poll_interval
+        self.snapshot = None
+        self.reloads = 0
+        self.requests = 0
+        self._stat = None
+        self._reload_lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self.reload()
+
+    def _file_stat(self):
+        stat = os.stat(self.source_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def reload(self):
+        with self._reload_lock:
+            # Fingerprint before reading, so a write during the load cannot label old rows as new
+            stat = self._file_stat()
+            fingerprint = source_fingerprint(self.source_path)
+            start = time.perf_counter()
+            df = run_preprocessing(source_path=self.source_path, cache_dir=self.cache_dir,
+                                   fingerprint=fingerprint)
+            self.snapshot = Snapshot(df, fingerprint, time.time(), round(time.perf_counter() - start, 3))
+            self._stat = stat
+            self.reloads += 1
+        print(f"[server] Loaded {len(df):,} rows from {self.source_path} in {self.snapshot.load_seconds}s")
+        return self.snapshot
+
+    def poll(self, pending=None):
+        # One watcher step: reload once the file has changed and then held still for a poll,
+        # so a copy in progress is never loaded half-written. Returns the new pending stat.
+        try:
+            stat = self._file_stat()
+        except OSError:
+            return None
+        if stat == self._stat:
+            return None
+        if stat != pending:
+            return stat
+        try:
+            self.reload()
+        except Exception as error:
+            print(f"[server] Reload failed, still serving the previous data: {error}")
+        return None
+
+    def watch(self):
+        pending = None
+        while not self._stopped.wait(self.poll_interval):
+            pending = self.poll(pending)
+
+    def start_watching(self):
+        watcher = threading.Thread(target=self.watch, name='source-watcher', daemon=True)
+        watcher.start()
+        return watcher
+
+    def stop(self):
+        self._stopped.set()
+
+    def health(self):
+        snapshot = self.snapshot
+        return {
+            'source': self.source_path,
+            'rows': len(snapshot.df),
+            'fingerprint': snapshot.fingerprint,
+            'loaded_at': snapshot.loaded_at,
+            'load_seconds': snapshot.load_seconds,
+            'reloads': self.reloads,
+            'requests': self.requests,
+            'analyses': list(ANALYSES),
+            'result_cache': self.result_cache.stats() if self.result_cache is not None else None,
+        }
+
+    def run(self, name, filters=None, params=None, output='json'):
+        """Run one analysis over the current snapshot; returns report text or {table: records}."""
+        if name not in ANALYSES:
+            raise KeyError(f"Unknown analysis '{name}'; available: {list(ANALYSES)}")
+        snapshot = self.snapshot
+        # Handler threads run concurrently; += on an attribute is not atomic
+        with self._count_lock:
+            self.requests += 1
+        # The file fingerprint identifies the snapshot, so a reload never serves stale results
+        key = result_key(name, analysis_version(name), snapshot.fingerprint, filters, params, output)
+        if self.result_cache is not None:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                return snapshot, cached[0], cached[1]
+        df = apply_filters(snapshot.df, filters)
+        if output == 'text':
+            buffer = io.StringIO()
+            sink = TextSink(buffer)
+        else:
+            sink = JSONSink(None)
+        with Report([sink]) as report:
+            ANALYSES[name](df, report, **(params or {}))
+        result = buffer.getvalue() if output == 'text' else sink.tables
+        if self.result_cache is not None:
+            self.result_cache.put(key, (len(df), result))
+        return snapshot, len(df), result
+
+
+class AnalysisHandler(BaseHTTPRequestHandler):
+    """
+    GET  /health                        service and snapshot details
+    GET  /<analysis>?Region=West&format=text
+    POST /<analysis> {"filters": {...}, "params": {...}, "format": "json"}
+    POST /reload                        reload the source now
+    """
+    service = None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        name = url.path.strip('/')
+        if name in ('', 'health'):
+            return self._send_json(200, self.service.health())
+        query = {key: ','.join(values).split(',') for key, values in parse_qs(url.query).items()}
+        output = query.pop('format', ['json'])[0]
+        self._run(name, query, None, output)
+
+    def do_POST(self):
+        name = urlsplit(self.path).path.strip('/')
+        if name == 'reload':
+            try:
+                self.service.reload()
+            except Exception as error:
+                return self._send_json(500, {'error': f"Reload failed, still serving the previous data: "
+                                                      f"{type(error).__name__}: {error}"})
+            return self._send_json(200, self.service.health())
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError as error:
+            return self._send_json(400, {'error': f"Invalid JSON body: {error}"})
+        if not isinstance(body, dict):
+            return self._send_json(400, {'error': f"JSON body must be an object, not {type(body).__name__}"})
+        self._run(name, body.get('filters'), body.get('params'), body.get('format', 'json'))
+
+    def _run(self, name, filters, params, output):
+        if name not in ANALYSES:
+            return self._send_json(404, {'error': f"Unknown analysis '{name}'", 'analyses': list(ANALYSES)})
+        start = time.perf_counter()
+        try:
+            snapshot, rows, result = self.service.run(name, filters, params, output)
+        except (KeyError, TypeError, ValueError) as error:
+            return self._send_json(400, {'error': f"{type(error).__name__}: {error}"})
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+        if output == 'text':
+            return self._send(200, result.encode(), 'text/plain; charset=utf-8')
+        self._send_json(200, {'analysis': name, 'rows': rows, 'fingerprint': snapshot.fingerprint,
+                              'elapsed_ms': elapsed_ms, 'tables': result})
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, default=str).encode(), 'application/json')
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix-socket peers have no host/port
+        return self.client_address[0] if self.client_address else 'unix'
+
+
+class UnixHTTPServer(ThreadingHTTPServer):
+    address_family = socket.AF_UNIX
+
+    def server_bind(self):
+        # HTTPServer.server_bind resolves a host name, which a socket path does not have
+        socketserver.TCPServer.server_bind(self)
+        self.server_name, self.server_port = self.server_address, 0
+
+
+def make_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None):
+    handler = type('BoundAnalysisHandler', (AnalysisHandler,), {'service': service})
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        return UnixHTTPServer(socket_path, handler)
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(source_path, cache_dir=None, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None,
+          poll_interval=DEFAULT_POLL_INTERVAL, result_cache=None):
+    """Load the source once and serve analyses until interrupted."""
+    service = AnalysisService(source_path, cache_dir, poll_interval, result_cache)
+    service.start_watching()
+    server = make_server(service, host, port, socket_path)
+    print(f"[server] Serving {list(ANALYSES)} on {socket_path or f'http://{host}:{server.server_port}'}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        server.server_close()
+        if socket_path is not None and os.path.exists(socket_path):
+            os.unlink(socket_path)
@@ -0,0 +1,68 @@
+"""
+Mergeable sketches kept as small per-group frames, so they combine across chunks and
+shards exactly like the other partial aggregates (concat, then groupby).
+
+- HyperLogLog distinct counts: relative standard error 1.04 / sqrt(2**precision).
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_DISTINCT_ERROR = 0.02
+MIN_PRECISION, MAX_PRECISION = 4, 16
+
+REGISTER, RANK = '__register__', '__rank__'
+
+
+# HyperLogLog
+def hll_precision(error=DEFAULT_DISTINCT_ERROR):
+    """Smallest register precision whose standard error is at most `error`."""
+    precision = math.ceil(math.log2((1.04 / error) ** 2))
+    return min(max(precision, MIN_PRECISION), MAX_PRECISION)
+
+
+def hll_error(precision):
+    return 1.04 / math.sqrt(2 ** precision)
+
+
+def _hll_alpha(registers):
+    return {16: 0.673, 32: 0.697, 64: 0.709}.get(registers, 0.7213 / (1 + 1.079 / registers))
+
+
+def hll_partial(df, by, column, precision):
+    """Sparse HLL registers per group: one row per touched (group, register) with its max rank."""
+    hashes = pd.util.hash_pandas_object(df[column], index=False).to_numpy()
+    register = (hashes >> np.uint64(64 - precision)).astype(np.int32)
+    # Rank = leading zeros of the remaining bits + 1. The top 53 of them convert to float
+    # exactly, and frexp's exponent gives the bit length
+    remaining = (hashes << np.uint64(precision)) >> np.uint64(11)
+    _, exponent = np.frexp(remaining.astype(np.float64))
+    rank = np.where(remaining == 0, 54, 54 - exponent).astype(np.uint8)
+    frame = pd.DataFrame({key: df[key].to_numpy() for key in by})
+    frame[REGISTER], frame[RANK] = register, rank
+    return frame.groupby(by + [REGISTER], sort=False, observed=True, as_index=False)[RANK].max()
+
+
+def hll_merge(frames, by):
+    return pd.concat(frames).groupby(by + [REGISTER], sort=False, observed=True, as_index=False)[RANK].max()
+
+
+def hll_estimate(frame, by, precision):
+    """Estimated distinct count per group, with linear counting for small cardinalities."""
+    registers = 2 ** precision
+    inverse = frame.assign(**{RANK: np.ldexp(1.0, -frame[RANK].astype(np.int64))})
+    grouped = inverse.groupby(by, sort=True, observed=True)[RANK]
+    touched, inverse_sum = grouped.size(), grouped.sum()
+    empty = registers - touched
+    raw = _hll_alpha(registers) * registers ** 2 / (inverse_sum + empty)
+    with np.errstate(divide='ignore'):
+        linear = registers * np.log(registers / empty)
+    estimate = raw.where((raw > 2.5 * registers) | (empty == 0), linear)
+    return estimate.round().astype('int64')
+
+
+def merge_sketch(frames, by):
+    """Merge per-chunk frames of one sketch."""
+    return hll_merge(frames, by)
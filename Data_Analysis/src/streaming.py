@@ -0,0 +1,97 @@
+"""Chunked streaming analysis: per-chunk preprocessing with mergeable partial aggregates."""
+
+import pandas as pd
+
+from .analysis import (
+    report_profitability, report_rfm, report_products,
+    PROFITABILITY_GROUPS, RFM_GROUPS, PRODUCT_GROUPS
+)
+from .loader import iter_orders
+from .metrics import approximate, partial_aggregate, merge_partials, finalize, PROFITABILITY_METRICS, RFM_METRICS, PRODUCT_METRICS
+from .preprocessing_pipeline import parse_dates, add_derived_columns, categorize_order_size
+
+DEFAULT_CHUNKSIZE = 100_000
+
+STREAMED_ANALYSES = {
+    'profitability': (PROFITABILITY_GROUPS, PROFITABILITY_METRICS),
+    'rfm': (RFM_GROUPS, RFM_METRICS),
+    'product': (PRODUCT_GROUPS, PRODUCT_METRICS),
+}
+
+
+def streamed_analyses(approximate_error=None):
+    # Exact specs, or specs whose distinct counts are bounded-memory HyperLogLog sketches
+    if approximate_error is None:
+        return STREAMED_ANALYSES
+    return {name: (by, approximate(spec, approximate_error)) for name, (by, spec) in STREAMED_ANALYSES.items()}
+
+
+def iter_chunks(source_path, chunksize=DEFAULT_CHUNKSIZE):
+    # Read the sales file in fixed-size chunks and run the preprocessing stages on each
+    for chunk in iter_orders(source_path, chunksize, parse_dates=False):
+        yield (chunk
+            .pipe(parse_dates)
+            .pipe(add_derived_columns)
+            .pipe(categorize_order_size)
+        )
+
+
+def chunk_state(chunk, analyses=STREAMED_ANALYSES):
+    # Mergeable partial aggregates for one preprocessed chunk
+    return {
+        'rows': len(chunk),
+        'total_sales': chunk['Sales'].sum(),
+        'min_order_date': chunk['Order Date'].min(),
+        'max_order_date': chunk['Order Date'].max(),
+        'partials': {name: partial_aggregate(chunk, by, spec) for name, (by, spec) in analyses.items()},
+    }
+
+
+def merge_states(left, right):
+    # Combine two chunk states; associative so chunks can be folded in any grouping
+    if left is None:
+        return right
+    return {
+        'rows': left['rows'] + right['rows'],
+        'total_sales': left['total_sales'] + right['total_sales'],
+        'min_order_date': min(left['min_order_date'], right['min_order_date']),
+        'max_order_date': max(left['max_order_date'], right['max_order_date']),
+        'partials': {
+            name: merge_partials([left['partials'][name], right['partials'][name]])
+            for name in left['partials']
+        },
+    }
+
+
+def stream_state(source_path, chunksize=DEFAULT_CHUNKSIZE, analyses=STREAMED_ANALYSES):
+    # Fold chunks into a running state so memory is bounded by group count, not row count
+    state = None
+    for chunk in iter_chunks(source_path, chunksize):
+        state = merge_states(state, chunk_state(chunk, analyses))
+    if state is None:
+        raise ValueError(f"No rows found in {source_path}")
+    return state
+
+
+def finalize_state(state, analyses=STREAMED_ANALYSES):
+    # Final metric tables for each analysis, identical to the in-memory aggregate() results
+    reference_date = state['max_order_date'] + pd.Timedelta(days=1)
+    partials = state['partials']
+    return {
+        'profitability': finalize(partials['profitability'], analyses['profitability'][1]),
+        'rfm': finalize(partials['rfm'], analyses['rfm'][1], reference_date=reference_date),
+        'product': finalize(partials['product'], analyses['product'][1], totals={'Sales': state['total_sales']}),
+    }
+
+
+def run_streaming_analysis(source_path, summary_file, chunksize=DEFAULT_CHUNKSIZE, approximate_error=None):
+    analyses = streamed_analyses(approximate_error)
+    state = stream_state(source_path, chunksize, analyses)
+    print(f"Streamed {state['rows']:,} records in chunks of {chunksize:,}")
+    print(f"\nDate range: {state['min_order_date']} to {state['max_order_date']}")
+
+    tables = finalize_state(state, analyses)
+    report_profitability(tables['profitability'], summary_file)
+    report_rfm(tables['rfm'], summary_file)
+    report_products(tables['product'], summary_file)
+    return tables
@@ -0,0 +1,85 @@
+"""Deterministic synthetic Superstore-shaped order data for tests and benchmarks."""
+
+import numpy as np
+import pandas as pd
+
+PRODUCT_HIERARCHY = {
+    'Furniture': ['Bookcases', 'Chairs', 'Furnishings', 'Tables'],
+    'Office Supplies': ['Appliances', 'Art', 'Binders', 'Envelopes', 'Fasteners',
+                        'Labels', 'Paper', 'Storage', 'Supplies'],
+    'Technology': ['Accessories', 'Copiers', 'Machines', 'Phones'],
+}
+REGION_STATES = {
+    'West': [('California', 'Los Angeles'), ('Washington', 'Seattle'), ('Arizona', 'Phoenix')],
+    'East': [('New York', 'New York City'), ('Pennsylvania', 'Philadelphia'), ('Ohio', 'Columbus')],
+    'Central': [('Texas', 'Houston'), ('Illinois', 'Chicago'), ('Michigan', 'Detroit')],
+    'South': [('Florida', 'Jacksonville'), ('Georgia', 'Atlanta'), ('Virginia', 'Richmond')],
+}
+SEGMENTS = ['Consumer', 'Corporate', 'Home Office']
+SHIP_MODES = ['Standard Class', 'Second Class', 'First Class', 'Same Day']
+DISCOUNTS = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.7, 0.8]
+DATE_FORMAT = '%m/%d/%Y'
+
+
+def generate_orders(rows, customers=800, products=1800, start='2014-01-03', end='2017-12-30',
+                    seed=0, raw_dates=True):
+    """
+    Generate `rows` Superstore-like order lines. Same arguments always give the same frame.
+    raw_dates=True returns dates as CSV-style strings, like a fresh pd.read_csv.
+    """
+    rng = np.random.default_rng(seed)
+    days = pd.date_range(start, end, freq='D')
+
+    # Each customer has a fixed name, segment and home region/state/city
+    customer_ids = np.array([f'CU-{i:06d}' for i in range(customers)], dtype=object)
+    customer_names = np.array([f'Customer {i}' for i in range(customers)], dtype=object)
+    customer_segment = rng.integers(0, len(SEGMENTS), customers)
+    locations = [(region, state, city) for region, places in REGION_STATES.items() for state, city in places]
+    customer_location = rng.integers(0, len(locations), customers)
+
+    # Each product belongs to one category/sub-category
+    sub_categories = [(category, sub) for category, subs in PRODUCT_HIERARCHY.items() for sub in subs]
+    product_sub = rng.integers(0, len(sub_categories), products)
+    product_ids = np.array([f'PR-{i:07d}' for i in range(products)], dtype=object)
+
+    customer = rng.integers(0, customers, rows)
+    product = rng.integers(0, products, rows)
+    order_day = rng.integers(0, len(days), rows)
+    ship_lag = rng.integers(0, 8, rows)
+    quantity = rng.integers(1, 15, rows)
+    discount = np.asarray(DISCOUNTS)[rng.integers(0, len(DISCOUNTS), rows)]
+    sales = np.round(rng.lognormal(4.5, 1.2, rows) * quantity / 3, 4)
+    margin = rng.normal(0.15, 0.2, rows) - discount * 0.6
+    profit = np.round(sales * margin, 4)
+
+    order_dates = days[order_day]
+    ship_dates = order_dates + pd.to_timedelta(ship_lag, unit='D')
+    if raw_dates:
+        # Format each distinct day once and index into it instead of formatting every row
+        order_dates = np.asarray(days.strftime(DATE_FORMAT), dtype=object)[order_day]
+        ship_days = pd.date_range(days[0], days[-1] + pd.Timedelta(days=7), freq='D')
+        ship_dates = np.asarray(ship_days.strftime(DATE_FORMAT), dtype=object)[order_day + ship_lag]
+
+    location = np.array(locations, dtype=object)[customer_location[customer]]
+    sub_category = np.array(sub_categories, dtype=object)[product_sub[product]]
+    return pd.DataFrame({
+        'Row ID': np.arange(1, rows + 1),
+        'Order ID': np.char.add('OR-', (order_day * 100_000 + customer).astype(str)).astype(object),
+        'Order Date': order_dates,
+        'Ship Date': ship_dates,
+        'Ship Mode': np.asarray(SHIP_MODES, dtype=object)[rng.integers(0, len(SHIP_MODES), rows)],
+        'Customer ID': customer_ids[customer],
+        'Customer Name': customer_names[customer],
+        'Segment': np.asarray(SEGMENTS, dtype=object)[customer_segment[customer]],
+        'Country': 'United States',
+        'City': location[:, 2],
+        'State': location[:, 1],
+        'Region': location[:, 0],
+        'Product ID': product_ids[product],
+        'Category': sub_category[:, 0],
+        'Sub-Category': sub_category[:, 1],
+        'Sales': sales,
+        'Quantity': quantity,
+        'Discount': discount,
+        'Profit': profit,
+    })
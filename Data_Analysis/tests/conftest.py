@@ -0,0 +1,14 @@
+"""Shared order fixtures. Every test's order data comes from src.synthetic.generate_orders."""
+
+import pytest
+from src.synthetic import generate_orders
+
+
+@pytest.fixture
+def write_orders(tmp_path):
+    # Write generate_orders(rows, **kwargs) to tmp_path/name as a latin1 CSV, like the download
+    def write(rows, name='orders.csv', **kwargs):
+        path = tmp_path / name
+        generate_orders(rows, **kwargs).to_csv(path, index=False, encoding='latin1')
+        return str(path)
+    return write
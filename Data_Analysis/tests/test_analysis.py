@@ -1,29 +1,9 @@
 import pytest
 import pandas as pd
-import numpy as np
-from datetime import timedelta
 import src
 @pytest.fixture
 def sample_df():
-    np.random.seed(42)
-    dates = pd.date_range('2024-01-01', periods=100, freq='D')
-    
-    return pd.DataFrame({
-        'Order Date': dates,
-        'Ship Date': dates + timedelta(days=2),
-        'Region': np.random.choice(['West', 'East', 'South', 'North'], 100),
-        'Category': np.random.choice(['Technology', 'Furniture', 'Office'], 100),
-        'Sub-Category': np.random.choice(['Phones', 'Chairs', 'Laptop', 'Storage'], 100),
-        'Customer ID': np.random.choice([f'C-{i}' for i in range(20)], 100),
-        'Customer Name': np.random.choice([f'Customer {i}' for i in range(20)], 100),
-        'Segment': np.random.choice(['Consumer', 'Corporate', 'Home'], 100),
-        'Sales': np.random.uniform(10, 1000, 100),
-        'Profit': np.random.uniform(-50, 300, 100),
-        'Profit Margin': np.random.uniform(-10, 30, 100),
-        'Quantity': np.random.randint(1, 10, 100),
-        'Discount': np.random.uniform(0, 0.3, 100),
-        'Product ID': np.random.choice([f'PID-{i}' for i in range(30)], 100)
-    })
+    return src.run_preprocessing(src.generate_orders(100, customers=20, seed=42))
 
 
 def test_calculate_profitability_metrics(sample_df):
@@ -33,7 +13,7 @@ def test_calculate_profitability_metrics(sample_df):
     assert 'Total_Profit' in result
     assert 'Order_Count' in result
     assert result['Order_Count'] == len(sample_df)
-    assert result['Total_Sales'] == sample_df['Sales'].sum()
+    assert result['Total_Sales'] == pytest.approx(sample_df['Sales'].sum())
 
 
 def test_calculate_rfm(sample_df):
@@ -46,7 +26,7 @@ def test_calculate_rfm(sample_df):
     assert 'Frequency' in result
     assert 'Monetary' in result
     assert result['Frequency'] == len(customer_data)
-    assert result['Monetary'] == customer_data['Sales'].sum()
+    assert result['Monetary'] == pytest.approx(customer_data['Sales'].sum())
 
 
 def test_calculate_product_metrics(sample_df):
@@ -55,7 +35,7 @@ def test_calculate_product_metrics(sample_df):
     assert 'Revenue' in result
     assert 'Profit' in result
     assert 'Units_Sold' in result
-    assert result['Revenue'] == sample_df['Sales'].sum()
+    assert result['Revenue'] == pytest.approx(sample_df['Sales'].sum())
     assert result['Units_Sold'] == sample_df['Quantity'].sum()
 
 
@@ -0,0 +1,116 @@
+import io
+import json
+import multiprocessing
+import os
+import re
+import pytest
+import pandas as pd
+import src
+from src.batch import discover_inputs, output_names, run_batch
+from src.streaming import finalize_state, chunk_state
+from src.synthetic import generate_orders
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    stores = tmp_path / 'stores'
+    stores.mkdir()
+    for seed in range(3):
+        generate_orders(400, customers=60, seed=seed).to_csv(stores / f'store_{seed}.csv', index=False, encoding='latin1')
+    return stores
+
+
+def test_discover_inputs_from_directory_and_manifest(store_dir, tmp_path):
+    found = discover_inputs(str(store_dir))
+    assert [p.rsplit('/', 1)[-1] for p in found] == ['store_0.csv', 'store_1.csv', 'store_2.csv']
+
+    manifest = tmp_path / 'manifest.txt'
+    manifest.write_text('# nightly\nstores/store_1.csv\n\nstores/store_2.csv\n')
+    assert discover_inputs(str(manifest)) == [str(store_dir / 'store_1.csv'), str(store_dir / 'store_2.csv')]
+
+    json_manifest = tmp_path / 'manifest.json'
+    json_manifest.write_text(json.dumps({'inputs': [str(store_dir / 'store_0.csv')]}))
+    assert discover_inputs(str(json_manifest)) == [str(store_dir / 'store_0.csv')]
+
+
+def test_batch_writes_summaries_rollup_and_report(store_dir, tmp_path):
+    broken = store_dir / 'broken.csv'
+    broken.write_text('Region,Sales\nWest,1\n')
+    output = tmp_path / 'out'
+    inputs = discover_inputs(str(store_dir))
+    batch_report = run_batch(inputs, str(output), max_workers=2, retries=1)
+
+    # Bad input fails the same way every time, so it is not retried
+    assert batch_report['succeeded'] == 3 and batch_report['failed'] == 1
+    assert batch_report['retries'] == 0
+    assert batch_report['failures'][str(broken)]['attempts'] == 1
+    assert batch_report['rows'] == 1200 and batch_report['rows_per_second'] > 0
+    assert json.loads((output / 'batch_report.json').read_text())['succeeded'] == 3
+
+    # Each summary matches a standalone run over the same input
+    expected = io.StringIO()
+    df = src.run_preprocessing(source_path=str(store_dir / 'store_1.csv'))
+    for analysis in src.ANALYSES.values():
+        analysis(df, expected)
+    assert (output / 'store_1.txt').read_text() == expected.getvalue()
+
+    # The rollup equals the analyses over all successful inputs concatenated
+    combined = src.run_preprocessing(pd.concat(
+        [pd.read_csv(store_dir / f'store_{seed}.csv', encoding='latin1') for seed in range(3)], ignore_index=True))
+    rollup = io.StringIO()
+    tables = finalize_state(chunk_state(combined))
+    src.report_profitability(tables['profitability'], rollup)
+    src.report_rfm(tables['rfm'], rollup)
+    src.report_products(tables['product'], rollup)
+    # Summation order differs between the two paths, so compare at 4 decimals
+    def rounded(text):
+        return re.sub(r'\d+\.\d+', lambda number: f"{float(number.group()):.4f}", text)
+    assert rounded((output / 'rollup.txt').read_text()).endswith(rounded(rollup.getvalue()))
+
+
+def test_colliding_and_reserved_input_names_get_distinct_summaries(tmp_path):
+    inputs = []
+    for directory, name in [('east', 'store'), ('west', 'store'), ('west', 'rollup'), ('west', 'other')]:
+        (tmp_path / directory).mkdir(exist_ok=True)
+        path = tmp_path / directory / f'{name}.csv'
+        generate_orders(200, customers=30, seed=len(inputs)).to_csv(path, index=False, encoding='latin1')
+        inputs.append(str(path))
+    names = output_names(inputs)
+    assert len(set(names.values())) == 4 and names[inputs[3]] == 'other'
+    assert all(re.fullmatch(r'(store|rollup)-[0-9a-f]{8}', names[path]) for path in inputs[:3])
+
+    output = tmp_path / 'out'
+    batch_report = run_batch(inputs, str(output), max_workers=1)
+    assert batch_report['succeeded'] == 4
+    assert sorted(p.name for p in output.glob('*.txt')) == sorted([f'{name}.txt' for name in names.values()] + ['rollup.txt'])
+    assert (output / 'rollup.txt').read_text().startswith('Combined rollup of 4 inputs')
+    assert all(result['worker_peak_rss_mb'] > 0 for result in batch_report['results'].values())
+
+
+def crash_on_small_input(df, summary_file):
+    # Simulates a worker killed mid-task (e.g. by the OOM killer)
+    if len(df) < 100:
+        os._exit(1)
+
+
+def count_orders(df, summary_file):
+    summary_file.write(f"Orders: {len(df)}\n")
+
+
+def test_crashed_worker_is_charged_only_to_its_input(store_dir, tmp_path, monkeypatch):
+    generate_orders(50, customers=10, seed=9).to_csv(store_dir / 'tiny.csv', index=False, encoding='latin1')
+    monkeypatch.setitem(src.ANALYSES, 'crash', crash_on_small_input)
+    batch_report = run_batch(discover_inputs(str(store_dir)), str(tmp_path / 'out'), max_workers=2, retries=1)
+
+    assert batch_report['succeeded'] == 3
+    assert all(result['attempts'] == 1 for result in batch_report['results'].values())
+    failure = batch_report['failures'][str(store_dir / 'tiny.csv')]
+    assert failure['attempts'] == 2 and failure['error'].startswith('BrokenProcessPool')
+
+
+def test_runtime_registered_analyses_reach_spawned_workers(store_dir, tmp_path, monkeypatch):
+    monkeypatch.setitem(src.ANALYSES, 'orders', count_orders)
+    output = tmp_path / 'out'
+    run_batch([str(store_dir / 'store_0.csv')], str(output), max_workers=1,
+              mp_context=multiprocessing.get_context('spawn'))
+    assert (output / 'store_0.txt').read_text().endswith("Orders: 400\n")
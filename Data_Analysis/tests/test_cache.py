@@ -0,0 +1,74 @@
+import os
+import pytest
+import pandas as pd
+import src
+from src.synthetic import generate_orders
+
+
+@pytest.fixture
+def source_csv(write_orders):
+    return write_orders(300, customers=3, seed=11)
+
+
+def append_order(path):
+    # One more order line with the same columns as the fixture
+    generate_orders(1, seed=12).to_csv(path, mode='a', header=False, index=False, encoding='latin1')
+
+
+def test_cache_miss_then_hit_returns_same_frame(source_csv, tmp_path, capsys):
+    cache_dir = str(tmp_path / 'cache')
+    first = src.run_preprocessing(source_path=source_csv, cache_dir=cache_dir)
+    assert 'Cache miss' in capsys.readouterr().out
+
+    second = src.run_preprocessing(source_path=source_csv, cache_dir=cache_dir)
+    assert 'Cache hit' in capsys.readouterr().out
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_cache_column_projection(source_csv, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    src.run_preprocessing(source_path=source_csv, cache_dir=cache_dir)
+
+    projected = src.run_preprocessing(source_path=source_csv, cache_dir=cache_dir, columns=['Sales', 'Order Size'])
+    assert list(projected.columns) == ['Sales', 'Order Size']
+
+
+def test_cache_invalidates_when_source_changes(source_csv, tmp_path, capsys):
+    cache_dir = str(tmp_path / 'cache')
+    src.run_preprocessing(source_path=source_csv, cache_dir=cache_dir)
+
+    append_order(source_csv)
+    capsys.readouterr()
+    refreshed = src.run_preprocessing(source_path=source_csv, cache_dir=cache_dir)
+
+    assert 'Cache miss' in capsys.readouterr().out
+    assert len(refreshed) == 301
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_cache_stores_under_fingerprint_taken_before_loading(source_csv, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / 'cache')
+    fingerprint = src.source_fingerprint(source_csv)
+    load_orders = src.preprocessing_pipeline.load_orders
+
+    def load_then_modify(path, **kwargs):
+        df = load_orders(path, **kwargs)
+        append_order(source_csv)
+        return df
+
+    monkeypatch.setattr(src.preprocessing_pipeline, 'load_orders', load_then_modify)
+    src.run_preprocessing(source_path=source_csv, cache_dir=cache_dir)
+    assert [name.rsplit('-', 1)[1] for name in os.listdir(cache_dir)] == [f"{fingerprint}.parquet"]
+
+
+def test_same_named_sources_in_different_directories_keep_separate_entries(source_csv, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    other = tmp_path / 'other'
+    other.mkdir()
+    other_csv = str(other / 'orders.csv')
+    pd.read_csv(source_csv).head(100).to_csv(other_csv, index=False, encoding='latin1')
+
+    src.run_preprocessing(source_path=source_csv, cache_dir=cache_dir)
+    src.run_preprocessing(source_path=other_csv, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 2
+    assert len(src.run_preprocessing(source_path=source_csv, cache_dir=cache_dir)) == 300
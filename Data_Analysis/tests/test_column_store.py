@@ -0,0 +1,75 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src
+from src.column_store import ColumnStore, build_column_store, store_fingerprint, run_column_store_analysis
+from src.synthetic import generate_orders
+
+
+@pytest.fixture
+def processed_df():
+    return src.run_preprocessing(generate_orders(3000, customers=200, seed=12))
+
+
+def test_round_trip_uses_mapped_compact_columns(processed_df, tmp_path):
+    store = build_column_store(processed_df, str(tmp_path / 'store'), fingerprint='abc')
+    assert store.rows == 3000 and store.columns == list(processed_df.columns)
+    assert store_fingerprint(str(tmp_path / 'store')) == 'abc'
+    assert isinstance(store.array('Sales'), np.memmap)
+    assert store.array('Customer ID').dtype == np.int16
+    assert store.array('Order Date').dtype == 'datetime64[ns]'
+
+    frame = store.frame(store.columns)
+    expected = processed_df.reset_index(drop=True)
+    for column in ['Sales', 'Quantity', 'Order Date', 'Shipping Days']:
+        pd.testing.assert_series_equal(frame[column], expected[column], check_dtype=False)
+    for column in ['Customer ID', 'Order Size', 'Order ID']:
+        assert frame[column].astype(str).tolist() == expected[column].astype(str).tolist()
+    assert frame['Order Size'].cat.ordered
+
+    block = store.frame(['Region'], 2500, 4000)
+    assert list(block.index) == list(range(2500, 3000))
+    with pytest.raises(KeyError):
+        store.frame(['Nope'])
+
+
+def test_chunked_build_matches_whole_frame(processed_df, tmp_path):
+    chunks = [processed_df.iloc[start:start + 700] for start in range(0, len(processed_df), 700)]
+    whole = build_column_store(processed_df, str(tmp_path / 'whole'))
+    chunked = build_column_store(iter(chunks), str(tmp_path / 'chunked'))
+
+    assert chunked.rows == whole.rows
+    assert chunked.meta['columns']['Customer ID']['categories'] == whole.meta['columns']['Customer ID']['categories']
+    pd.testing.assert_frame_equal(chunked.frame(chunked.columns), whole.frame(whole.columns))
+
+
+def test_chunked_build_widens_dtypes(tmp_path):
+    chunks = [pd.DataFrame({'Days': [1, 2], 'City': ['b', 'a']}),
+              pd.DataFrame({'Days': [np.nan, 4.5], 'City': ['c', None]})]
+    store = build_column_store(chunks, str(tmp_path / 'store'))
+    frame = store.frame(['Days', 'City'])
+    assert frame['Days'].tolist()[:2] == [1.0, 2.0] and np.isnan(frame['Days'][2])
+    assert list(frame['City'].cat.categories) == ['a', 'b', 'c']
+    assert frame['City'].astype(object).tolist()[:3] == ['b', 'a', 'c'] and pd.isna(frame['City'][3])
+
+
+def test_rebuild_replaces_store(processed_df, tmp_path):
+    directory = str(tmp_path / 'store')
+    build_column_store(processed_df, directory, fingerprint='old')
+    build_column_store(processed_df.head(10), directory, fingerprint='new')
+    assert ColumnStore(directory).rows == 10 and store_fingerprint(directory) == 'new'
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['store']
+
+
+def test_block_analysis_matches_in_memory(processed_df, tmp_path):
+    directory = str(tmp_path / 'store')
+    build_column_store(processed_df, directory)
+    blocked = io.StringIO()
+    run_column_store_analysis(directory, blocked, block_rows=700)
+    expected = io.StringIO()
+    for analysis in src.ANALYSES.values():
+        analysis(processed_df, expected)
+    assert blocked.getvalue() == expected.getvalue()
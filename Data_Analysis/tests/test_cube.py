@@ -0,0 +1,68 @@
+import pytest
+import pandas as pd
+import src
+
+
+@pytest.fixture(scope='module')
+def processed_df():
+    return src.run_preprocessing(src.generate_orders(4000, customers=300, seed=6))
+
+
+@pytest.fixture(scope='module')
+def cube(processed_df):
+    return src.TimeCube.build(processed_df)
+
+
+def test_rollup_matches_raw_groupby(processed_df, cube):
+    expected = processed_df.groupby('Region', observed=True)[['Sales', 'Profit']].sum()
+    result = cube.rollup('Region')
+
+    pd.testing.assert_frame_equal(result[['Sales', 'Profit']], expected, check_index_type=False, check_categorical=False)
+    assert result['Orders'].sum() == len(processed_df)
+
+
+def test_filtered_rollup_matches_raw_slice(processed_df, cube):
+    mask = (processed_df['Category'] == 'Technology') & processed_df['Order Year'].isin([2015, 2016])
+    expected = processed_df[mask].groupby('Segment', observed=True)['Sales'].sum()
+
+    result = cube.rollup('Segment', where={'Category': 'Technology', 'Order Year': [2015, 2016]})
+    assert result['Sales'].to_numpy() == pytest.approx(expected.to_numpy())
+
+
+def test_grand_total_and_ratios(processed_df, cube):
+    total = cube.rollup()
+    assert total['Sales'].iloc[0] == pytest.approx(processed_df['Sales'].sum())
+    assert total['Profit_Margin'].iloc[0] == pytest.approx(processed_df['Profit'].sum() / processed_df['Sales'].sum() * 100)
+
+
+def test_period_over_period(processed_df, cube):
+    result = cube.period_over_period('Region', period='year', where={'Region': 'West'})
+    yearly = processed_df[processed_df['Region'] == 'West'].groupby('Order Year')['Sales'].sum()
+
+    assert result['Order Year'].tolist() == yearly.index.tolist()
+    assert pd.isna(result['Previous'].iloc[0])
+    assert result['Change'].iloc[1] == pytest.approx(yearly.iloc[1] - yearly.iloc[0])
+
+
+def test_period_over_period_skips_gap_periods(processed_df):
+    # West has no orders in 2016, so 2017 has no previous year rather than 2015
+    gapped = processed_df[~((processed_df['Region'] == 'West') & (processed_df['Order Year'] == 2016))]
+    result = src.TimeCube.build(gapped).period_over_period('Region', period='year')
+    west = result[result['Region'] == 'West'].set_index('Order Year')
+    east = result[result['Region'] == 'East'].set_index('Order Year')
+
+    assert 2016 not in west.index
+    assert pd.isna(west.loc[2017, 'Previous']) and pd.isna(west.loc[2017, 'Change'])
+    assert west.loc[2015, 'Previous'] == pytest.approx(west.loc[2014, 'Sales'])
+    assert east.loc[2017, 'Previous'] == pytest.approx(east.loc[2016, 'Sales'])
+
+    quarterly = src.TimeCube.build(gapped).period_over_period('Region', period='quarter', where={'Region': 'West'})
+    first_2017 = quarterly[(quarterly['Order Year'] == 2017) & (quarterly['Order Quarter'] == 'Q1')]
+    assert pd.isna(first_2017['Previous'].iloc[0])
+
+
+def test_cube_round_trips_through_parquet(cube, tmp_path):
+    path = cube.save(str(tmp_path / 'cube.parquet'))
+    loaded = src.TimeCube.load(path)
+
+    pd.testing.assert_frame_equal(loaded.rollup('Category'), cube.rollup('Category'))
@@ -0,0 +1,58 @@
+import io
+import pytest
+import pandas as pd
+import src
+
+
+@pytest.fixture
+def raw_df():
+    return src.generate_orders(2000, customers=150, seed=8)
+
+
+def test_product_analysis_skips_unneeded_steps(raw_df):
+    dag = src.PreprocessingDAG(raw_df.copy())
+    frame = dag.require(src.ANALYSIS_COLUMNS['product'])
+
+    assert dag.completed == []
+    assert list(frame.columns) == src.ANALYSIS_COLUMNS['product']
+
+
+def test_steps_run_in_dependency_order_once(raw_df):
+    dag = src.PreprocessingDAG(raw_df.copy())
+    dag.require(['Shipping Days'])
+    assert set(dag.completed[:2]) == {'parse Order Date', 'parse Ship Date'}
+    assert dag.completed[2:] == ['derive Shipping Days']
+
+    dag.require(['Order Year', 'Shipping Days'])
+    assert dag.completed[3:] == ['derive Order Year']
+
+
+def test_lazy_analyses_match_eager_pipeline(raw_df):
+    expected = io.StringIO()
+    df = src.run_preprocessing(raw_df.copy())
+    for analysis in src.ANALYSES.values():
+        analysis(df, expected)
+
+    result = io.StringIO()
+    dag = src.run_analyses_lazily(raw_df.copy(), result)
+
+    assert result.getvalue() == expected.getvalue()
+    assert 'parse Ship Date' not in dag.completed
+
+
+def test_registered_step_is_resolved(raw_df):
+    @src.preprocessing_step('net sales', inputs=['Sales', 'Discount'], outputs=['Net Sales'])
+    def net_sales(df):
+        df['Net Sales'] = df['Sales'] * (1 - df['Discount'])
+        return df
+
+    try:
+        frame = src.PreprocessingDAG(raw_df.copy()).require(['Net Sales'])
+        assert frame['Net Sales'].equals(raw_df['Sales'] * (1 - raw_df['Discount']))
+    finally:
+        src.dag.PREPROCESSING_STEPS.pop('net sales')
+
+
+def test_unknown_column_raises(raw_df):
+    with pytest.raises(KeyError):
+        src.PreprocessingDAG(raw_df).require(['Not A Column'])
@@ -0,0 +1,102 @@
+import os
+import pytest
+import src
+from src import dataset_store
+
+DATASET = "vivek468/superstore-dataset-final"
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    source = tmp_path / 'download'
+    source.mkdir()
+    (source / 'Sample - Superstore.csv').write_text('Row ID,Sales\n1,10.0\n', encoding='latin1')
+    return str(source)
+
+
+def test_local_source_is_imported_and_verified(source_dir, tmp_path):
+    data_dir = str(tmp_path / 'data')
+    src.fetch_data(DATASET, data_dir=data_dir, source=source_dir)
+
+    assert os.path.exists(os.path.join(data_dir, 'Sample - Superstore.csv'))
+    assert src.verify_dataset(DATASET, data_dir)
+
+
+def test_verified_copy_is_reused_without_download(source_dir, tmp_path, monkeypatch):
+    data_dir = str(tmp_path / 'data')
+    src.fetch_data(DATASET, data_dir=data_dir, source=source_dir)
+
+    def fail_download(*args, **kwargs):
+        raise AssertionError("should not download")
+    monkeypatch.setattr(dataset_store, 'download_dataset', fail_download)
+
+    assert src.fetch_data(DATASET, data_dir=data_dir) == data_dir
+
+
+def test_corrupted_copy_fails_verification(source_dir, tmp_path):
+    data_dir = str(tmp_path / 'data')
+    src.fetch_data(DATASET, data_dir=data_dir, source=source_dir)
+    path = os.path.join(data_dir, 'Sample - Superstore.csv')
+    with open(path, 'w', encoding='latin1') as data:
+        data.write('Row ID,Sales\n1,99.0\n')
+    os.utime(path, ns=(0, 0))
+
+    assert not src.verify_dataset(DATASET, data_dir)
+
+
+def test_touched_copy_is_rehashed_once(source_dir, tmp_path, monkeypatch):
+    data_dir = str(tmp_path / 'data')
+    src.fetch_data(DATASET, data_dir=data_dir, source=source_dir)
+    path = os.path.join(data_dir, 'Sample - Superstore.csv')
+    os.utime(path, ns=(0, 0))
+
+    assert src.verify_dataset(DATASET, data_dir)
+    assert dataset_store.load_manifest(data_dir)[DATASET]['files']['Sample - Superstore.csv']['mtime_ns'] == 0
+
+    def fail_hash(path):
+        raise AssertionError("should not rehash")
+    monkeypatch.setattr(dataset_store, 'file_sha256', fail_hash)
+    assert src.verify_dataset(DATASET, data_dir)
+
+
+def test_unchanged_source_is_not_copied_again(source_dir, tmp_path, monkeypatch):
+    data_dir = str(tmp_path / 'data')
+    src.fetch_data(DATASET, data_dir=data_dir, source=source_dir)
+    source_file = os.path.join(source_dir, 'Sample - Superstore.csv')
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should not copy or hash")
+    monkeypatch.setattr(dataset_store.shutil, 'copy2', fail)
+    monkeypatch.setattr(dataset_store, 'file_sha256', fail)
+    src.fetch_data(DATASET, data_dir=data_dir, source=source_dir)
+
+    # Touched but identical: hashed once, still not copied
+    monkeypatch.undo()
+    monkeypatch.setattr(dataset_store.shutil, 'copy2', fail)
+    os.utime(source_file, ns=(0, 0))
+    src.fetch_data(DATASET, data_dir=data_dir, source=source_dir)
+
+    # Changed contents are copied
+    monkeypatch.undo()
+    with open(source_file, 'w', encoding='latin1') as data:
+        data.write('Row ID,Sales\n1,20.0\n')
+    src.fetch_data(DATASET, data_dir=data_dir, source=source_dir)
+    with open(os.path.join(data_dir, 'Sample - Superstore.csv'), encoding='latin1') as copied:
+        assert copied.read().endswith('20.0\n')
+    assert src.verify_dataset(DATASET, data_dir)
+
+
+def test_offline_without_copy_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        src.fetch_data(DATASET, data_dir=str(tmp_path / 'data'), offline=True)
+
+
+def test_refresh_downloads_again(source_dir, tmp_path, monkeypatch):
+    data_dir = str(tmp_path / 'data')
+    src.fetch_data(DATASET, data_dir=data_dir, source=source_dir)
+    calls = []
+    monkeypatch.setattr(dataset_store, 'download_dataset',
+                        lambda dataset, data_dir, refresh: calls.append(refresh) or data_dir)
+
+    src.fetch_data(DATASET, data_dir=data_dir, refresh=True)
+    assert calls == [True]
@@ -0,0 +1,56 @@
+import pandas as pd
+import pytest
+
+import src
+from src.loader import load_orders, iter_orders, parse_date_series
+
+
+@pytest.fixture
+def orders_csv(write_orders):
+    return write_orders(300, seed=2)
+
+
+def test_parse_date_series_matches_inference():
+    raw = pd.Series(['01/03/2014', '12/30/2017', None, '01/03/2014'], name='Order Date')
+    parsed = parse_date_series(raw)
+    expected = pd.to_datetime(raw)
+    pd.testing.assert_series_equal(parsed, expected)
+    # Already-parsed columns pass through untouched
+    assert parse_date_series(parsed) is parsed
+
+
+def test_parse_date_series_falls_back_on_other_formats():
+    parsed = parse_date_series(pd.Series(['2014-01-03', '2017-12-30']))
+    assert list(parsed.dt.year) == [2014, 2017]
+
+
+@pytest.mark.parametrize('engine', ['c', 'pyarrow'])
+def test_load_orders_applies_schema_and_projection(orders_csv, engine):
+    if engine == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    df = load_orders(orders_csv, columns=['Sales', 'Order Date', 'Quantity'], engine=engine)
+    assert list(df.columns) == ['Order Date', 'Sales', 'Quantity']
+    assert df['Order Date'].dtype == 'datetime64[ns]'
+    assert df['Quantity'].dtype == 'int64'
+    expected = pd.read_csv(orders_csv, encoding='latin1')
+    pd.testing.assert_series_equal(df['Sales'], expected['Sales'])
+    pd.testing.assert_series_equal(df['Order Date'], pd.to_datetime(expected['Order Date']))
+
+
+def test_load_orders_rejects_unknown_columns(orders_csv):
+    with pytest.raises(KeyError):
+        load_orders(orders_csv, columns=['Sales', 'Not A Column'])
+
+
+def test_iter_orders_concatenates_to_full_load(orders_csv):
+    chunks = list(iter_orders(orders_csv, chunksize=100))
+    assert len(chunks) == 3
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), load_orders(orders_csv, engine='c'))
+
+
+def test_analysis_source_columns_reads_only_raw_inputs():
+    columns = src.analysis_source_columns(['product'])
+    assert set(columns) <= set(src.SUPERSTORE_SCHEMA)
+    assert 'Order Date' not in columns
+    rfm_columns = src.analysis_source_columns(['rfm'])
+    assert 'Order Date' in rfm_columns and 'Customer ID' in rfm_columns
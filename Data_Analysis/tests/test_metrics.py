@@ -0,0 +1,138 @@
+import pytest
+import pandas as pd
+import numpy as np
+import src
+from src.metrics import (aggregate, ratio_of_sums, share_of_total, fraction_positive, nunique_of, count, mean_of,
+                         partial_aggregate, merge_partials, finalize)
+
+
+# Per-group reference implementations the compiled specs must match
+def reference_profitability(group_df):
+    return pd.Series({
+        'Total_Sales': group_df['Sales'].sum(),
+        'Total_Profit': group_df['Profit'].sum(),
+        'Avg_Profit_Margin': group_df['Profit Margin'].mean(),
+        'Order_Count': len(group_df),
+        'Avg_Order_Value': group_df['Sales'].mean(),
+        'Total_Quantity': group_df['Quantity'].sum(),
+        'Profitable_Orders_Pct': (group_df['Profit'] > 0).sum() / len(group_df) * 100,
+        'Avg_Discount': group_df['Discount'].mean() * 100
+    })
+
+
+def reference_rfm(customer_df, reference_date):
+    return pd.Series({
+        'Recency': (reference_date - customer_df['Order Date'].max()).days,
+        'Frequency': len(customer_df),
+        'Monetary': customer_df['Sales'].sum(),
+        'Avg_Order_Value': customer_df['Sales'].mean(),
+        'Total_Profit': customer_df['Profit'].sum(),
+        'Lifetime_Quantity': customer_df['Quantity'].sum(),
+        'Avg_Discount': customer_df['Discount'].mean()
+    })
+
+
+def reference_product(product_df, total_sales):
+    product_sales = product_df['Sales'].sum()
+    return pd.Series({
+        'Revenue': product_sales,
+        'Revenue_Share': (product_sales / total_sales * 100) if total_sales > 0 else 0,
+        'Profit': product_df['Profit'].sum(),
+        'Units_Sold': product_df['Quantity'].sum(),
+        'Orders': len(product_df),
+        'Avg_Price': product_df['Sales'].mean(),
+        'Profit_Margin': (product_df['Profit'].sum() / product_sales * 100) if product_sales > 0 else 0,
+        'Return_Rate': ((product_df['Profit'] < 0).sum() / len(product_df)) * 100,
+        'Unique_Customers': product_df['Customer ID'].nunique()
+    })
+
+
+@pytest.fixture
+def orders_df():
+    np.random.seed(3)
+    n = 2000
+    return pd.DataFrame({
+        'Order Date': pd.Timestamp('2022-01-01') + pd.to_timedelta(np.random.randint(0, 900, n), unit='D'),
+        'Region': np.random.choice(['West', 'East', 'South', 'Central'], n),
+        'Category': np.random.choice(['Technology', 'Furniture', 'Office Supplies'], n),
+        'Sub-Category': np.random.choice(['Phones', 'Chairs', 'Binders', 'Paper', 'Tables'], n),
+        'Customer ID': np.random.choice([f'C-{i}' for i in range(150)], n),
+        'Customer Name': 'Name',
+        'Segment': 'Consumer',
+        'Sales': np.random.uniform(1, 2000, n),
+        'Profit': np.random.uniform(-300, 600, n),
+        'Profit Margin': np.random.uniform(-50, 50, n),
+        'Quantity': np.random.randint(1, 10, n),
+        'Discount': np.random.choice([0, 0.1, 0.2, 0.5], n),
+    })
+
+
+def test_profitability_spec_matches_groupby_apply(orders_df):
+    by = ['Region', 'Category', 'Sub-Category']
+    expected = orders_df.groupby(by).apply(reference_profitability, include_groups=False)
+    result = aggregate(orders_df, by, src.PROFITABILITY_METRICS)
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_rfm_spec_matches_groupby_apply(orders_df):
+    by = ['Customer ID', 'Customer Name', 'Segment']
+    reference_date = orders_df['Order Date'].max() + pd.Timedelta(days=1)
+    expected = orders_df.groupby(by).apply(reference_rfm, reference_date=reference_date, include_groups=False)
+    result = aggregate(orders_df, by, src.RFM_METRICS, reference_date=reference_date)
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_product_spec_matches_groupby_apply(orders_df):
+    by = ['Category', 'Sub-Category']
+    total_sales = orders_df['Sales'].sum()
+    expected = orders_df.groupby(by).apply(reference_product, total_sales=total_sales, include_groups=False)
+    result = aggregate(orders_df, by, src.PRODUCT_METRICS, totals={'Sales': total_sales})
+
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_custom_spec_kinds():
+    df = pd.DataFrame({
+        'Key': ['a', 'a', 'b', 'b'],
+        'Sales': [10.0, 30.0, 0.0, 0.0],
+        'Profit': [5.0, -1.0, 2.0, 3.0],
+        'Customer ID': ['x', 'x', 'y', 'z'],
+    })
+    spec = {
+        'Margin': ratio_of_sums('Profit', 'Sales', scale=100),
+        'Share': share_of_total('Sales'),
+        'Winners': fraction_positive('Profit'),
+        'Customers': nunique_of('Customer ID'),
+        'Rows': count(),
+    }
+    result = aggregate(df, 'Key', spec)
+
+    assert result.loc['a', 'Margin'] == pytest.approx(10.0)
+    assert result.loc['b', 'Margin'] == 0
+    assert result.loc['a', 'Share'] == 1.0
+    assert result.loc['a', 'Winners'] == 0.5
+    assert result.loc['b', 'Customers'] == 2
+    assert result.loc['b', 'Rows'] == 2
+
+
+def test_missing_values_are_skipped_like_pandas():
+    df = pd.DataFrame({
+        'Key': ['a', 'a', 'a', 'b', 'b'],
+        'Sales': [10.0, np.nan, 30.0, np.nan, np.nan],
+        'Customer ID': ['x', None, 'x', None, 'y'],
+    })
+    spec = {'Avg': mean_of('Sales'), 'Customers': nunique_of('Customer ID'), 'Rows': count()}
+    expected = df.groupby('Key').agg(Avg=('Sales', 'mean'), Customers=('Customer ID', 'nunique'), Rows=('Sales', 'size'))
+
+    whole = aggregate(df, 'Key', spec)
+    # Split so each chunk holds a different mix of values and NaNs for the same group
+    chunks = merge_partials([partial_aggregate(df.iloc[:2], 'Key', spec), partial_aggregate(df.iloc[2:], 'Key', spec)])
+    for result in (whole, finalize(chunks, spec)):
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_days_since_requires_reference_date(orders_df):
+    with pytest.raises(ValueError):
+        aggregate(orders_df, 'Customer ID', src.RFM_METRICS)
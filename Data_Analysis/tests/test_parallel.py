@@ -0,0 +1,55 @@
+import io
+import multiprocessing
+import pytest
+import pandas as pd
+import src
+from src.parallel import share_frame, attach_frame
+
+
+@pytest.fixture
+def processed_df():
+    return src.run_preprocessing(src.generate_orders(1200, customers=150, seed=9))
+
+
+def order_count_analysis(df, summary_file):
+    summary_file.write(f"\nOrders: {len(df)}\n")
+
+
+def test_shared_frame_round_trip(processed_df):
+    block, layout = share_frame(processed_df)
+    try:
+        view_block, shared = attach_frame(layout)
+        pd.testing.assert_frame_equal(shared.astype(processed_df.dtypes.to_dict()), processed_df)
+        del shared
+        view_block.close()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def test_parallel_output_matches_sequential(processed_df):
+    expected = io.StringIO()
+    src.profitability_metrics(processed_df, expected)
+    src.RFM_Analysis(processed_df, expected)
+    src.product_analysis(processed_df, expected)
+
+    result = io.StringIO()
+    src.run_parallel_analyses(processed_df, result)
+
+    assert result.getvalue() == expected.getvalue()
+
+
+def test_registered_analysis_runs_in_order(processed_df):
+    src.register_analysis('orders')(order_count_analysis)
+    try:
+        result = io.StringIO()
+        src.run_parallel_analyses(processed_df, result, names=['orders', 'product'])
+        assert result.getvalue().startswith(f"\nOrders: {len(processed_df)}\n")
+        # Spawned workers start from a fresh import, without the runtime registration
+        spawned = io.StringIO()
+        src.run_parallel_analyses(processed_df, spawned, names=['orders', 'product'],
+                                  mp_context=multiprocessing.get_context('spawn'))
+        assert spawned.getvalue() == result.getvalue()
+    finally:
+        src.ANALYSES.pop('orders')
+        src.ANALYSIS_COLUMNS.pop('orders')
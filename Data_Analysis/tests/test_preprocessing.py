@@ -0,0 +1,78 @@
+import pytest
+import pandas as pd
+import numpy as np
+from datetime import timedelta
+import src
+from src.preprocessing_pipeline import parse_dates, add_derived_columns, categorize_order_size
+
+
+# Row-wise reference implementations the vectorized derivations must match
+def reference_derived_columns(df):
+    df['Profit Margin'] = df.apply(lambda row: (row['Profit'] / row['Sales'] * 100) if row['Sales'] > 0 else 0, axis=1)
+    df['Shipping Days'] = df.apply(lambda row: (row['Ship Date'] - row['Order Date']).days, axis=1)
+    df['Order Year'] = df['Order Date'].apply(lambda x: x.year)
+    df['Order Month'] = df['Order Date'].apply(lambda x: x.month)
+    df['Order Quarter'] = df['Order Date'].apply(lambda x: f"Q{x.quarter}")
+    df['Order Size'] = df['Sales'].apply(
+        lambda x: 'Small' if x < 100 else 'Medium' if x < 500 else 'Large' if x < 2000 else 'Extra Large'
+    )
+    return df
+
+
+@pytest.fixture
+def raw_df():
+    np.random.seed(7)
+    dates = pd.date_range('2021-11-15', periods=400, freq='D')
+    sales = np.random.uniform(0, 3000, 400)
+    # Edge cases: zero sales and exact bucket boundaries
+    sales[:6] = [0, 100, 500, 2000, 99.999, 1999.99]
+    return pd.DataFrame({
+        'Order Date': dates.strftime('%m/%d/%Y'),
+        'Ship Date': (dates + pd.to_timedelta(np.random.randint(0, 8, 400), unit='D')).strftime('%m/%d/%Y'),
+        'Sales': sales,
+        'Profit': np.random.uniform(-500, 800, 400),
+    })
+
+
+def test_vectorized_derivations_match_rowwise_reference(raw_df):
+    expected = reference_derived_columns(parse_dates(raw_df.copy()))
+    result = categorize_order_size(add_derived_columns(parse_dates(raw_df.copy())))
+
+    # Derived labels are categorical; values must match the row-wise strings
+    assert isinstance(result['Order Size'].dtype, pd.CategoricalDtype)
+    assert isinstance(result['Order Quarter'].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(result.astype(expected.dtypes.to_dict()), expected[result.columns])
+
+
+def test_run_preprocessing_matches_reference(raw_df):
+    expected = reference_derived_columns(parse_dates(raw_df.copy()))
+    result = src.run_preprocessing(raw_df.copy())
+
+    pd.testing.assert_frame_equal(result.astype(expected.dtypes.to_dict()), expected)
+
+
+def test_order_size_boundaries(raw_df):
+    result = categorize_order_size(raw_df.copy())
+    assert result['Order Size'].iloc[:6].tolist() == ['Small', 'Medium', 'Large', 'Extra Large', 'Small', 'Large']
+
+
+def test_zero_sales_margin_is_zero(raw_df):
+    result = add_derived_columns(parse_dates(raw_df.copy()))
+    assert result['Profit Margin'].iloc[0] == 0
+
+
+def test_declare_new_derived_column(raw_df):
+    @src.derived_column('Discounted Sales', inputs=['Sales'])
+    def discounted_sales(df):
+        return df['Sales'] * 0.9
+
+    try:
+        result = src.apply_derivations(raw_df.copy(), ['Discounted Sales'])
+        assert np.allclose(result['Discounted Sales'], raw_df['Sales'] * 0.9)
+    finally:
+        src.DERIVED_COLUMNS.pop('Discounted Sales')
+
+
+def test_derivation_reports_missing_inputs():
+    with pytest.raises(KeyError):
+        src.apply_derivations(pd.DataFrame({'Profit': [1.0]}), ['Profit Margin'])
@@ -0,0 +1,55 @@
+import json
+
+import pandas as pd
+
+import src
+from src import profiling
+from src.preprocessing_pipeline import run_preprocessing
+from src.synthetic import generate_orders
+
+
+def test_disabled_profiling_records_nothing():
+    assert profiling._active is None
+    df = run_preprocessing(generate_orders(200, seed=1))
+    assert len(df) == 200
+    assert profiling.span('anything') is profiling._DISABLED
+
+
+def test_profile_records_stages_and_analyses(tmp_path):
+    summary = tmp_path / 'summary.txt'
+    with src.profile() as profiler, open(summary, 'w') as summary_file:
+        df = run_preprocessing(generate_orders(500, seed=1))
+        src.product_analysis(df, summary_file)
+    assert profiling._active is None
+
+    by_name = {record['name']: record for record in profiler.records}
+    for stage in ['parse_dates', 'add_derived_columns', 'categorize_order_size', 'compact_dtypes']:
+        assert by_name[stage]['rows_in'] == 500
+        assert by_name[stage]['rows_out'] == 500
+    analysis = by_name['product_analysis']
+    assert analysis['category'] == 'analysis'
+    assert analysis['rows_in'] == 500 and analysis['rows_out'] is None
+    assert analysis['wall_s'] >= 0 and analysis['cpu_s'] >= 0 and analysis['peak_mb'] >= 0
+    # Table renders nest inside the analysis span
+    assert any(r['category'] == 'render' and r['depth'] == 1 for r in profiler.records)
+
+    summary_table = profiler.summary()
+    assert ('analysis', 'product_analysis') in summary_table.index
+
+    profiler.save(str(tmp_path / 'profile'))
+    trace = json.loads((tmp_path / 'profile' / 'trace.json').read_text())
+    assert len(trace['spans']) == len(profiler.records)
+    chrome = json.loads((tmp_path / 'profile' / 'chrome_trace.json').read_text())
+    assert {event['ph'] for event in chrome['traceEvents']} == {'X'}
+
+
+def test_nested_span_peak_is_folded_into_parent():
+    with src.profile() as profiler:
+        with profiling.span('outer'):
+            with profiling.span('inner'):
+                block = bytearray(5_000_000)
+            del block
+    inner, outer = profiler.records
+    assert inner['name'] == 'inner' and outer['name'] == 'outer'
+    assert inner['peak_mb'] >= 4.9
+    assert outer['peak_mb'] >= inner['peak_mb']
@@ -0,0 +1,61 @@
+import io
+import json
+import pytest
+import pandas as pd
+import src
+
+
+@pytest.fixture
+def processed_df():
+    return src.run_preprocessing(src.generate_orders(3000, customers=200, seed=2))
+
+
+def run_all(df, summary):
+    src.profitability_metrics(df, summary)
+    src.RFM_Analysis(df, summary)
+    src.product_analysis(df, summary)
+
+
+def test_console_and_text_sinks_receive_identical_text(processed_df, capsys):
+    capsys.readouterr()
+    summary = io.StringIO()
+    run_all(processed_df, summary)
+
+    assert capsys.readouterr().out == summary.getvalue()
+    assert 'Top 10 Most Valuable Customers' in summary.getvalue()
+
+
+def test_headless_run_skips_string_rendering(processed_df, tmp_path, monkeypatch):
+    def fail_render(*args, **kwargs):
+        raise AssertionError("to_string should not be called without a text sink")
+    monkeypatch.setattr(pd.DataFrame, 'to_string', fail_render)
+
+    path = tmp_path / 'report.json'
+    with src.Report([src.JSONSink(str(path))]) as report:
+        run_all(processed_df, report)
+
+    tables = json.loads(path.read_text())
+    assert set(tables) >= {'top_profit_lines', 'performance_tiers', 'customer_segments',
+                           'top_customers', 'bcg_matrix', 'product_concentration'}
+    assert [row['Top_N'] for row in tables['product_concentration']] == [3, 5, 10]
+
+
+def test_parquet_sink_writes_one_file_per_table(processed_df, tmp_path):
+    with src.Report([src.ParquetSink(str(tmp_path))]) as report:
+        src.product_analysis(processed_df, report)
+
+    bcg = pd.read_parquet(tmp_path / 'bcg_matrix.parquet')
+    assert 'BCG_Category' in bcg.columns
+    assert (tmp_path / 'top_products.parquet').exists()
+
+
+def test_table_renders_once_for_many_text_sinks():
+    calls = []
+    frame = pd.DataFrame({'a': [1, 2]})
+    first, second = io.StringIO(), io.StringIO()
+    report = src.Report([src.TextSink(first), src.TextSink(second)])
+
+    report.table('t', frame, formatter=lambda f: calls.append(1) or 'rendered\n')
+
+    assert calls == [1]
+    assert first.getvalue() == second.getvalue() == 'rendered\n'
@@ -0,0 +1,95 @@
+import io
+
+import pandas as pd
+import pytest
+
+import src
+from src.result_cache import ResultCache, cached_analysis, frame_fingerprint, result_key
+from src.synthetic import generate_orders
+
+
+@pytest.fixture
+def processed_df():
+    return src.run_preprocessing(generate_orders(800, customers=90, seed=8))
+
+
+def test_frame_fingerprint_tracks_content(processed_df):
+    fingerprint = frame_fingerprint(processed_df)
+    assert frame_fingerprint(processed_df.copy()) == fingerprint
+    changed = processed_df.copy()
+    changed.loc[changed.index[3], 'Sales'] += 1
+    assert frame_fingerprint(changed) != fingerprint
+    assert frame_fingerprint(processed_df.head(799)) != fingerprint
+
+
+def test_frame_fingerprint_covers_every_row_and_column(processed_df):
+    fingerprint = frame_fingerprint(processed_df)
+    # Non-numeric columns, on a row no sample would pick
+    for column in ['Customer ID', 'Region', 'Order Date']:
+        changed = processed_df.copy()
+        changed.loc[changed.index[5], column] = changed.loc[changed.index[6], column]
+        if not changed.equals(processed_df):
+            assert frame_fingerprint(changed) != fingerprint, column
+    # Swapped numeric values keep every column sum
+    swapped = processed_df.copy()
+    first, second = swapped.index[5], swapped.index[6]
+    swapped.loc[[first, second], 'Sales'] = swapped.loc[[second, first], 'Sales'].to_numpy()
+    assert frame_fingerprint(swapped) != fingerprint
+
+
+def test_cached_replay_matches_direct_run(processed_df, tmp_path):
+    cache = ResultCache(str(tmp_path))
+    for name in src.ANALYSES:
+        expected = io.StringIO()
+        src.ANALYSES[name](processed_df, expected)
+        first, second = io.StringIO(), io.StringIO()
+        cached_analysis(cache, name, processed_df, first)
+        cached_analysis(cache, name, processed_df, second)
+        assert first.getvalue() == second.getvalue() == expected.getvalue()
+    assert cache.stats()['misses'] == 3 and cache.stats()['hits']['memory'] == 3
+
+    # A fresh process only has the disk tier
+    fresh = ResultCache(str(tmp_path))
+    cached_analysis(fresh, 'product', processed_df, io.StringIO())
+    assert fresh.stats()['hits'] == {'memory': 0, 'disk': 1}
+
+
+def test_parameters_are_part_of_the_key(processed_df):
+    cache = ResultCache()
+    cached_analysis(cache, 'rfm', processed_df, io.StringIO())
+    cached_analysis(cache, 'rfm', processed_df, io.StringIO(), reference_date='2018-06-30')
+    assert cache.stats()['misses'] == 2
+    assert result_key('rfm', 'f', {'a': 1}) != result_key('rfm', 'f', {'a': 2})
+
+
+def test_code_changes_invalidate_cached_results(processed_df, tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    cached_analysis(cache, 'product', processed_df, io.StringIO())
+
+    def product_v2(df, summary_file):
+        summary_file.write("new output\n")
+    monkeypatch.setitem(src.ANALYSES, 'product', product_v2)
+    output = io.StringIO()
+    cached_analysis(ResultCache(str(tmp_path)), 'product', processed_df, output)
+    assert output.getvalue() == "new output\n"
+
+    # A change anywhere in the package (here: a different package hash) misses as well
+    monkeypatch.undo()
+    monkeypatch.setattr(src.result_cache, '_package_version', lambda: 'edited')
+    fresh = ResultCache(str(tmp_path))
+    cached_analysis(fresh, 'product', processed_df, io.StringIO())
+    assert fresh.stats()['misses'] == 1
+
+
+def test_size_based_eviction(tmp_path):
+    cache = ResultCache(str(tmp_path), max_memory_bytes=2500, max_disk_bytes=2500)
+    for key in 'abc':
+        cache.put(key, b'x' * 1000)
+    stats = cache.stats()
+    assert stats['memory_entries'] == 2 and stats['evictions'] == {'memory': 1, 'disk': 1}
+    assert cache.get('a') is None
+    assert cache.get('c') == b'x' * 1000
+    # Oversized values skip memory but still reach disk when they fit there
+    small_memory = ResultCache(str(tmp_path / 'big'), max_memory_bytes=1000)
+    small_memory.put('big', b'y' * 2400)
+    assert 'big' not in small_memory.memory and small_memory.get('big') == b'y' * 2400
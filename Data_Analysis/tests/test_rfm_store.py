@@ -0,0 +1,89 @@
+import os
+import shutil
+import pytest
+import pandas as pd
+import src
+from src.analysis import RFM_GROUPS
+
+
+@pytest.fixture
+def order_files(tmp_path):
+    orders = src.generate_orders(1000, customers=120, start='2022-01-01', end='2022-12-31', seed=1)
+    customer = orders['Customer ID'].str[3:].astype(int)
+    recent = pd.to_datetime(orders['Order Date']) >= '2022-11-01'
+    history = orders[~recent & (customer < 100)]
+    # Delta touches some existing customers and introduces new ones
+    delta = orders[recent & (customer >= 90)]
+    history_path, delta_path = tmp_path / 'history.csv', tmp_path / 'delta.csv'
+    history.to_csv(history_path, index=False)
+    delta.to_csv(delta_path, index=False)
+    return str(history_path), str(delta_path), pd.concat([history, delta], ignore_index=True)
+
+
+def test_incremental_state_matches_full_recompute(order_files, tmp_path):
+    history_path, delta_path, combined = order_files
+    state_path = str(tmp_path / 'rfm_state.parquet')
+
+    state = src.update_rfm_state(state_path, delta_path, source_path=history_path)
+
+    combined = src.run_preprocessing(combined)
+    reference_date = combined['Order Date'].max() + pd.Timedelta(days=1)
+    expected = src.aggregate(combined, RFM_GROUPS, src.RFM_METRICS, reference_date=reference_date)
+    pd.testing.assert_frame_equal(src.rfm_from_state(state), expected, check_index_type=False, check_categorical=False)
+
+
+def test_state_is_persisted_and_delta_applied_once(order_files, tmp_path):
+    history_path, delta_path, _ = order_files
+    state_path = str(tmp_path / 'rfm_state.parquet')
+
+    first = src.update_rfm_state(state_path, delta_path, source_path=history_path)
+    second = src.update_rfm_state(state_path, delta_path)
+
+    pd.testing.assert_frame_equal(src.rfm_from_state(first), src.rfm_from_state(second))
+
+
+def test_missing_state_without_source_raises(order_files, tmp_path):
+    _, delta_path, _ = order_files
+    with pytest.raises(ValueError):
+        src.update_rfm_state(str(tmp_path / 'missing.parquet'), delta_path)
+
+
+def test_delta_is_recognised_by_content_and_ledger_lives_in_state(order_files, tmp_path):
+    history_path, delta_path, _ = order_files
+    state_path = str(tmp_path / 'rfm_state.parquet')
+    first = src.update_rfm_state(state_path, delta_path, source_path=history_path)
+
+    # A copy, or the same file with a new mtime, is still the delta that was already applied
+    copy_path = str(tmp_path / 'delta_copy.csv')
+    shutil.copy(delta_path, copy_path)
+    os.utime(delta_path, ns=(os.stat(delta_path).st_mtime_ns + 10**9,) * 2)
+    for path in (copy_path, delta_path):
+        pd.testing.assert_frame_equal(src.update_rfm_state(state_path, path), first)
+
+    state, applied = src.rfm_store.load_rfm_state(state_path)
+    assert applied == [src.dataset_store.file_sha256(delta_path)]
+    assert sorted(os.listdir(tmp_path)) == ['delta.csv', 'delta_copy.csv', 'history.csv', 'rfm_state.parquet']
+
+
+def test_state_missing_partial_columns_is_rejected(order_files, tmp_path):
+    history_path, delta_path, _ = order_files
+    state_path = str(tmp_path / 'rfm_state.parquet')
+    src.update_rfm_state(state_path, delta_path, source_path=history_path)
+
+    state, applied = src.rfm_store.load_rfm_state(state_path)
+    src.rfm_store.save_rfm_state(state.filter(regex='^(?!__count__)'), state_path, applied)
+    # Never rebuilt silently: that would drop the applied deltas and their ledger
+    with pytest.raises(ValueError, match='lacks columns'):
+        src.update_rfm_state(state_path, delta_path, source_path=history_path)
+
+
+def test_empty_history_builds_an_empty_state(order_files, tmp_path):
+    _, delta_path, _ = order_files
+    empty_path = tmp_path / 'empty.csv'
+    pd.read_csv(delta_path).head(0).to_csv(empty_path, index=False)
+    state_path = str(tmp_path / 'rfm_state.parquet')
+
+    empty = src.rfm_store.build_rfm_state(str(empty_path))
+    assert empty.empty and list(empty.columns) == src.metrics.partial_columns(src.RFM_METRICS)
+    state = src.update_rfm_state(state_path, delta_path, source_path=str(empty_path))
+    assert len(state) == pd.read_csv(delta_path)['Customer ID'].nunique()
@@ -0,0 +1,43 @@
+import pandas as pd
+import numpy as np
+import src
+
+
+def make_frame(n=1000):
+    rng = np.random.default_rng(4)
+    return pd.DataFrame({
+        'Region': rng.choice(['West', 'East', 'South', 'Central'], n),
+        'Customer ID': rng.choice([f'C-{i}' for i in range(50)], n),
+        'Order ID': [f'O-{i}' for i in range(n)],
+        'Quantity': rng.integers(1, 14, n),
+        'Row ID': np.arange(n),
+        'Sales': rng.uniform(1, 1000, n),
+    })
+
+
+def test_compact_dtypes_assigns_categoricals_and_downcasts():
+    df = src.compact_dtypes(make_frame(), report=False)
+
+    assert isinstance(df['Region'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['Customer ID'].dtype, pd.CategoricalDtype)
+    assert df['Order ID'].dtype == object
+    assert df['Quantity'].dtype == np.int8
+    assert df['Row ID'].dtype == np.int16
+    assert df['Sales'].dtype == np.float64
+
+
+def test_compact_dtypes_reports_smaller_frame(capsys):
+    original = make_frame()
+    before = src.frame_memory(original)
+    df = src.compact_dtypes(original.copy())
+
+    assert src.frame_memory(df) < before
+    assert 'Memory:' in capsys.readouterr().out
+
+
+def test_grouped_sums_on_downcast_columns_do_not_overflow():
+    df = src.compact_dtypes(make_frame(), report=False)
+    result = src.aggregate(df, 'Region', {'Units': src.metrics.sum_of('Quantity')})
+
+    assert result['Units'].dtype == np.int64
+    assert result['Units'].sum() == make_frame()['Quantity'].sum()
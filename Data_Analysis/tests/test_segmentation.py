@@ -0,0 +1,61 @@
+import pytest
+import pandas as pd
+import numpy as np
+import src
+
+
+# Reference scoring and row-wise segmentation the vectorized engine must reproduce
+def reference_segments(rfm_data):
+    rfm_data = rfm_data.copy()
+    rfm_data['R_Score'] = pd.cut(rfm_data['Recency'], bins=[-1, 90, 180, 365, 730, np.inf], labels=[5, 4, 3, 2, 1]).astype(int)
+    rfm_data['F_Score'] = pd.cut(rfm_data['Frequency'], bins=[0, 1, 4, 9, 19, np.inf], labels=[1, 2, 3, 4, 5]).astype(int)
+    rfm_data['M_Score'] = pd.cut(rfm_data['Monetary'], bins=[0, 499, 1999, 4999, 9999, np.inf], labels=[1, 2, 3, 4, 5]).astype(int)
+    rfm_data['RFM_Score'] = rfm_data['R_Score'] + rfm_data['F_Score'] + rfm_data['M_Score']
+    segment_customer = lambda row: (
+        'Champions' if row['RFM_Score'] >= 13
+        else 'Loyal Customers' if row['RFM_Score'] >= 10 and row['R_Score'] >= 4
+        else 'Big Spenders' if row['RFM_Score'] >= 10
+        else 'Frequent Buyers' if row['F_Score'] >= 4
+        else 'Recent Customers' if row['R_Score'] >= 4
+        else 'Potential Loyalists' if row['RFM_Score'] >= 7
+        else 'At Risk' if row['R_Score'] <= 2
+        else 'Needs Attention'
+    )
+    rfm_data['Customer_Segment'] = rfm_data.apply(segment_customer, axis=1)
+    return rfm_data
+
+
+@pytest.fixture
+def rfm_data():
+    rng = np.random.default_rng(21)
+    n = 5000
+    recency = rng.integers(0, 1500, n)
+    frequency = rng.integers(1, 40, n)
+    monetary = rng.uniform(0.5, 20000, n)
+    # Exact bin edges must land in the same (right-closed) bins as pd.cut
+    recency[:5] = [90, 180, 365, 730, 0]
+    frequency[:5] = [1, 4, 9, 19, 20]
+    monetary[:5] = [499, 1999, 4999, 9999, 10000]
+    return pd.DataFrame({'Recency': recency, 'Frequency': frequency, 'Monetary': monetary})
+
+
+def test_default_rules_match_rowwise_segmentation(rfm_data):
+    expected = reference_segments(rfm_data)
+    result = src.segment_rfm(rfm_data.copy())
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_custom_bins_and_rules(rfm_data):
+    bins = {'M_Score': ('Monetary', [0, 1000, np.inf], [1, 2])}
+    rules = [('High Value', [('M_Score', '==', 2)])]
+    result = src.segment_rfm(rfm_data.copy(), score_bins=bins, segment_rules=rules, default_segment='Other')
+
+    expected = np.where(rfm_data['Monetary'] > 1000, 'High Value', 'Other')
+    assert result['Customer_Segment'].tolist() == expected.tolist()
+    assert (result['RFM_Score'] == result['M_Score']).all()
+
+
+def test_values_outside_bins_raise():
+    with pytest.raises(ValueError):
+        src.bin_scores(np.array([-5.0, 10.0]), [0, 100, np.inf], [1, 2])
@@ -0,0 +1,135 @@
+import io
+import json
+import os
+import threading
+import urllib.request
+
+import pandas as pd
+import pytest
+
+import src
+from src.server import AnalysisService, apply_filters, make_server
+from src.synthetic import generate_orders
+
+
+@pytest.fixture
+def source_csv(tmp_path):
+    path = tmp_path / 'orders.csv'
+    generate_orders(600, customers=80, seed=6).to_csv(path, index=False, encoding='latin1')
+    return path
+
+
+@pytest.fixture
+def server(source_csv):
+    service = AnalysisService(str(source_csv), poll_interval=0.01)
+    httpd = make_server(service, port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield service, f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def fetch(url, body=None):
+    data = None if body is None else json.dumps(body).encode()
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data)) as response:
+            return response.status, response.read().decode()
+    except urllib.error.HTTPError as error:
+        return error.code, error.read().decode()
+
+
+def test_text_output_matches_direct_run(server, source_csv):
+    service, base = server
+    expected = io.StringIO()
+    src.product_analysis(src.run_preprocessing(source_path=str(source_csv)), expected)
+    status, body = fetch(f"{base}/product?format=text")
+    assert status == 200 and body == expected.getvalue()
+
+
+def test_json_filters_and_params(server):
+    service, base = server
+    status, body = fetch(f"{base}/profitability?Region=West,East")
+    payload = json.loads(body)
+    assert status == 200
+    assert {row['Region'] for row in payload['tables']['top_profit_lines']} <= {'West', 'East'}
+    assert payload['rows'] == service.snapshot.df['Region'].isin(['West', 'East']).sum()
+
+    rules = [['Everyone', [['RFM_Score', '>=', 0]]]]
+    status, body = fetch(f"{base}/rfm", {'filters': {'start': '2016-01-01'}, 'params': {'segment_rules': rules}})
+    segments = json.loads(body)['tables']['customer_segments']
+    assert status == 200 and [row['Customer_Segment'] for row in segments] == ['Everyone']
+
+
+def test_errors_and_health(server):
+    _, base = server
+    assert fetch(f"{base}/nope")[0] == 404
+    assert fetch(f"{base}/product?NoSuchColumn=1")[0] == 400
+    assert fetch(f"{base}/product", {'params': {'bogus': 1}})[0] == 400
+    status, body = fetch(f"{base}/health")
+    assert status == 200 and json.loads(body)['rows'] == 600
+
+
+def test_non_object_body_and_empty_filter_results(server):
+    _, base = server
+    status, body = fetch(f"{base}/product", [1, 2])
+    assert status == 400 and 'must be an object' in json.loads(body)['error']
+    # A filter that matches nothing is a valid request with empty tables
+    for name in src.ANALYSES:
+        status, body = fetch(f"{base}/{name}?Region=Nowhere")
+        payload = json.loads(body)
+        assert status == 200 and payload['rows'] == 0, name
+    assert json.loads(fetch(f"{base}/profitability?Region=Nowhere")[1])['tables']['top_profit_lines'] == []
+
+
+def test_failed_reload_returns_500_and_keeps_snapshot(server, source_csv):
+    service, base = server
+    old = service.snapshot
+    source_csv.write_text('not,a,superstore\n1,2,3\n')
+    status, body = fetch(f"{base}/reload", {})
+    assert status == 500 and 'Reload failed' in json.loads(body)['error']
+    assert service.snapshot is old
+
+
+def test_request_count_is_exact_under_concurrency(source_csv):
+    service = AnalysisService(str(source_csv), result_cache=src.ResultCache())
+    threads = [threading.Thread(target=lambda: [service.run('product') for _ in range(50)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert service.requests == 400
+
+
+def test_watcher_swaps_snapshot_after_file_settles(source_csv):
+    service = AnalysisService(str(source_csv))
+    old = service.snapshot
+    generate_orders(300, seed=7).to_csv(source_csv, index=False, encoding='latin1')
+    # Make sure the mtime moves even on coarse-grained filesystems
+    mtime = os.stat(source_csv).st_mtime_ns + 10**9
+    os.utime(source_csv, ns=(mtime, mtime))
+    # First poll only notices the change; the reload waits until the file holds still
+    pending = service.poll()
+    assert pending is not None and service.snapshot is old
+    assert service.poll(pending) is None
+    assert len(service.snapshot.df) == 300 and service.reloads == 2
+    # A failing reload keeps serving the previous snapshot
+    source_csv.write_text('not,a,superstore\n1,2,3\n')
+    service.poll(service.poll())
+    assert len(service.snapshot.df) == 300
+
+
+def test_apply_filters_coerces_numeric_columns(source_csv):
+    df = src.run_preprocessing(source_path=str(source_csv))
+    filtered = apply_filters(df, {'Order Year': ['2016']})
+    assert len(filtered) == (df['Order Year'] == 2016).sum() > 0
+
+
+def test_result_cache_serves_repeats_until_reload(source_csv):
+    service = AnalysisService(str(source_csv), result_cache=src.ResultCache())
+    first = service.run('product', {'Region': ['West']})
+    assert service.run('product', {'Region': ['West']})[2] == first[2]
+    assert service.result_cache.stats()['hits']['memory'] == 1
+    generate_orders(200, seed=9).to_csv(source_csv, index=False, encoding='latin1')
+    service.reload()
+    assert service.run('product', {'Region': ['West']})[1] < first[1]
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import sketches
+from src.metrics import (
+    aggregate, partial_aggregate, merge_partials, finalize, approximate,
+    approx_nunique_of, nunique_of, PRODUCT_METRICS
+)
+from src.streaming import stream_state, finalize_state, streamed_analyses
+from src.synthetic import generate_orders
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(4)
+    n = 60_000
+    return pd.DataFrame({
+        'Group': rng.choice(['a', 'b', 'c'], n),
+        'Customer': rng.integers(0, 20_000, n).astype(str),
+        'Value': rng.lognormal(3, 1, n) * rng.choice([-1, 1], n, p=[0.2, 0.8]),
+    })
+
+
+def test_hll_precision_meets_error_bound():
+    assert sketches.hll_error(sketches.hll_precision(0.01)) <= 0.01
+    assert sketches.hll_precision(1.0) == sketches.MIN_PRECISION
+
+
+def test_hll_estimates_within_error_bound(frame):
+    error = 0.02
+    exact = aggregate(frame, 'Group', {'n': nunique_of('Customer')})['n']
+    estimate = aggregate(frame, 'Group', {'n': approx_nunique_of('Customer', error)})['n']
+    assert ((estimate - exact).abs() / exact).max() < 3 * error
+    # Small cardinalities fall back to linear counting and are near exact
+    small = aggregate(frame.head(50), 'Group', {'n': approx_nunique_of('Customer', error)})['n']
+    exact_small = frame.head(50).groupby('Group')['Customer'].nunique()
+    assert ((small - exact_small).abs() <= 1).all()
+
+
+def test_sketches_merge_exactly_across_chunks(frame):
+    spec = {'n': approx_nunique_of('Customer'), 'm': approx_nunique_of('Value', 0.05)}
+    whole = aggregate(frame, 'Group', spec)
+    parts = [partial_aggregate(chunk, ['Group'], spec) for chunk in (frame.iloc[start:start + 15_000] for start in range(0, len(frame), 15_000))]
+    pd.testing.assert_frame_equal(finalize(merge_partials(parts), spec), whole)
+
+
+def test_approximate_spec_and_streaming(tmp_path):
+    spec = approximate(PRODUCT_METRICS, 0.05)
+    assert spec['Unique_Customers'].kind == 'approx_nunique'
+    assert spec['Revenue'] == PRODUCT_METRICS['Revenue']
+
+    path = tmp_path / 'orders.csv'
+    generate_orders(5000, customers=2000, seed=3).to_csv(path, index=False, encoding='latin1')
+    exact = finalize_state(stream_state(path, chunksize=1000))['product']
+    analyses = streamed_analyses(0.02)
+    approx = finalize_state(stream_state(path, chunksize=1000, analyses=analyses), analyses)['product']
+    pd.testing.assert_series_equal(approx['Revenue'], exact['Revenue'])
+    relative = (approx['Unique_Customers'] - exact['Unique_Customers']).abs() / exact['Unique_Customers']
+    assert relative.max() < 0.06
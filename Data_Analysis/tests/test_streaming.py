@@ -0,0 +1,51 @@
+import io
+import pytest
+import pandas as pd
+import src
+from src.analysis import PROFITABILITY_GROUPS, RFM_GROUPS, PRODUCT_GROUPS
+
+
+@pytest.fixture
+def source_csv(write_orders):
+    # Seed 5 puts one group's Avg_Order_Value exactly on a 6th-decimal rounding tie
+    # (4-decimal sales / 40 orders), where summary text depends on the summation order
+    return write_orders(1500, customers=200, seed=4)
+
+
+def test_streamed_tables_match_in_memory(source_csv):
+    df = src.run_preprocessing(source_path=source_csv)
+    reference_date = df['Order Date'].max() + pd.Timedelta(days=1)
+    expected = {
+        'profitability': src.aggregate(df, PROFITABILITY_GROUPS, src.PROFITABILITY_METRICS),
+        'rfm': src.aggregate(df, RFM_GROUPS, src.RFM_METRICS, reference_date=reference_date),
+        'product': src.aggregate(df, PRODUCT_GROUPS, src.PRODUCT_METRICS, totals={'Sales': df['Sales'].sum()}),
+    }
+
+    tables = src.finalize_state(src.stream_state(source_csv, chunksize=137))
+
+    # The in-memory frame is keyed by categoricals, streamed chunks by plain strings
+    for name, table in expected.items():
+        pd.testing.assert_frame_equal(tables[name], table, check_index_type=False, check_categorical=False)
+
+
+def test_stream_state_tracks_global_stats(source_csv):
+    df = src.run_preprocessing(source_path=source_csv)
+    state = src.stream_state(source_csv, chunksize=400)
+
+    assert state['rows'] == len(df)
+    assert state['total_sales'] == pytest.approx(df['Sales'].sum())
+    assert state['min_order_date'] == df['Order Date'].min()
+    assert state['max_order_date'] == df['Order Date'].max()
+
+
+def test_streaming_summary_matches_in_memory_summary(source_csv):
+    df = src.run_preprocessing(source_path=source_csv)
+    expected = io.StringIO()
+    src.profitability_metrics(df, expected)
+    src.RFM_Analysis(df, expected)
+    src.product_analysis(df, expected)
+
+    streamed = io.StringIO()
+    src.run_streaming_analysis(source_csv, streamed, chunksize=250)
+
+    assert streamed.getvalue() == expected.getvalue()
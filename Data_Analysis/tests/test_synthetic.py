@@ -0,0 +1,31 @@
+import io
+import pandas as pd
+import src
+
+
+def test_generator_is_deterministic():
+    pd.testing.assert_frame_equal(src.generate_orders(500, seed=3), src.generate_orders(500, seed=3))
+    assert not src.generate_orders(500, seed=3).equals(src.generate_orders(500, seed=4))
+
+
+def test_generator_respects_shape_parameters():
+    df = src.generate_orders(2000, customers=40, start='2020-01-01', end='2020-06-30', raw_dates=False)
+
+    assert len(df) == 2000
+    assert df['Customer ID'].nunique() <= 40
+    assert df['Order Date'].min() >= pd.Timestamp('2020-01-01')
+    assert df['Order Date'].max() <= pd.Timestamp('2020-06-30')
+    # Customer attributes and the product hierarchy stay consistent across rows
+    assert (df.groupby('Customer ID')['Segment'].nunique() == 1).all()
+    assert (df.groupby('Sub-Category')['Category'].nunique() == 1).all()
+
+
+def test_generated_data_runs_through_pipeline():
+    df = src.run_preprocessing(src.generate_orders(3000, customers=200, seed=1))
+    summary = io.StringIO()
+    src.profitability_metrics(df, summary)
+    src.RFM_Analysis(df, summary)
+    src.product_analysis(df, summary)
+
+    assert 'Customer Segment Summary' in summary.getvalue()
+    assert (df['Shipping Days'] >= 0).all()
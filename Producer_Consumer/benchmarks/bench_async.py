@@ -0,0 +1,59 @@
+"""
+asyncio runtime with many concurrent I/O-bound consumers.
+
+    python3 benchmarks/bench_async.py --consumers 100 1000 10000 --latency 0.01
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.async_system import AsyncProducerConsumerSystem  # noqa: E402
+
+
+async def run(consumers, items, latency):
+    async def fake_io(item):
+        await asyncio.sleep(latency)
+
+    system = AsyncProducerConsumerSystem(verbose=False)
+    system.add_queue("main", 1024)
+    system.add_producer("P1", range(items), 0, queue_name="main")
+
+    # Memory of idle consumers: objects, tasks and the futures they park on the queue
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for index in range(consumers):
+        system.add_consumer(f"C{index}", [], 0, queue_names="main", handler=fake_io)
+    start = time.perf_counter()
+    await system.start()
+    await asyncio.sleep(0)
+    per_consumer = (tracemalloc.get_traced_memory()[0] - before) / consumers
+    tracemalloc.stop()
+
+    await system.wait_for_completion()
+    elapsed = time.perf_counter() - start
+    assert system.get_statistics()['total_consumed'] == items
+    return items / elapsed, per_consumer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput and memory of many async consumers")
+    parser.add_argument("--consumers", type=int, nargs="+", default=[100, 1000, 10000], help="Consumer counts")
+    parser.add_argument("--items-per-consumer", type=int, default=5, help="Items per consumer")
+    parser.add_argument("--latency", type=float, default=0.01, help="Simulated I/O wait per item (s)")
+    args = parser.parse_args()
+
+    print(f"{'consumers':>9} {'items/s':>12} {'bytes/consumer':>15}")
+    for consumers in args.consumers:
+        items = consumers * args.items_per_consumer
+        throughput, per_consumer = asyncio.run(run(consumers, items, args.latency))
+        print(f"{consumers:>9} {throughput:>12,.0f} {per_consumer:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
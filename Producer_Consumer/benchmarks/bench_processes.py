@@ -0,0 +1,73 @@
+"""
+Thread vs process mode with a CPU-bound consumer handler.
+
+    python3 benchmarks/bench_processes.py --items 2000 --work 20000 --consumers 1 2 4
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.system import ProducerConsumerSystem  # noqa: E402
+
+
+def burn(item):
+    """CPU-bound handler: `work` rounds of integer arithmetic per item."""
+    total = 0
+    for i in range(item.data):
+        total += i * i % 7
+    item.data = total
+
+
+@contextlib.contextmanager
+def silenced():
+    # Workers print per item; silence fd 1 so child processes are quiet too
+    sys.stdout.flush()
+    saved = os.dup(1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        os.dup2(saved, 1)
+        os.close(devnull)
+        os.close(saved)
+
+
+def run(mode, consumers, items, work):
+    system = ProducerConsumerSystem(mode=mode)
+    system.add_queue("main", 256)
+    system.add_producer("P1", [work] * items, 0, queue_name="main", batch_size=32)
+    for index in range(consumers):
+        system.add_consumer(f"C{index}", [], 0, queue_names="main", batch_size=8, handler=burn)
+    with silenced():
+        start = time.perf_counter()
+        system.start()
+        system.wait_for_completion()
+        elapsed = time.perf_counter() - start
+    assert system.get_statistics()['total_consumed'] == items
+    return items / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare thread and process modes on CPU-bound handlers")
+    parser.add_argument("--items", type=int, default=2000, help="Items per run")
+    parser.add_argument("--work", type=int, default=20000, help="Loop iterations per item in the handler")
+    parser.add_argument("--consumers", type=int, nargs="+", default=[1, 2, 4], help="Consumer counts to try")
+    args = parser.parse_args()
+
+    print(f"CPUs: {os.cpu_count()}")
+    print(f"{'consumers':>9} {'thread items/s':>16} {'process items/s':>16}")
+    for consumers in args.consumers:
+        threaded = run('thread', consumers, args.items, args.work)
+        processes = run('process', consumers, args.items, args.work)
+        print(f"{consumers:>9} {threaded:>16,.0f} {processes:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Queue backend benchmark: throughput and put-to-get latency per topology.
+
+    python3 benchmarks/bench_queues.py --items 200000 --capacity 1024
+"""
+
+import argparse
+import os
+import queue
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ring_buffer import SPSCRingQueue, MPMCRingQueue  # noqa: E402
+
+BACKENDS = {
+    'queue.Queue': queue.Queue,
+    'spsc': SPSCRingQueue,
+    'mpmc': MPMCRingQueue,
+}
+# topology -> (producers, consumers, backends that support it)
+TOPOLOGIES = {
+    '1P-1C': (1, 1, ['queue.Queue', 'spsc', 'mpmc']),
+    '4P-1C': (4, 1, ['queue.Queue', 'mpmc']),
+    '4P-4C': (4, 4, ['queue.Queue', 'mpmc']),
+}
+STOP = object()
+
+
+def run(backend, producers, consumers, items, capacity):
+    q = BACKENDS[backend](maxsize=capacity)
+    per_producer = items // producers
+    latencies = [[] for _ in range(consumers)]
+
+    def produce():
+        clock = time.perf_counter
+        for _ in range(per_producer):
+            q.put(clock())
+
+    def consume(samples):
+        clock = time.perf_counter
+        while True:
+            sent = q.get()
+            if sent is STOP:
+                q.task_done()
+                return
+            samples.append(clock() - sent)
+            q.task_done()
+
+    threads = [threading.Thread(target=consume, args=(latencies[i],)) for i in range(consumers)]
+    threads += [threading.Thread(target=produce) for _ in range(producers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads[consumers:]:
+        thread.join()
+    q.join()
+    elapsed = time.perf_counter() - start
+    for _ in range(consumers):
+        q.put(STOP)
+    for thread in threads[:consumers]:
+        thread.join()
+
+    samples = sorted(sample for consumer in latencies for sample in consumer)
+    return {
+        'items_per_s': len(samples) / elapsed,
+        'p50_us': statistics.median(samples) * 1e6,
+        'p99_us': samples[int(len(samples) * 0.99)] * 1e6,
+    }
+
+
+def uncontended(backend, items, capacity):
+    """Nanoseconds per put + get + task_done from a single thread (no GIL hand-offs)."""
+    q = BACKENDS[backend](maxsize=capacity)
+    rounds = max(1, items // capacity)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for i in range(capacity):
+            q.put(i)
+        for _ in range(capacity):
+            q.get()
+            q.task_done()
+    return (time.perf_counter() - start) / (rounds * capacity) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark queue backends per topology")
+    parser.add_argument("--items", type=int, default=200_000, help="Items per run")
+    parser.add_argument("--capacity", type=int, default=1024, help="Queue capacity")
+    args = parser.parse_args()
+
+    print(f"{'topology':<8} {'backend':<12} {'items/s':>12} {'p50 us':>10} {'p99 us':>10}")
+    for topology, (producers, consumers, backends) in TOPOLOGIES.items():
+        for backend in backends:
+            result = run(backend, producers, consumers, args.items, args.capacity)
+            print(f"{topology:<8} {backend:<12} {result['items_per_s']:>12,.0f} "
+                  f"{result['p50_us']:>10.1f} {result['p99_us']:>10.1f}")
+
+    print()
+    print(f"{'backend':<12} {'ns per put+get (uncontended)':>30}")
+    for backend in BACKENDS:
+        print(f"{backend:<12} {uncontended(backend, args.items, args.capacity):>30,.0f}")
+
+
+if __name__ == "__main__":
+    main()
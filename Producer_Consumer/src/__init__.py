@@ -2,6 +2,14 @@ from .models import Item, ItemStatus
 from .producer import Producer
 from .consumer import Consumer
 from .system import ProducerConsumerSystem
+from .batching import BatchQueue
+from .selector import SelectableQueue, QueueSelector
+from .ring_buffer import SPSCRingQueue, MPMCRingQueue
+from .shm_queue import SharedMemoryQueue
+from .async_queue import AsyncQueue, AsyncQueueSelector
+from .async_producer import AsyncProducer
+from .async_consumer import AsyncConsumer
+from .async_system import AsyncProducerConsumerSystem
 
 __all__ = [
     "Item",
@@ -9,4 +17,15 @@ __all__ = [
     "Producer",
     "Consumer",
     "ProducerConsumerSystem",
+    "BatchQueue",
+    "SelectableQueue",
+    "QueueSelector",
+    "SPSCRingQueue",
+    "MPMCRingQueue",
+    "SharedMemoryQueue",
+    "AsyncQueue",
+    "AsyncQueueSelector",
+    "AsyncProducer",
+    "AsyncConsumer",
+    "AsyncProducerConsumerSystem",
 ]
@@ -0,0 +1,124 @@
+"""Async consumer - coroutine that reads from async queue(s) and stores items."""
+
+import asyncio
+import inspect
+from typing import Any, Callable, List, Optional, Union
+
+from .models import Item, ItemStatus
+from .async_queue import AsyncQueue, AsyncQueueSelector
+
+
+class AsyncConsumer:
+    """
+    Consumer coroutine for the asyncio runtime; the counterpart of the Consumer thread.
+    - Awaits items instead of polling with timeouts: an idle consumer is one parked future
+    - Multiple queues are watched by an AsyncQueueSelector (round-robin, weighted or priority)
+    - consumption_delay is an asyncio.sleep, and handler may be a coroutine function
+      (e.g. a network call), so thousands of consumers overlap their waits
+    - Graceful shutdown: checks the stop event between items, and is cancelled by the
+      system only while idle, so an item is never dropped half-processed
+    """
+    # Tens of thousands of consumers per process: keep instances small
+    __slots__ = ('name', 'queues', 'destination', 'stop_event', 'consumption_delay', 'max_items',
+                 'handler', 'verbose', 'items_consumed', 'batches_consumed', 'queue_index',
+                 'selector', 'task', 'idle')
+
+    def __init__(self,
+                 name: str,
+                 shared_queue: Union[AsyncQueue, List[AsyncQueue]],
+                 destination: List[Item],
+                 stop_event: asyncio.Event,
+                 consumption_delay: float = 0.15,
+                 max_items: Optional[int] = None,
+                 selection: str = 'round_robin',
+                 weights: Optional[List[float]] = None,
+                 handler: Optional[Callable[[Item], Any]] = None,
+                 verbose: bool = True):
+        """
+        Initialize the consumer.
+        """
+        if isinstance(shared_queue, list):
+            self.queues = shared_queue
+        else:
+            self.queues = [shared_queue]
+
+        self.name = name
+        self.destination = destination
+        self.stop_event = stop_event
+        self.consumption_delay = consumption_delay
+        self.max_items = max_items
+        self.handler = handler
+        self.verbose = verbose
+        self.items_consumed = 0
+        self.batches_consumed = 0
+        self.queue_index = 0
+        self.selector = None
+        if len(self.queues) > 1:
+            self.selector = AsyncQueueSelector(self.queues, selection, weights)
+        self.task: Optional[asyncio.Task] = None
+        self.idle = False  # waiting for an item
+
+    async def run(self):
+        """
+        Reads items from queue(s) and stores them in destination.
+        """
+        if self.verbose:
+            print(f"[{self.name}] Started - Monitoring {len(self.queues)} queue(s) ")
+
+        while not self.stop_event.is_set():
+            if self.max_items and self.items_consumed >= self.max_items:
+                if self.verbose:
+                    print(f"[{self.name}] Reached max items limit ({self.max_items})")
+                break
+
+            self.idle = True
+            try:
+                if self.selector is not None:
+                    self.queue_index, item = await self.selector.get()
+                else:
+                    item = await self.queues[0].get()
+            except asyncio.CancelledError:
+                if self.stop_event.is_set():
+                    break
+                raise
+            finally:
+                self.idle = False
+
+            current_queue = self.queues[self.queue_index]
+            try:
+                if self.consumption_delay:
+                    await asyncio.sleep(self.consumption_delay)
+                if self.handler is not None:
+                    result = self.handler(item)
+                    if inspect.isawaitable(result):
+                        await result
+                item.status = ItemStatus.CONSUMED
+                self.destination.append(item)
+                self.items_consumed += 1
+                self.batches_consumed += 1
+            except Exception as e:
+                print(f"[{self.name}] ERROR: {e}")
+                break
+            finally:
+                current_queue.task_done()
+
+            if self.verbose:
+                print(f"[{self.name}] Consumed: {item} from queue {self.queue_index}")
+
+        if self.verbose:
+            print(f"[{self.name}] Finished - Consumed {self.items_consumed} items")
+
+    def wake(self):
+        """Cancel an idle wait, so a stop is seen immediately."""
+        if self.idle and self.task is not None:
+            self.task.cancel()
+
+    def get_stats(self) -> dict:
+        """Return statistics about the consumer"""
+        return {
+            'name': self.name,
+            'items_consumed': self.items_consumed,
+            'batches_consumed': self.batches_consumed,
+            'destination_size': len(self.destination),
+            'num_queues': len(self.queues)
+        }
@@ -0,0 +1,105 @@
+"""Async producer - coroutine that reads from a source and puts items in an async queue."""
+
+import asyncio
+import time
+from typing import Any, AsyncIterable, Iterable, Optional, Union
+
+from .models import Item, ItemStatus
+from .async_queue import AsyncQueue
+
+
+class AsyncProducer:
+    """
+    Producer coroutine for the asyncio runtime; the counterpart of the Producer thread.
+    - Awaits put() while the queue is full instead of blocking a thread
+    - The source may be a list or an async iterable (e.g. a network stream)
+    - Graceful shutdown: checks the stop event between items, and is cancelled by
+      the system while it is waiting for queue space
+    """
+    # Thousands of workers per process: keep instances small
+    __slots__ = ('name', 'source', 'shared_queue', 'stop_event', 'production_delay', 'verbose',
+                 'items_produced', 'batches_produced', 'task', 'waiting')
+
+    def __init__(
+        self,
+        name: str,
+        source: Union[Iterable[Any], AsyncIterable[Any]],
+        shared_queue: AsyncQueue,
+        stop_event: asyncio.Event,
+        production_delay: float = 0.1,
+        verbose: bool = True
+    ):
+        """
+        Initialize the producer.
+        """
+        self.name = name
+        self.source = source
+        self.shared_queue = shared_queue
+        self.stop_event = stop_event
+        self.production_delay = production_delay
+        self.verbose = verbose
+        self.items_produced = 0
+        self.batches_produced = 0
+        self.task: Optional[asyncio.Task] = None
+        self.waiting = False  # blocked on a full queue
+
+    async def _items(self):
+        if hasattr(self.source, '__aiter__'):
+            async for data in self.source:
+                yield data
+        else:
+            for data in self.source:
+                yield data
+
+    async def run(self):
+        """
+        Reads items from source and places them in the queue.
+        """
+        if self.verbose:
+            print(f"[{self.name}] Started")
+        idx = 0
+        async for data in self._items():
+            if self.stop_event.is_set():
+                if self.verbose:
+                    print(f"[{self.name}] Stop event received, shutting down...")
+                break
+
+            item = Item(id=idx, data=data, timestamp=time.time(), status=ItemStatus.PENDING)
+            idx += 1
+            if self.production_delay:
+                await asyncio.sleep(self.production_delay)
+
+            # Mark before publishing: a consumer may take the item as soon as it is put
+            item.status = ItemStatus.IN_QUEUE
+            self.waiting = True
+            try:
+                await self.shared_queue.put(item)  # Waits while queue full
+            except asyncio.CancelledError:
+                item.status = ItemStatus.PENDING
+                if self.stop_event.is_set():
+                    break
+                raise
+            finally:
+                self.waiting = False
+
+            self.items_produced += 1
+            self.batches_produced += 1
+            if self.verbose:
+                print(f"[{self.name}] Produced: {item} | Queue size: {self.shared_queue.qsize()}")
+
+        if self.verbose:
+            print(f"[{self.name}] Finished - Produced {self.items_produced} items")
+
+    def wake(self):
+        """Cancel a put that is waiting for space, so a stop is seen immediately."""
+        if self.waiting and self.task is not None:
+            self.task.cancel()
+
+    def get_stats(self) -> dict:
+        """Return statistics about the producer"""
+        return {
+            'name': self.name,
+            'items_produced': self.items_produced,
+            'batches_produced': self.batches_produced,
+            'source_size': len(self.source) if hasattr(self.source, '__len__') else None
+        }
@@ -0,0 +1,162 @@
+"""Bounded asyncio queues and fan-in selection for the asyncio runtime."""
+
+import asyncio
+import collections
+from typing import Any, List, Optional, Tuple
+
+from .selector import SelectionPolicy
+
+
+class AsyncQueue:
+    """
+    Bounded FIFO for one event loop with the asyncio.Queue interface, owning its waiter
+    lists so an AsyncQueueSelector can wait on it together with other queues.
+    - put/get await while full/empty; put_nowait/get_nowait raise asyncio.QueueFull/QueueEmpty;
+      task_done/join track unfinished items
+    - A waiting selector parks one future in the getter list of every queue it watches;
+      the first put on any of them wakes it exactly like a plain get() waiter
+    - Futures left behind in the other queues are skipped by the wakeup, and the getter
+      list is compacted once they make up more than half of it
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._items: collections.deque = collections.deque()
+        self._getters: collections.deque = collections.deque()
+        self._putters: collections.deque = collections.deque()
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self._stale = 0
+
+    # Sizes
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    @staticmethod
+    def _wakeup_next(waiters: collections.deque):
+        # Wake the first waiter still waiting; cancelled and abandoned futures are skipped
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters: collections.deque, blocked):
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                # Woken and cancelled in the same step: hand the wakeup on
+                if not blocked() and not waiter.cancelled():
+                    self._wakeup_next(waiters)
+                raise
+
+    # asyncio.Queue interface
+    async def put(self, item: Any):
+        await self._wait(self._putters, self.full)
+        self.put_nowait(item)
+
+    def put_nowait(self, item: Any):
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.append(item)
+        self._unfinished += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    async def get(self) -> Any:
+        await self._wait(self._getters, self.empty)
+        return self.get_nowait()
+
+    def get_nowait(self) -> Any:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        item = self._items.popleft()
+        self._wakeup_next(self._putters)
+        return item
+
+    def task_done(self):
+        if self._unfinished <= 0:
+            raise ValueError('task_done() called too many times')
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self):
+        if self._unfinished:
+            await self._finished.wait()
+
+    # AsyncQueueSelector hooks
+    def _park(self, waiter: asyncio.Future):
+        self._getters.append(waiter)
+
+    def _abandon(self):
+        self._stale += 1
+        if self._stale > 64 and self._stale * 2 > len(self._getters):
+            self._getters = collections.deque(waiter for waiter in self._getters if not waiter.done())
+            self._stale = 0
+
+    def _pass_wakeup(self):
+        # Another waiter gets the wakeup a selector consumed without taking from this queue
+        if self._items:
+            self._wakeup_next(self._getters)
+
+
+class AsyncQueueSelector:
+    """
+    Awaits whichever of several AsyncQueues has data first, with no polling and no
+    per-queue tasks: one future per wait, shared by all watched queues.
+    The ready queue to serve is picked by a SelectionPolicy (round_robin, weighted, priority).
+    """
+
+    def __init__(self, queues: List[AsyncQueue], selection: str = 'round_robin',
+                 weights: Optional[List[float]] = None):
+        self.policy = SelectionPolicy(len(queues), selection, weights)
+        self.queues = queues
+        self.wakeups = 0
+
+    async def get(self) -> Tuple[int, Any]:
+        """(index, item) from the selected queue, waiting until any queue has an item."""
+        woken = False
+        while True:
+            ready = [index for index, q in enumerate(self.queues) if q.qsize()]
+            if ready:
+                index = self.policy.choose(ready)
+                item = self.queues[index].get_nowait()
+                if woken:
+                    for q in self.queues:
+                        q._pass_wakeup()
+                return index, item
+
+            waiter = asyncio.get_running_loop().create_future()
+            for q in self.queues:
+                q._park(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Woken and cancelled in the same step: hand the wakeup on
+                    for q in self.queues:
+                        q._pass_wakeup()
+                raise
+            finally:
+                # Cancel first so no queue can wake this waiter once it is abandoned
+                waiter.cancel()
+                for q in self.queues:
+                    q._abandon()
+            woken = True
+            self.wakeups += 1
@@ -0,0 +1,196 @@
+"""System for producer-consumer coroutines on asyncio."""
+
+import asyncio
+import time
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Optional, Union
+
+from .models import Item
+from .async_queue import AsyncQueue
+from .async_producer import AsyncProducer
+from .async_consumer import AsyncConsumer
+
+
+class AsyncProducerConsumerSystem:
+    """
+    asyncio counterpart of ProducerConsumerSystem, for I/O-bound workloads.
+    - Same named queues, producer routing and multi-queue consumers, on bounded AsyncQueues
+    - Every producer and consumer is a task in one event loop: an idle consumer costs a
+      small object, a task and one parked future, so tens of thousands can run at once
+    - start, wait_for_completion and stop are coroutines; run() does all of it
+    verbose=False silences the per-item prints, which dominate with many workers.
+    """
+
+    def __init__(self, verbose: bool = True):
+        """Initialize the producer-consumer system."""
+        self.verbose = verbose
+        self.queues: Dict[str, AsyncQueue] = {}
+        self.stop_event = asyncio.Event()
+        self.producers: List[AsyncProducer] = []
+        self.consumers: List[AsyncConsumer] = []
+        self.start_time = None
+        self.end_time = None
+
+    def add_queue(self, queue_name: str, queue_size: int = 10) -> AsyncQueue:
+        """Add a named bounded queue to the system."""
+        if queue_name in self.queues:
+            raise ValueError(f"Queue '{queue_name}' already exists")
+        if queue_size <= 0:
+            raise ValueError("Async queues must be bounded: queue_size must be positive")
+        self.queues[queue_name] = AsyncQueue(maxsize=queue_size)
+        return self.queues[queue_name]
+
+    def get_queue(self, queue_name: str) -> AsyncQueue:
+        """Get a queue by name"""
+        if queue_name not in self.queues:
+            raise ValueError(f"Queue '{queue_name}' does not exist")
+        return self.queues[queue_name]
+
+    def add_producer(self,
+                     name: str,
+                     source: Union[Iterable[Any], AsyncIterable[Any]],
+                     production_delay: float = 0.1,
+                     queue_name: str = None) -> AsyncProducer:
+        """Add a producer; source may be a list or an async iterable."""
+        if queue_name is None:
+            raise ValueError("queue_name is required")
+        producer = AsyncProducer(
+            name=name,
+            source=source,
+            shared_queue=self.get_queue(queue_name),
+            stop_event=self.stop_event,
+            production_delay=production_delay,
+            verbose=self.verbose
+        )
+        self.producers.append(producer)
+        return producer
+
+    def add_consumer(
+        self,
+        name: str,
+        destination: List[Item],
+        consumption_delay: float = 0.15,
+        max_items: Optional[int] = None,
+        queue_names: Union[str, List[str]] = None,
+        selection: str = 'round_robin',
+        weights: Optional[List[float]] = None,
+        handler: Optional[Callable[[Item], Any]] = None
+    ) -> AsyncConsumer:
+        """
+        Add a consumer to the system.
+        With several queues, selection picks among ready queues: 'round_robin',
+        'weighted' (one weight per queue) or 'priority' (queue_names order).
+        handler is called on each item before it is marked consumed and may be a
+        coroutine function.
+        """
+        if queue_names is None:
+            raise ValueError("queue_names is required")
+
+        if isinstance(queue_names, str):
+            target_queue = self.get_queue(queue_names)
+        else:
+            target_queue = [self.get_queue(qn) for qn in queue_names]
+
+        consumer = AsyncConsumer(
+            name=name,
+            shared_queue=target_queue,
+            destination=destination,
+            stop_event=self.stop_event,
+            consumption_delay=consumption_delay,
+            max_items=max_items,
+            selection=selection,
+            weights=weights,
+            handler=handler,
+            verbose=self.verbose
+        )
+        self.consumers.append(consumer)
+        return consumer
+
+    async def start(self):
+        """Start all producer and consumer tasks"""
+        print(f"\nStarting async system: {len(self.producers)} producer(s), {len(self.consumers)} consumer(s)")
+
+        self.start_time = time.time()
+
+        for worker in self.producers + self.consumers:
+            worker.task = asyncio.create_task(worker.run(), name=worker.name)
+
+    async def wait_for_completion(self, timeout: Optional[float] = None):
+        """Wait for producers to finish, queues to drain and consumers to stop."""
+        await self._wait([p.task for p in self.producers], timeout)
+
+        # Drained queues, unless every consumer already stopped (e.g. max_items)
+        joined = asyncio.ensure_future(asyncio.gather(*(q.join() for q in self.queues.values())))
+        consumers_done = asyncio.ensure_future(self._wait([c.task for c in self.consumers], None))
+        await asyncio.wait([joined, consumers_done], timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        joined.cancel()
+        consumers_done.cancel()
+
+        self.stop_event.set()
+        await self._finish(timeout)
+
+    async def stop(self):
+        """Gracefully stop all tasks"""
+        self.stop_event.set()
+        await self._finish(timeout=5)
+
+    async def run(self, timeout: Optional[float] = None) -> dict:
+        """Start, wait for completion and return the statistics."""
+        await self.start()
+        await self.wait_for_completion(timeout)
+        return self.get_statistics()
+
+    async def _finish(self, timeout: Optional[float]):
+        # Idle workers are cancelled; busy ones see the stop event after their current item
+        for worker in self.producers + self.consumers:
+            worker.wake()
+        await self._wait([w.task for w in self.producers + self.consumers], timeout)
+        self.end_time = time.time()
+
+    @staticmethod
+    async def _wait(tasks: List[asyncio.Task], timeout: Optional[float]):
+        tasks = [task for task in tasks if task is not None]
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
+
+    def get_statistics(self) -> dict:
+        """Get comprehensive system statistics"""
+        duration = (self.end_time - self.start_time) if self.end_time else 0
+
+        producer_stats = [p.get_stats() for p in self.producers]
+        consumer_stats = [c.get_stats() for c in self.consumers]
+
+        total_produced = sum(p['items_produced'] for p in producer_stats)
+        total_consumed = sum(c['items_consumed'] for c in consumer_stats)
+
+        queue_stats = {qname: q.qsize() for qname, q in self.queues.items()}
+        total_queue_remaining = sum(queue_stats.values())
+
+        return {
+            'mode': 'async',
+            'duration': duration,
+            'total_produced': total_produced,
+            'total_consumed': total_consumed,
+            'total_queue_remaining': total_queue_remaining,
+            'queue_stats': queue_stats,
+            'producers': producer_stats,
+            'consumers': consumer_stats
+        }
+
+    def print_statistics(self):
+        """Print formatted system statistics"""
+        stats = self.get_statistics()
+
+        print(f"\n--- Stats ---")
+        print(f"Duration: {stats['duration']:.2f}s")
+        print(f"Produced: {stats['total_produced']}, Consumed: {stats['total_consumed']}")
+
+        if stats['total_queue_remaining'] > 0:
+            print(f"Remaining in queues: {stats['total_queue_remaining']}")
+
+        if len(self.producers) > 1:
+            for p_stat in stats['producers']:
+                print(f"  {p_stat['name']}: {p_stat['items_produced']}/{p_stat['source_size']}")
+
+        if len(self.consumers) > 1 and len(self.consumers) <= 20:
+            for c_stat in stats['consumers']:
+                print(f"  {c_stat['name']}: {c_stat['items_consumed']}")
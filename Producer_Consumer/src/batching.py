@@ -0,0 +1,202 @@
+"""Batched queue transfers - many items per lock acquisition and wakeup."""
+
+import collections
+import queue
+import threading
+import time
+from typing import Any, List, Optional
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    return None if deadline is None else max(deadline - time.monotonic(), 0)
+
+
+def _deadline(block: bool, timeout: Optional[float]) -> Optional[float]:
+    if block and timeout is not None:
+        if timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        return time.monotonic() + timeout
+    return None
+
+
+class BatchQueue:
+    """
+    FIFO queue that owns its state, so batches move under one lock acquisition without
+    reaching into queue.Queue internals.
+    - Same interface as queue.Queue: put/get with block and timeout, task_done/join, qsize;
+      unbounded when maxsize <= 0
+    - put_many/get_many/task_done_many transfer a whole batch per lock acquisition and wakeup
+    - _published(count) runs after every put with the lock held (see selector.SelectableQueue)
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._items: collections.deque = collections.deque()
+        self._unfinished = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self.all_tasks_done = threading.Condition(self._lock)
+
+    # Sizes
+    def _qsize(self) -> int:
+        return len(self._items)
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    @property
+    def unfinished_tasks(self) -> int:
+        return self._unfinished
+
+    def _published(self, count: int):
+        pass
+
+    # Slow paths; the caller holds the lock
+    def _wait_for_space(self, block: bool, deadline: Optional[float]):
+        while 0 < self.maxsize <= len(self._items):
+            remaining = _remaining(deadline)
+            if not block or remaining == 0:
+                raise queue.Full
+            self._not_full.wait(remaining)
+
+    def _wait_for_item(self, block: bool, deadline: Optional[float]):
+        while not self._items:
+            remaining = _remaining(deadline)
+            if not block or remaining == 0:
+                raise queue.Empty
+            self._not_empty.wait(remaining)
+
+    # queue.Queue interface
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None):
+        with self._lock:
+            self._wait_for_space(block, _deadline(block, timeout))
+            self._items.append(item)
+            self._unfinished += 1
+            self._not_empty.notify()
+            self._published(1)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        with self._lock:
+            self._wait_for_item(block, _deadline(block, timeout))
+            item = self._items.popleft()
+            self._not_full.notify()
+        return item
+
+    def put_nowait(self, item: Any):
+        self.put(item, block=False)
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def task_done(self):
+        self.task_done_many(1)
+
+    def join(self):
+        with self.all_tasks_done:
+            while self._unfinished:
+                self.all_tasks_done.wait()
+
+    # Batched interface
+    def put_many(self, items: List[Any], timeout: Optional[float] = None) -> int:
+        deadline = _deadline(True, timeout)
+        put = 0
+        with self._lock:
+            while put < len(items):
+                try:
+                    self._wait_for_space(True, deadline)
+                except queue.Full:
+                    break
+                free = self.maxsize - len(self._items) if self.maxsize > 0 else len(items) - put
+                chunk = items[put:put + free]
+                self._items.extend(chunk)
+                put += len(chunk)
+                self._unfinished += len(chunk)
+                self._not_empty.notify(len(chunk))
+                self._published(len(chunk))
+        return put
+
+    def get_many(self, max_items: int, timeout: Optional[float] = None, linger: float = 0.0) -> List[Any]:
+        deadline = _deadline(True, timeout)
+        batch: List[Any] = []
+        with self._lock:
+            self._wait_for_item(True, deadline)
+            linger_deadline = time.monotonic() + linger
+            while True:
+                taken = min(max_items - len(batch), len(self._items))
+                for _ in range(taken):
+                    batch.append(self._items.popleft())
+                if taken:
+                    self._not_full.notify(taken)
+                if len(batch) >= max_items:
+                    break
+                remaining = linger_deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._not_empty.wait(remaining)
+        return batch
+
+    def task_done_many(self, count: int):
+        with self.all_tasks_done:
+            unfinished = self._unfinished - count
+            if unfinished < 0:
+                raise ValueError('task_done_many() called too many times')
+            if unfinished == 0:
+                self.all_tasks_done.notify_all()
+            self._unfinished = unfinished
+
+
+# Module-level helpers: queues with native batch methods (BatchQueue, the ring buffers,
+# SharedMemoryQueue) are delegated to; any other queue.Queue-like object is driven one
+# item at a time through its public API.
+
+def put_many(q: queue.Queue, items: List[Any], timeout: Optional[float] = None) -> int:
+    """
+    Put items in order.
+    - Blocks while the queue is full, like put()
+    - Returns how many items were enqueued; fewer than len(items) means the timeout expired
+    """
+    if hasattr(q, 'put_many'):
+        return q.put_many(items, timeout=timeout)
+    deadline = _deadline(True, timeout)
+    put = 0
+    for item in items:
+        try:
+            q.put(item, timeout=_remaining(deadline))
+        except queue.Full:
+            break
+        put += 1
+    return put
+
+
+def get_many(q: queue.Queue, max_items: int, timeout: Optional[float] = None, linger: float = 0.0) -> List[Any]:
+    """
+    Take up to max_items.
+    - Waits up to timeout for the first item, raising queue.Empty like get()
+    - Then keeps collecting for up to linger seconds while the batch is short
+    """
+    if hasattr(q, 'get_many'):
+        return q.get_many(max_items, timeout=timeout, linger=linger)
+    batch = [q.get(timeout=_remaining(_deadline(True, timeout)))]
+    linger_deadline = time.monotonic() + linger
+    while len(batch) < max_items:
+        remaining = linger_deadline - time.monotonic()
+        try:
+            batch.append(q.get(timeout=remaining) if remaining > 0 else q.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def task_done_many(q: queue.Queue, count: int):
+    """Mark count items as processed (see Queue.task_done)."""
+    if hasattr(q, 'task_done_many'):
+        return q.task_done_many(count)
+    for _ in range(count):
+        q.task_done()
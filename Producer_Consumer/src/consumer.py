@@ -3,21 +3,27 @@
 import threading
 import queue
 import time
-from typing import List, Optional, Union
+from typing import Any, Callable, List, Optional, Union
 
 from .models import Item, ItemStatus
+from .batching import get_many, task_done_many
+from .selector import QueueSelector
 
 
 class Consumer(threading.Thread):
     """
     Consumer thread that reads items from one or more queues.
     
-    Can consume from single queue and multiple queues (round-robin).
+    Can consume from single queue and multiple queues. Multiple queues that accept listeners are
+    watched by a QueueSelector (round-robin, weighted or priority among ready queues);
+    plain queues fall back to round-robin polling.
     
     - Thread synchronization
     - Blocking queue operations
     - Wait/notify mechanism through queue
     - Multi-queue round-robin consumption
+    - Optional batched gets (batch_size > 1), lingering up to `linger` seconds to fill a batch
+    - Optional handler called on every item before it is marked consumed
     """
     
     def __init__(self,
@@ -26,7 +32,12 @@ class Consumer(threading.Thread):
                  destination: List[Item],
                  stop_event: threading.Event,
                  consumption_delay: float = 0.15,
-                 max_items: Optional[int] = None):
+                 max_items: Optional[int] = None,
+                 batch_size: int = 1,
+                 linger: float = 0.0,
+                 selection: str = 'round_robin',
+                 weights: Optional[List[float]] = None,
+                 handler: Optional[Callable[[Item], Any]] = None):
         """
         Initialize the consumer thread.
         """
@@ -41,14 +52,21 @@ class Consumer(threading.Thread):
         self.stop_event = stop_event
         self.consumption_delay = consumption_delay
         self.max_items = max_items
+        self.batch_size = batch_size
+        self.linger = linger
+        self.handler = handler
         self.items_consumed = 0
+        self.batches_consumed = 0
         self.lock = threading.Lock()
         self.queue_index = 0  # round-robin index for multi-queue
+        self.selector = None
+        if len(self.queues) > 1 and all(hasattr(q, 'add_listener') for q in self.queues):
+            self.selector = QueueSelector(self.queues, selection, weights)
         
     def run(self):
         """
         Reads items from queue and stores them in destination.
-        Uses round-robin for multiple queues.
+        Blocks on the selector for multiple queues, else uses round-robin polling.
         """
         num_queues = len(self.queues)
         print(f"[{self.name}] Started - Monitoring {num_queues} queue(s) ")
@@ -62,17 +80,32 @@ class Consumer(threading.Thread):
                 break
             
             try:
+                if self.selector is not None:
+                    # One wait across every queue; the chosen queue already has data
+                    self.queue_index = self.selector.select(timeout=1)
+                    timeout = 0
+                elif num_queues == 1:
+                    timeout = 1
+                else:
+                    # Polling: only wait on an empty queue when every queue is empty
+                    timeout = 0 if any(q.qsize() for q in self.queues) else 0.1
                 current_queue = self.queues[self.queue_index]
-                timeout = 1 if num_queues == 1 else 0.1
+                if self.batch_size > 1:
+                    self._consume_batch(current_queue, timeout)
+                    consecutive_empty = 0
+                    continue
                 item = current_queue.get(timeout=timeout)
                 
                 consecutive_empty = 0
                 time.sleep(self.consumption_delay)
+                if self.handler is not None:
+                    self.handler(item)
                 item.status = ItemStatus.CONSUMED
                 
                 with self.lock:
                     self.destination.append(item)
                     self.items_consumed += 1
+                    self.batches_consumed += 1
                 
                 current_queue.task_done()
                 if num_queues == 1:
@@ -91,14 +124,47 @@ class Consumer(threading.Thread):
             finally:
                 self.queue_index = (self.queue_index + 1) % num_queues
         
+        if self.selector is not None:
+            self.selector.close()
         print(f"[{self.name}] Finished - Consumed {self.items_consumed} items")
 
+    def wake(self):
+        """Interrupt a blocked multi-queue wait so the stop event is seen immediately."""
+        if self.selector is not None:
+            self.selector.wake()
+
+    def _consume_batch(self, current_queue: queue.Queue, timeout: float):
+        """
+        Drains up to batch_size items (never past max_items), then accounts for them at once:
+        one destination extend, one stats update and one task_done for the whole batch.
+        """
+        limit = self.batch_size
+        if self.max_items:
+            limit = min(limit, self.max_items - self.items_consumed)
+        batch = get_many(current_queue, limit, timeout=timeout, linger=self.linger)
+
+        if self.consumption_delay:
+            time.sleep(self.consumption_delay * len(batch))
+        for item in batch:
+            if self.handler is not None:
+                self.handler(item)
+            item.status = ItemStatus.CONSUMED
+
+        with self.lock:
+            self.destination.extend(batch)
+            self.items_consumed += len(batch)
+            self.batches_consumed += 1
+
+        task_done_many(current_queue, len(batch))
+        print(f"[{self.name}] Consumed batch of {len(batch)} from queue {self.queue_index}")
+
     def get_stats(self) -> dict:
         """Return statistics about the consumer"""
         with self.lock:
             return {
                 'name': self.name,
                 'items_consumed': self.items_consumed,
+                'batches_consumed': self.batches_consumed,
                 'destination_size': len(self.destination),
                 'num_queues': len(self.queues)
             }
@@ -0,0 +1,24 @@
+"""Process workers - run producers and consumers in child processes to escape the GIL."""
+
+from typing import Any, Dict
+
+from .producer import Producer
+from .consumer import Consumer
+
+
+def run_worker(role: str, index: int, kwargs: Dict[str, Any], results):
+    """
+    Child-process entry point for ProducerConsumerSystem(mode='process').
+    - Builds the Producer or Consumer from kwargs and runs its loop in this process
+    - Reports (role, index, stats, consumed items) on the results queue when done,
+      so the parent can fold them into its own worker objects
+    """
+    if role == 'producer':
+        worker = Producer(**kwargs)
+    else:
+        worker = Consumer(destination=[], **kwargs)
+    try:
+        worker.run()
+    finally:
+        items = worker.destination if role == 'consumer' else None
+        results.put((role, index, worker.get_stats(), items))
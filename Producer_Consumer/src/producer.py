@@ -6,6 +6,7 @@ import time
 from typing import List, Any
 
 from .models import Item, ItemStatus
+from .batching import put_many
 
 class Producer(threading.Thread):
     """
@@ -13,6 +14,7 @@ class Producer(threading.Thread):
     - Thread synchronization
     - Blocking queue operations
     - Graceful shutdown
+    - Optional batched puts (batch_size > 1)
     """
     
     def __init__(
@@ -21,7 +23,8 @@ class Producer(threading.Thread):
         source: List[Any], 
         shared_queue: queue.Queue,
         stop_event: threading.Event,
-        production_delay: float = 0.1
+        production_delay: float = 0.1,
+        batch_size: int = 1
     ):
         """
         Initialize the producer thread.
@@ -31,7 +34,9 @@ class Producer(threading.Thread):
         self.shared_queue = shared_queue
         self.stop_event = stop_event
         self.production_delay = production_delay
+        self.batch_size = batch_size
         self.items_produced = 0
+        self.batches_produced = 0
         self.lock = threading.Lock()
         
     def run(self):
@@ -39,6 +44,10 @@ class Producer(threading.Thread):
         Reads items from source and places them in the queue.
         """
         print(f"[{self.name}] Started - Processing {len(self.source)} items")
+        if self.batch_size > 1:
+            self._run_batched()
+            print(f"[{self.name}] Finished - Produced {self.items_produced} items in {self.batches_produced} batches")
+            return
         
         for idx, data in enumerate(self.source):
             if self.stop_event.is_set():
@@ -55,15 +64,18 @@ class Producer(threading.Thread):
             try:
                 time.sleep(self.production_delay)
                 
-                self.shared_queue.put(item, timeout=5)  # Blocks if queue full
+                # Mark before publishing: a consumer may take the item as soon as it is put
                 item.status = ItemStatus.IN_QUEUE
+                self.shared_queue.put(item, timeout=5)  # Blocks if queue full
                 
                 with self.lock:
                     self.items_produced += 1
+                    self.batches_produced += 1
                 
                 print(f"[{self.name}] Produced: {item} | Queue size: {self.shared_queue.qsize()}")
                 
             except queue.Full:
+                item.status = ItemStatus.PENDING
                 print(f"[{self.name}] ERROR: Queue full, couldn't produce {item}")
                 break
             except Exception as e:
@@ -71,6 +83,42 @@ class Producer(threading.Thread):
                 break
         
         print(f"[{self.name}] Finished - Produced {self.items_produced} items")
+
+    def _run_batched(self):
+        """
+        Puts items batch_size at a time: one lock acquisition and one stats update per batch.
+        """
+        for start in range(0, len(self.source), self.batch_size):
+            if self.stop_event.is_set():
+                print(f"[{self.name}] Stop event received, shutting down...")
+                break
+
+            now = time.time()
+            batch = [
+                Item(id=idx, data=data, timestamp=now, status=ItemStatus.PENDING)
+                for idx, data in enumerate(self.source[start:start + self.batch_size], start)
+            ]
+            if self.production_delay:
+                time.sleep(self.production_delay * len(batch))
+
+            for item in batch:
+                item.status = ItemStatus.IN_QUEUE
+            try:
+                put = put_many(self.shared_queue, batch, timeout=5)  # Blocks while queue full
+            except Exception as e:
+                print(f"[{self.name}] ERROR: {e}")
+                break
+            for item in batch[put:]:
+                item.status = ItemStatus.PENDING
+
+            with self.lock:
+                self.items_produced += put
+                self.batches_produced += 1
+
+            if put < len(batch):
+                print(f"[{self.name}] ERROR: Queue full, couldn't produce {len(batch) - put} items")
+                break
+            print(f"[{self.name}] Produced batch of {put} | Queue size: {self.shared_queue.qsize()}")
     
     def get_stats(self) -> dict:
         """Return statistics about the producer"""
@@ -78,5 +126,6 @@ class Producer(threading.Thread):
             return {
                 'name': self.name,
                 'items_produced': self.items_produced,
+                'batches_produced': self.batches_produced,
                 'source_size': len(self.source)
             }
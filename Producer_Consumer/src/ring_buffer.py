@@ -0,0 +1,251 @@
+"""Bounded ring-buffer queues - drop-in queue.Queue backends with less locking per operation."""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+
+class MPMCRingQueue:
+    """
+    Bounded ring buffer for many producers and many consumers.
+    - Same interface as queue.Queue: put/get with block and timeout, task_done/join, qsize
+    - Producers serialize on a put lock and consumers on a get lock, so the two sides
+      never contend with each other on the fast path
+    - Conditions are only touched when a thread actually has to wait (buffer full or empty)
+    - Head, tail and done are monotonic counters: qsize = tail - head, unfinished = tail - done
+    Relies on the GIL for ordering between the two sides, like most pure-Python queues.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize <= 0:
+            raise ValueError("Ring buffer queues need a positive maxsize")
+        self.maxsize = maxsize
+        self._buffer: List[Any] = [None] * maxsize
+        self._head = 0  # items taken
+        self._tail = 0  # items put
+        self._done = 0  # task_done calls
+        self._put_lock = threading.Lock()
+        self._get_lock = threading.Lock()
+        self._not_empty = threading.Condition(threading.Lock())
+        self._not_full = threading.Condition(threading.Lock())
+        self.all_tasks_done = threading.Condition(threading.Lock())
+        self._get_waiters = 0
+        self._put_waiters = 0
+        self._listeners: List[Callable[[], None]] = []
+
+    # Sizes
+    def _qsize(self) -> int:
+        return self._tail - self._head
+
+    def qsize(self) -> int:
+        return self._tail - self._head
+
+    def empty(self) -> bool:
+        return self._tail == self._head
+
+    def full(self) -> bool:
+        return self._tail - self._head >= self.maxsize
+
+    @property
+    def unfinished_tasks(self) -> int:
+        return self._tail - self._done
+
+    # Fan-in listeners (see selector.QueueSelector)
+    def add_listener(self, listener: Callable[[], None]):
+        self._listeners = self._listeners + [listener]
+
+    def remove_listener(self, listener: Callable[[], None]):
+        self._listeners = [other for other in self._listeners if other is not listener]
+
+    # Slow paths
+    @staticmethod
+    def _deadline(block: bool, timeout: Optional[float]) -> Optional[float]:
+        if block and timeout is not None:
+            if timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            return time.monotonic() + timeout
+        return None
+
+    def _wait_for_space(self, block: bool, deadline: Optional[float]):
+        with self._not_full:
+            self._put_waiters += 1
+            try:
+                while self._tail - self._head >= self.maxsize:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if not block or (remaining is not None and remaining <= 0):
+                        raise queue.Full
+                    self._not_full.wait(remaining)
+            finally:
+                self._put_waiters -= 1
+
+    def _wait_for_item(self, block: bool, deadline: Optional[float]):
+        with self._not_empty:
+            self._get_waiters += 1
+            try:
+                while self._tail == self._head:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if not block or (remaining is not None and remaining <= 0):
+                        raise queue.Empty
+                    self._not_empty.wait(remaining)
+            finally:
+                self._get_waiters -= 1
+
+    def _published(self, count: int = 1):
+        # Waiters are counted before they re-check the buffer, so reading the count
+        # after publishing cannot miss one that is about to sleep
+        if self._get_waiters:
+            with self._not_empty:
+                self._not_empty.notify(count)
+        for listener in self._listeners:
+            listener()
+
+    def _released(self, count: int = 1):
+        if self._put_waiters:
+            with self._not_full:
+                self._not_full.notify(count)
+
+    # queue.Queue interface
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None):
+        deadline = None
+        while True:
+            with self._put_lock:
+                tail = self._tail
+                if tail - self._head < self.maxsize:
+                    self._buffer[tail % self.maxsize] = item
+                    self._tail = tail + 1
+                    break
+            if deadline is None:
+                deadline = self._deadline(block, timeout)
+            self._wait_for_space(block, deadline)
+        # Inlined _published(): this is the hot path
+        if self._get_waiters:
+            with self._not_empty:
+                self._not_empty.notify()
+        if self._listeners:
+            for listener in self._listeners:
+                listener()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        deadline = None
+        while True:
+            with self._get_lock:
+                head = self._head
+                if head != self._tail:
+                    slot = head % self.maxsize
+                    item = self._buffer[slot]
+                    self._buffer[slot] = None
+                    self._head = head + 1
+                    break
+            if deadline is None:
+                deadline = self._deadline(block, timeout)
+            self._wait_for_item(block, deadline)
+        if self._put_waiters:
+            with self._not_full:
+                self._not_full.notify()
+        return item
+
+    def put_nowait(self, item: Any):
+        self.put(item, block=False)
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def task_done(self):
+        self.task_done_many(1)
+
+    def join(self):
+        with self.all_tasks_done:
+            while self._done < self._tail:
+                self.all_tasks_done.wait()
+
+    # Batched interface (see batching.py)
+    def put_many(self, items: List[Any], timeout: Optional[float] = None) -> int:
+        deadline = self._deadline(True, timeout)
+        put = 0
+        while put < len(items):
+            with self._put_lock:
+                tail = self._tail
+                count = min(self.maxsize - (tail - self._head), len(items) - put)
+                for offset in range(count):
+                    self._buffer[(tail + offset) % self.maxsize] = items[put + offset]
+                self._tail = tail + count
+            if count:
+                put += count
+                self._published(count)
+                continue
+            try:
+                self._wait_for_space(True, deadline)
+            except queue.Full:
+                break
+        return put
+
+    def get_many(self, max_items: int, timeout: Optional[float] = None, linger: float = 0.0) -> List[Any]:
+        deadline = self._deadline(True, timeout)
+        batch: List[Any] = []
+        linger_deadline = None
+        while len(batch) < max_items:
+            with self._get_lock:
+                head = self._head
+                count = min(self._tail - head, max_items - len(batch))
+                for offset in range(count):
+                    slot = (head + offset) % self.maxsize
+                    batch.append(self._buffer[slot])
+                    self._buffer[slot] = None
+                self._head = head + count
+            if count:
+                self._released(count)
+                continue
+            if not batch:
+                self._wait_for_item(True, deadline)
+                continue
+            if linger_deadline is None:
+                linger_deadline = time.monotonic() + linger
+            try:
+                self._wait_for_item(True, linger_deadline)
+            except queue.Empty:
+                break
+        return batch
+
+    def task_done_many(self, count: int):
+        with self.all_tasks_done:
+            done = self._done + count
+            if done > self._tail:
+                raise ValueError('task_done() called too many times')
+            self._done = done
+            if done == self._tail:
+                self.all_tasks_done.notify_all()
+
+
+class SPSCRingQueue(MPMCRingQueue):
+    """
+    Ring buffer for exactly one producer thread and one consumer thread.
+    The producer only writes the tail and the consumer only writes the head, so
+    put and get take no lock at all unless they have to wait.
+    """
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None):
+        tail = self._tail
+        if tail - self._head >= self.maxsize:
+            self._wait_for_space(block, self._deadline(block, timeout))
+        self._buffer[tail % self.maxsize] = item
+        self._tail = tail + 1
+        if self._get_waiters:
+            with self._not_empty:
+                self._not_empty.notify()
+        if self._listeners:
+            for listener in self._listeners:
+                listener()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        head = self._head
+        if head == self._tail:
+            self._wait_for_item(block, self._deadline(block, timeout))
+        slot = head % self.maxsize
+        item = self._buffer[slot]
+        self._buffer[slot] = None
+        self._head = head + 1
+        if self._put_waiters:
+            with self._not_full:
+                self._not_full.notify()
+        return item
@@ -0,0 +1,139 @@
+"""Event-driven fan-in over several queues - block once until any of them has data."""
+
+import queue
+import threading
+import time
+from typing import Callable, List, Optional
+
+from .batching import BatchQueue
+
+SELECTION_POLICIES = ('round_robin', 'weighted', 'priority')
+
+
+class SelectableQueue(BatchQueue):
+    """
+    BatchQueue that notifies registered listeners on every put (once per batch).
+    Behaves exactly like queue.Queue otherwise (blocking, timeouts, join).
+    """
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self._listeners: List[Callable[[], None]] = []
+
+    def add_listener(self, listener: Callable[[], None]):
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _published(self, count: int):
+        # Called with the queue lock held; listeners must not take this queue's lock
+        for listener in self._listeners:
+            listener()
+
+
+class SelectionPolicy:
+    """
+    Picks one of the ready queue indexes; shared by the thread and asyncio selectors.
+    - round_robin: ready queues in turn, starting after the last one served
+    - weighted: smooth weighted round-robin among ready queues (weights per queue)
+    - priority: the first ready queue in list order
+    """
+
+    def __init__(self, num_queues: int, selection: str = 'round_robin',
+                 weights: Optional[List[float]] = None):
+        if selection not in SELECTION_POLICIES:
+            raise ValueError(f"selection must be one of {SELECTION_POLICIES}")
+        if weights is not None and len(weights) != num_queues:
+            raise ValueError("weights must have one entry per queue")
+        self.num_queues = num_queues
+        self.selection = selection
+        self.weights = list(weights) if weights is not None else [1.0] * num_queues
+        self.last_index = -1
+        self.credit = [0.0] * num_queues
+
+    def choose(self, ready: List[int]) -> int:
+        if self.selection == 'priority':
+            chosen = ready[0]
+        elif self.selection == 'weighted':
+            total = sum(self.weights[index] for index in ready)
+            for index in ready:
+                self.credit[index] += self.weights[index]
+            chosen = max(ready, key=lambda index: self.credit[index])
+            self.credit[chosen] -= total
+        else:
+            count = self.num_queues
+            chosen = min(ready, key=lambda index: (index - self.last_index - 1) % count)
+        self.last_index = chosen
+        return chosen
+
+
+class QueueSelector:
+    """
+    Waits on one condition that every watched queue signals when it receives an item.
+    Works with any queue offering add_listener/remove_listener and _qsize().
+    The ready queue to serve is picked by a SelectionPolicy (round_robin, weighted, priority).
+    Readiness is read without taking queue locks, so a producer holding a queue's lock
+    can always notify the selector; a stale answer just means the get comes back empty.
+    """
+
+    def __init__(self, queues: List[queue.Queue], selection: str = 'round_robin',
+                 weights: Optional[List[float]] = None):
+        self.policy = SelectionPolicy(len(queues), selection, weights)
+        self.queues = queues
+        self.ready = threading.Condition()
+        self.woken = False
+        self.wakeups = 0
+        for q in queues:
+            q.add_listener(self._notify)
+
+    def _notify(self):
+        with self.ready:
+            self.ready.notify()
+
+    def _ready_indexes(self) -> List[int]:
+        return [index for index, q in enumerate(self.queues) if q._qsize()]
+
+    def select(self, timeout: Optional[float] = None) -> int:
+        """
+        Index of a queue that has data, blocking until one does.
+        Raises queue.Empty on timeout or after wake().
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.ready:
+            while True:
+                ready = self._ready_indexes()
+                if ready:
+                    return self.policy.choose(ready)
+                if self.woken:
+                    self.woken = False
+                    raise queue.Empty
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self.ready.wait(remaining)
+                self.wakeups += 1
+
+    def get(self, timeout: Optional[float] = None):
+        """(index, item) from the selected queue, retrying if another consumer took it first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            index = self.select(remaining)
+            try:
+                return index, self.queues[index].get_nowait()
+            except queue.Empty:
+                continue
+
+    def wake(self):
+        """Make a blocked (or the next) select() raise queue.Empty, e.g. on shutdown."""
+        with self.ready:
+            self.woken = True
+            self.ready.notify_all()
+
+    def close(self):
+        for q in self.queues:
+            q.remove_listener(self._notify)
@@ -0,0 +1,261 @@
+"""Shared-memory queue - a bounded slot ring that worker processes can share."""
+
+import multiprocessing
+import os
+import pickle
+import queue
+import struct
+import time
+import weakref
+from multiprocessing import shared_memory
+from typing import Any, List, Optional, Tuple
+
+from .models import Item, ItemStatus
+
+# Header: head, tail, done, get waiters, put waiters, woken flag (int64 each)
+_HEAD, _TAIL, _DONE, _GET_WAITERS, _PUT_WAITERS, _WOKEN = range(6)
+_HEADER_BYTES = 64
+# Slot: payload length, payload kind, payload
+_SLOT_HEADER = struct.Struct('<IB')
+_KIND_ITEM = 0  # Item sent as an (id, data, timestamp) tuple
+_KIND_OBJECT = 1  # Anything else, pickled as is
+
+
+def _encode(obj: Any) -> Tuple[int, bytes]:
+    if type(obj) is Item:
+        return _KIND_ITEM, pickle.dumps((obj.id, obj.data, obj.timestamp), pickle.HIGHEST_PROTOCOL)
+    return _KIND_OBJECT, pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(record: Tuple[int, bytes]) -> Any:
+    kind, payload = record
+    value = pickle.loads(payload)
+    if kind == _KIND_ITEM:
+        return Item(*value, status=ItemStatus.IN_QUEUE)
+    return value
+
+
+def _release(shm: shared_memory.SharedMemory, header: memoryview, owner_pid: int):
+    header.release()
+    shm.close()
+    if os.getpid() == owner_pid:
+        shm.unlink()
+
+
+class SharedMemoryQueue:
+    """
+    Bounded queue whose items live in a shared-memory ring of fixed-size slots.
+    - Same interface as queue.Queue: put/get with block and timeout, task_done/join, qsize,
+      plus put_many/get_many/task_done_many (see batching.py)
+    - Items are pickled outside the lock; an Item travels as an (id, data, timestamp)
+      tuple rather than a full object with its status enum
+    - Head, tail and done counters sit in the shared header, so queue.join() works across processes
+    - One process lock guards the header; conditions are only signalled when someone waits
+    Each serialized item must fit in slot_size bytes. The creating process unlinks the
+    segment when the queue is closed or garbage collected.
+    """
+
+    def __init__(self, maxsize: int, slot_size: int = 4096, ctx=None):
+        if maxsize <= 0:
+            raise ValueError("Shared-memory queues need a positive maxsize")
+        if slot_size <= _SLOT_HEADER.size:
+            raise ValueError(f"slot_size must be larger than {_SLOT_HEADER.size} bytes")
+        ctx = ctx or multiprocessing.get_context()
+        self.maxsize = maxsize
+        self.slot_size = slot_size
+        self._lock = ctx.Lock()
+        self._not_empty = ctx.Condition(self._lock)
+        self._not_full = ctx.Condition(self._lock)
+        self.all_tasks_done = ctx.Condition(self._lock)
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER_BYTES + maxsize * slot_size)
+        self._attach(shm, owner_pid=os.getpid())
+        for index in range(6):
+            self._header[index] = 0
+
+    def _attach(self, shm: shared_memory.SharedMemory, owner_pid: int):
+        self._shm = shm
+        self._buf = shm.buf
+        self._header = shm.buf[:48].cast('q')
+        self._owner_pid = owner_pid
+        self._finalizer = weakref.finalize(self, _release, shm, self._header, owner_pid)
+
+    # Pickled only when handed to a spawned process; forked children inherit the mapping
+    def __getstate__(self):
+        return {
+            'name': self._shm.name, 'maxsize': self.maxsize, 'slot_size': self.slot_size,
+            'owner_pid': self._owner_pid, 'lock': self._lock, 'not_empty': self._not_empty,
+            'not_full': self._not_full, 'all_tasks_done': self.all_tasks_done,
+        }
+
+    def __setstate__(self, state):
+        self.maxsize = state['maxsize']
+        self.slot_size = state['slot_size']
+        self._lock = state['lock']
+        self._not_empty = state['not_empty']
+        self._not_full = state['not_full']
+        self.all_tasks_done = state['all_tasks_done']
+        self._attach(shared_memory.SharedMemory(name=state['name']), state['owner_pid'])
+
+    def wake(self):
+        """Wake blocked getters; from now on get() raises queue.Empty instead of waiting."""
+        with self._lock:
+            self._header[_WOKEN] = 1
+            self._not_empty.notify_all()
+
+    def close(self):
+        """Detach from the segment (and unlink it in the creating process)."""
+        self._finalizer()
+
+    # Sizes
+    def qsize(self) -> int:
+        return self._header[_TAIL] - self._header[_HEAD]
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def full(self) -> bool:
+        return self.qsize() >= self.maxsize
+
+    @property
+    def unfinished_tasks(self) -> int:
+        return self._header[_TAIL] - self._header[_DONE]
+
+    # Slots (caller holds the lock)
+    def _write(self, record: Tuple[int, bytes]):
+        kind, payload = record
+        header = self._header
+        offset = _HEADER_BYTES + (header[_TAIL] % self.maxsize) * self.slot_size
+        _SLOT_HEADER.pack_into(self._buf, offset, len(payload), kind)
+        start = offset + _SLOT_HEADER.size
+        self._buf[start:start + len(payload)] = payload
+        header[_TAIL] += 1
+
+    def _read(self) -> Tuple[int, bytes]:
+        header = self._header
+        offset = _HEADER_BYTES + (header[_HEAD] % self.maxsize) * self.slot_size
+        length, kind = _SLOT_HEADER.unpack_from(self._buf, offset)
+        start = offset + _SLOT_HEADER.size
+        payload = bytes(self._buf[start:start + length])
+        header[_HEAD] += 1
+        return kind, payload
+
+    def _check_size(self, record: Tuple[int, bytes]):
+        if len(record[1]) + _SLOT_HEADER.size > self.slot_size:
+            raise ValueError(
+                f"Serialized item is {len(record[1])} bytes; slot_size {self.slot_size} "
+                f"holds at most {self.slot_size - _SLOT_HEADER.size}"
+            )
+
+    def _wait(self, condition, waiters_index: int, deadline: Optional[float], error):
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            raise error
+        if error is queue.Empty and self._header[_WOKEN]:
+            raise error
+        self._header[waiters_index] += 1
+        try:
+            condition.wait(remaining)
+        finally:
+            self._header[waiters_index] -= 1
+
+    def _notify(self, condition, waiters_index: int, count: int):
+        waiters = self._header[waiters_index]
+        if waiters:
+            condition.notify(min(count, waiters))
+
+    @staticmethod
+    def _deadline(block: bool, timeout: Optional[float]) -> Optional[float]:
+        if not block:
+            return time.monotonic()
+        if timeout is not None:
+            if timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            return time.monotonic() + timeout
+        return None
+
+    # queue.Queue interface
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None):
+        record = _encode(item)
+        self._check_size(record)
+        deadline = self._deadline(block, timeout)
+        with self._lock:
+            while self.qsize() >= self.maxsize:
+                self._wait(self._not_full, _PUT_WAITERS, deadline, queue.Full)
+            self._write(record)
+            self._notify(self._not_empty, _GET_WAITERS, 1)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        deadline = self._deadline(block, timeout)
+        with self._lock:
+            while not self.qsize():
+                self._wait(self._not_empty, _GET_WAITERS, deadline, queue.Empty)
+            record = self._read()
+            self._notify(self._not_full, _PUT_WAITERS, 1)
+        return _decode(record)
+
+    def put_nowait(self, item: Any):
+        self.put(item, block=False)
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def task_done(self):
+        self.task_done_many(1)
+
+    def join(self):
+        with self._lock:
+            while self._header[_DONE] < self._header[_TAIL]:
+                self.all_tasks_done.wait()
+
+    # Batched interface (see batching.py)
+    def put_many(self, items: List[Any], timeout: Optional[float] = None) -> int:
+        records = [_encode(item) for item in items]
+        for record in records:
+            self._check_size(record)
+        deadline = self._deadline(True, timeout)
+        put = 0
+        with self._lock:
+            while put < len(records):
+                free = self.maxsize - self.qsize()
+                if not free:
+                    try:
+                        self._wait(self._not_full, _PUT_WAITERS, deadline, queue.Full)
+                    except queue.Full:
+                        break
+                    continue
+                for record in records[put:put + free]:
+                    self._write(record)
+                count = min(free, len(records) - put)
+                put += count
+                self._notify(self._not_empty, _GET_WAITERS, count)
+        return put
+
+    def get_many(self, max_items: int, timeout: Optional[float] = None, linger: float = 0.0) -> List[Any]:
+        deadline = self._deadline(True, timeout)
+        records: List[Tuple[int, bytes]] = []
+        with self._lock:
+            while not self.qsize():
+                self._wait(self._not_empty, _GET_WAITERS, deadline, queue.Empty)
+            linger_deadline = time.monotonic() + linger
+            while True:
+                count = min(max_items - len(records), self.qsize())
+                for _ in range(count):
+                    records.append(self._read())
+                if count:
+                    self._notify(self._not_full, _PUT_WAITERS, count)
+                if len(records) >= max_items:
+                    break
+                try:
+                    self._wait(self._not_empty, _GET_WAITERS, linger_deadline, queue.Empty)
+                except queue.Empty:
+                    break
+        return [_decode(record) for record in records]
+
+    def task_done_many(self, count: int):
+        with self._lock:
+            done = self._header[_DONE] + count
+            if done > self._header[_TAIL]:
+                raise ValueError('task_done() called too many times')
+            self._header[_DONE] = done
+            if done == self._header[_TAIL]:
+                self.all_tasks_done.notify_all()
@@ -1,13 +1,27 @@
 """System for producer-consumer threads."""
 
+import multiprocessing
 import queue
 import threading
 import time
-from typing import List, Optional, Any, Dict, Union
+from typing import Callable, List, Optional, Any, Dict, Union
 
 from .models import Item
 from .producer import Producer
 from .consumer import Consumer
+from .selector import SelectableQueue
+from .ring_buffer import SPSCRingQueue, MPMCRingQueue
+from .shm_queue import SharedMemoryQueue
+from .processes import run_worker
+
+# Queue implementations selectable per named queue
+QUEUE_BACKENDS = {
+    'queue': SelectableQueue,
+    'spsc': SPSCRingQueue,
+    'mpmc': MPMCRingQueue,
+    'shm': SharedMemoryQueue,
+}
+MODES = ('thread', 'process')
 
 
 class ProducerConsumerSystem:
@@ -16,25 +30,54 @@ class ProducerConsumerSystem:
     - Create multiple named queues
     - Route producers to specific queues
     - Route consumers to one or multiple queues
+    - mode='process' runs every producer and consumer in its own process over
+      shared-memory queues, so CPU-bound consumer handlers run in parallel
     """
     
-    def __init__(self):
-        """Initialize the producer-consumer system."""
+    def __init__(self, mode: str = 'thread', mp_context: Optional[str] = None):
+        """
+        Initialize the producer-consumer system.
+        mp_context picks the multiprocessing start method in process mode ('fork', 'spawn', ...).
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode '{mode}', expected one of {list(MODES)}")
+        self.mode = mode
+        self._ctx = multiprocessing.get_context(mp_context) if mode == 'process' else None
         self.queues: Dict[str, queue.Queue] = {}
-        self.stop_event = threading.Event()
+        self.stop_event = self._ctx.Event() if self._ctx else threading.Event()
         self.producers: List[Producer] = []
         self.consumers: List[Consumer] = []
         self.start_time = None
         self.end_time = None
+        # Process mode: constructor arguments replayed in each child, and what has reported back
+        self._worker_specs: List[tuple] = []
+        self._processes: List[multiprocessing.Process] = []
+        self._results = None
+        self._reported = set()
     
-    def add_queue(self, queue_name: str, queue_size: int = 10) -> queue.Queue:
+    def add_queue(self, queue_name: str, queue_size: int = 10, backend: Optional[str] = None,
+                  slot_size: int = 4096) -> queue.Queue:
         """
         Add a named queue to the system.
+        backend: 'queue' (BatchQueue), 'spsc' (ring buffer for one producer and one
+        consumer), 'mpmc' (ring buffer for any number of each) or 'shm' (shared-memory
+        slots of slot_size bytes, usable across processes). Defaults to 'queue', or
+        'shm' in process mode, where it is the only choice.
         """
+        if backend is None:
+            backend = 'shm' if self.mode == 'process' else 'queue'
         if queue_name in self.queues:
             raise ValueError(f"Queue '{queue_name}' already exists")
+        if backend not in QUEUE_BACKENDS:
+            raise ValueError(f"Unknown queue backend '{backend}', expected one of {list(QUEUE_BACKENDS)}")
+        if self.mode == 'process' and backend != 'shm':
+            raise ValueError(f"Process mode needs shared-memory queues, not backend '{backend}'")
         
-        self.queues[queue_name] = queue.Queue(maxsize=queue_size)
+        if backend == 'shm':
+            self.queues[queue_name] = SharedMemoryQueue(maxsize=queue_size, slot_size=slot_size, ctx=self._ctx)
+        else:
+            # Every thread backend notifies listeners on put, so multi-queue consumers can block on all of them at once
+            self.queues[queue_name] = QUEUE_BACKENDS[backend](maxsize=queue_size)
         return self.queues[queue_name]
     
     def get_queue(self, queue_name: str) -> queue.Queue:
@@ -47,20 +90,26 @@ class ProducerConsumerSystem:
                      name: str,
                      source: List[Any],
                      production_delay: float = 0.1,
-                     queue_name: str = None) -> Producer:
+                     queue_name: str = None,
+                     batch_size: int = 1) -> Producer:
         """
         Add a producer to the system.
+        batch_size > 1 enqueues that many items per queue operation.
         """
         if queue_name is None:
             raise ValueError("queue_name is required")
         target_queue = self.get_queue(queue_name)
-        producer = Producer(
+        kwargs = dict(
             name=name,
             source=source,
             shared_queue=target_queue,
             stop_event=self.stop_event,
-            production_delay=production_delay
+            production_delay=production_delay,
+            batch_size=batch_size
         )
+        producer = Producer(**kwargs)
+        if self.mode == 'process':
+            self._worker_specs.append(('producer', len(self.producers), kwargs))
         self.producers.append(producer)
         return producer
     
@@ -70,10 +119,21 @@ class ProducerConsumerSystem:
         destination: List[Item],
         consumption_delay: float = 0.15,
         max_items: Optional[int] = None,
-        queue_names: Union[str, List[str]] = None
+        queue_names: Union[str, List[str]] = None,
+        batch_size: int = 1,
+        linger: float = 0.0,
+        selection: str = 'round_robin',
+        weights: Optional[List[float]] = None,
+        handler: Optional[Callable[[Item], Any]] = None
     ) -> Consumer:
         """
         Add a consumer to the system.
+        batch_size > 1 drains up to that many items per queue operation, waiting
+        up to linger seconds for a batch to fill.
+        With several queues, selection picks among ready queues: 'round_robin',
+        'weighted' (one weight per queue) or 'priority' (queue_names order).
+        handler is called on each item before it is marked consumed; in process
+        mode it runs in the consumer's process and must be picklable under 'spawn'.
         """
         if queue_names is None:
             raise ValueError("queue_names is required")
@@ -83,14 +143,21 @@ class ProducerConsumerSystem:
         else:
             target_queue = [self.get_queue(qn) for qn in queue_names]
         
-        consumer = Consumer(
+        kwargs = dict(
             name=name,
             shared_queue=target_queue,
-            destination=destination,
             stop_event=self.stop_event,
             consumption_delay=consumption_delay,
-            max_items=max_items
+            max_items=max_items,
+            batch_size=batch_size,
+            linger=linger,
+            selection=selection,
+            weights=weights,
+            handler=handler
         )
+        consumer = Consumer(destination=destination, **kwargs)
+        if self.mode == 'process':
+            self._worker_specs.append(('consumer', len(self.consumers), kwargs))
         
         self.consumers.append(consumer)
         return consumer
@@ -101,6 +168,9 @@ class ProducerConsumerSystem:
         
         self.start_time = time.time()
         
+        if self.mode == 'process':
+            self._start_processes()
+            return
         for producer in self.producers:
             producer.start()
         for consumer in self.consumers:
@@ -108,6 +178,9 @@ class ProducerConsumerSystem:
     
     def wait_for_completion(self, timeout: Optional[float] = None):
         """Wait for all threads to complete."""
+        if self.mode == 'process':
+            self._wait_for_processes(timeout)
+            return
         for producer in self.producers:
             producer.join(timeout=timeout)
         
@@ -116,6 +189,8 @@ class ProducerConsumerSystem:
         
         self.stop_event.set()
         
+        for consumer in self.consumers:
+            consumer.wake()
         for consumer in self.consumers:
             consumer.join(timeout=timeout)
         
@@ -125,14 +200,95 @@ class ProducerConsumerSystem:
         """Gracefully stop all threads"""
         self.stop_event.set()
         
+        if self.mode == 'process':
+            for q in self.queues.values():
+                q.wake()
+            self._collect_results(len(self._processes), timeout=5)
+            for process in self._processes:
+                process.join(timeout=5)
+            self.end_time = time.time()
+            return
         for producer in self.producers:
             producer.join(timeout=5)
         
+        for consumer in self.consumers:
+            consumer.wake()
         for consumer in self.consumers:
             consumer.join(timeout=5)
         
         self.end_time = time.time()
     
+    # Process mode
+    def _start_processes(self):
+        self._results = self._ctx.Queue()
+        for role, index, kwargs in self._worker_specs:
+            process = self._ctx.Process(
+                target=run_worker, args=(role, index, kwargs, self._results), name=kwargs['name']
+            )
+            process.start()
+            self._processes.append(process)
+
+    def _wait_for_processes(self, timeout: Optional[float]):
+        # Same order as the threads: producers finish, queues drain, then consumers are stopped
+        self._collect_results(len(self.producers), timeout, role='producer')
+        for qname, q in self.queues.items():
+            q.join()
+        
+        self.stop_event.set()
+        for q in self.queues.values():
+            q.wake()
+        
+        self._collect_results(len(self._processes), timeout)
+        for process in self._processes:
+            process.join(timeout=timeout)
+        
+        self.end_time = time.time()
+
+    def _collect_results(self, expected: int, timeout: Optional[float], role: Optional[str] = None):
+        """
+        Fold worker reports into the parent's Producer/Consumer objects until `expected`
+        workers (of `role`, if given) have reported. Results are read before joining
+        because a child cannot exit until its report has been taken off the pipe.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        def reported() -> int:
+            return sum(1 for r, _ in self._reported if role is None or r == role)
+        
+        while reported() < expected:
+            try:
+                worker_role, index, stats, items = self._results.get(timeout=0.1)
+            except queue.Empty:
+                # A worker that died without reporting would otherwise be waited on forever
+                if not any(process.is_alive() for process in self._processes):
+                    self._drain_results()
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                continue
+            self._absorb_result(worker_role, index, stats, items)
+
+    def _drain_results(self):
+        while True:
+            try:
+                self._absorb_result(*self._results.get(timeout=0.1))
+            except queue.Empty:
+                return
+
+    def _absorb_result(self, role: str, index: int, stats: dict, items: Optional[List[Item]]):
+        if role == 'producer':
+            producer = self.producers[index]
+            with producer.lock:
+                producer.items_produced = stats['items_produced']
+                producer.batches_produced = stats['batches_produced']
+        else:
+            consumer = self.consumers[index]
+            with consumer.lock:
+                consumer.destination.extend(items)
+                consumer.items_consumed = stats['items_consumed']
+                consumer.batches_consumed = stats['batches_consumed']
+        self._reported.add((role, index))
+
     def get_statistics(self) -> dict:
         """Get comprehensive system statistics"""
         duration = (self.end_time - self.start_time) if self.end_time else 0
@@ -148,6 +304,7 @@ class ProducerConsumerSystem:
         total_queue_remaining = sum(queue_stats.values())
         
         return {
+            'mode': self.mode,
             'duration': duration,
             'total_produced': total_produced,
             'total_consumed': total_consumed,
@@ -1,11 +1,18 @@
 import time
 import queue
+import asyncio
 import threading
 
 from src.models import Item, ItemStatus
 from src.producer import Producer
 from src.consumer import Consumer
 from src.system import ProducerConsumerSystem
+from src.batching import BatchQueue, put_many, get_many, task_done_many
+from src.selector import SelectableQueue, QueueSelector
+from src.ring_buffer import SPSCRingQueue, MPMCRingQueue
+from src.shm_queue import SharedMemoryQueue
+from src.async_queue import AsyncQueue, AsyncQueueSelector
+from src.async_system import AsyncProducerConsumerSystem
 
 
 def test_item_has_correct_fields():
@@ -212,3 +219,522 @@ def test_very_small_queue_size_works():
     system.wait_for_completion(timeout=5)
     
     assert len(dest) == 5
+
+
+# Test batched transfers: natively on BatchQueue, and through the public API of queue.Queue
+BATCH_QUEUES = [BatchQueue, SelectableQueue, queue.Queue]
+
+
+def test_put_many_and_get_many_preserve_order():
+    for queue_class in BATCH_QUEUES:
+        q = queue_class(maxsize=10)
+        assert put_many(q, list(range(8))) == 8
+        assert get_many(q, 5) == [0, 1, 2, 3, 4]
+        assert get_many(q, 5) == [5, 6, 7]
+        task_done_many(q, 8)
+        q.join()
+
+
+def test_put_many_times_out_when_queue_stays_full():
+    for queue_class in BATCH_QUEUES:
+        q = queue_class(maxsize=3)
+        assert put_many(q, list(range(5)), timeout=0.05) == 3
+        assert q.qsize() == 3
+
+
+def test_get_many_raises_empty_and_lingers_for_more():
+    for queue_class in BATCH_QUEUES:
+        q = queue_class()
+        try:
+            get_many(q, 4, timeout=0.05)
+            assert False, "expected queue.Empty"
+        except queue.Empty:
+            pass
+
+        q.put("first")
+        threading.Timer(0.05, lambda: q.put("late")).start()
+        assert get_many(q, 4, timeout=1, linger=0.5) == ["first", "late"]
+
+
+def test_task_done_many_rejects_overcount():
+    for queue_class in BATCH_QUEUES:
+        q = queue_class()
+        put_many(q, [1, 2])
+        try:
+            task_done_many(q, 3)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+
+def test_batch_queue_matches_queue_interface():
+    q = BatchQueue(maxsize=2)
+    q.put(1)
+    q.put_nowait(2)
+    assert q.full() and q.qsize() == 2 and q.unfinished_tasks == 2
+    for call, error in [(lambda: q.put(3, timeout=0.01), queue.Full)]:
+        try:
+            call()
+            assert False, f"expected {error.__name__}"
+        except error:
+            pass
+    assert q.get() == 1 and q.get_nowait() == 2 and q.empty()
+    for call, error in [(lambda: q.get(timeout=0.01), queue.Empty), (lambda: q.get(timeout=-1), ValueError)]:
+        try:
+            call()
+            assert False, f"expected {error.__name__}"
+        except error:
+            pass
+
+    # A blocked putter is released by a get; join waits for every task_done
+    threading.Timer(0.05, q.get).start()
+    assert q.put_many([3, 4, 5], timeout=1) == 3
+    q.task_done_many(2)
+    threading.Timer(0.05, lambda: q.task_done_many(3)).start()
+    q.join()
+    assert q.unfinished_tasks == 0
+
+
+def test_batched_system_transfers_all_items():
+    source1 = [f"p1-{i}" for i in range(500)]
+    source2 = [f"p2-{i}" for i in range(500)]
+    dest1, dest2 = [], []
+
+    system = ProducerConsumerSystem()
+    system.add_queue("main", 64)
+    system.add_producer("P1", source1, 0, queue_name="main", batch_size=32)
+    system.add_producer("P2", source2, 0, queue_name="main", batch_size=32)
+    system.add_consumer("C1", dest1, 0, queue_names="main", batch_size=50, linger=0.001)
+    system.add_consumer("C2", dest2, 0, queue_names="main", batch_size=50, linger=0.001)
+
+    system.start()
+    system.wait_for_completion(timeout=10)
+
+    consumed = [item.data for item in dest1 + dest2]
+    assert sorted(consumed) == sorted(source1 + source2)
+    assert all(item.status == ItemStatus.CONSUMED for item in dest1 + dest2)
+    stats = system.get_statistics()
+    assert stats['total_produced'] == stats['total_consumed'] == 1000
+    assert sum(p['batches_produced'] for p in stats['producers']) == 32
+    assert sum(c['batches_consumed'] for c in stats['consumers']) < 1000
+
+
+def test_batched_consumer_respects_max_items():
+    q = queue.Queue()
+    put_many(q, [Item(id=i, data=i, timestamp=time.time()) for i in range(10)])
+    dest = []
+    stop = threading.Event()
+
+    consumer = Consumer("C1", q, dest, stop, consumption_delay=0, max_items=7, batch_size=4)
+    consumer.start()
+    consumer.join(timeout=2)
+
+    assert consumer.items_consumed == 7
+    assert consumer.batches_consumed == 2
+    assert q.qsize() == 3
+
+
+# Test event-driven multi-queue fan-in
+def test_selector_wakes_as_soon_as_any_queue_receives_an_item():
+    queues = [SelectableQueue(5) for _ in range(3)]
+    selector = QueueSelector(queues)
+    threading.Timer(0.05, lambda: queues[2].put("late")).start()
+
+    start = time.monotonic()
+    index, item = selector.get(timeout=2)
+    assert (index, item) == (2, "late")
+    assert time.monotonic() - start < 0.5
+    assert selector.wakeups <= 2
+
+
+def test_selector_policies_choose_among_ready_queues():
+    queues = [SelectableQueue() for _ in range(3)]
+    for q in queues:
+        for i in range(10):
+            q.put(i)
+
+    round_robin = QueueSelector(queues)
+    assert [round_robin.get()[0] for _ in range(6)] == [0, 1, 2, 0, 1, 2]
+
+    priority = QueueSelector(queues, selection="priority")
+    assert [priority.get()[0] for _ in range(3)] == [0, 0, 0]
+
+    weighted = QueueSelector(queues, selection="weighted", weights=[3, 1, 0])
+    picks = [weighted.get()[0] for _ in range(4)]
+    assert picks.count(0) == 3 and picks.count(1) == 1
+
+
+def test_selector_wake_interrupts_blocked_select():
+    selector = QueueSelector([SelectableQueue(), SelectableQueue()])
+    threading.Timer(0.05, selector.wake).start()
+    try:
+        selector.select(timeout=5)
+        assert False, "expected queue.Empty"
+    except queue.Empty:
+        pass
+
+
+def test_fan_in_consumer_stops_promptly_and_drains_all_queues():
+    system = ProducerConsumerSystem()
+    names = ["s1", "s2", "s3", "s4"]
+    for name in names:
+        system.add_queue(name, 5)
+        system.add_producer(f"P-{name}", [f"{name}-{i}" for i in range(5)], 0.001, queue_name=name)
+    dest = []
+    consumer = system.add_consumer("Agg", dest, 0, queue_names=names, selection="weighted", weights=[4, 3, 2, 1])
+    assert consumer.selector is not None
+
+    system.start()
+    start = time.monotonic()
+    system.wait_for_completion(timeout=5)
+
+    assert len(dest) == 20
+    assert time.monotonic() - start < 0.9  # woken on stop instead of timing out
+
+
+# Test ring-buffer queue backends
+def test_ring_queues_are_fifo_and_bounded():
+    for cls in (SPSCRingQueue, MPMCRingQueue):
+        q = cls(maxsize=3)
+        for i in range(3):
+            q.put(i)
+        assert q.full() and q.qsize() == 3
+        try:
+            q.put(3, timeout=0.01)
+            assert False, "expected queue.Full"
+        except queue.Full:
+            pass
+        assert [q.get() for _ in range(3)] == [0, 1, 2]
+        try:
+            q.get_nowait()
+            assert False, "expected queue.Empty"
+        except queue.Empty:
+            pass
+        # Wraps around the buffer
+        for i in range(5):
+            q.put(i)
+            assert q.get() == i
+
+
+def test_ring_queue_join_and_batches():
+    q = MPMCRingQueue(maxsize=8)
+    assert q.put_many(list(range(10)), timeout=0.01) == 8
+    assert q.get_many(5) == [0, 1, 2, 3, 4]
+    q.task_done_many(5)
+    assert q.unfinished_tasks == 3
+    assert q.get_many(10) == [5, 6, 7]
+    threading.Timer(0.05, q.task_done_many, args=(3,)).start()
+    q.join()
+    assert q.unfinished_tasks == 0
+    try:
+        q.task_done()
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_ring_queue_requires_capacity():
+    for cls in (SPSCRingQueue, MPMCRingQueue):
+        try:
+            cls(maxsize=0)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+
+def test_mpmc_queue_under_contention():
+    q = MPMCRingQueue(maxsize=16)
+    received = []
+    lock = threading.Lock()
+
+    def consume():
+        while True:
+            item = q.get()
+            q.task_done()
+            if item is None:
+                return
+            with lock:
+                received.append(item)
+
+    consumers = [threading.Thread(target=consume) for _ in range(4)]
+    producers = [threading.Thread(target=lambda p=p: [q.put((p, i)) for i in range(500)]) for p in range(4)]
+    for thread in consumers + producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        q.put(None)
+    for thread in consumers:
+        thread.join(timeout=5)
+
+    assert sorted(received) == sorted((p, i) for p in range(4) for i in range(500))
+
+
+def test_system_runs_on_ring_queue_backends():
+    for backend in ("spsc", "mpmc"):
+        source = [f"{backend}-{i}" for i in range(200)]
+        dest = []
+        system = ProducerConsumerSystem()
+        q = system.add_queue("main", 16, backend=backend)
+        assert isinstance(q, SPSCRingQueue if backend == "spsc" else MPMCRingQueue)
+        system.add_producer("P1", source, 0, queue_name="main", batch_size=8)
+        system.add_consumer("C1", dest, 0, queue_names="main")
+        system.start()
+        system.wait_for_completion(timeout=5)
+        assert [item.data for item in dest] == source
+
+    try:
+        ProducerConsumerSystem().add_queue("main", 16, backend="lockfree")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_fan_in_consumer_selects_over_ring_queues():
+    system = ProducerConsumerSystem()
+    for name in ("a", "b"):
+        system.add_queue(name, 4, backend="mpmc")
+        system.add_producer(f"P-{name}", [f"{name}-{i}" for i in range(10)], 0, queue_name=name)
+    dest = []
+    consumer = system.add_consumer("Agg", dest, 0, queue_names=["a", "b"])
+    assert consumer.selector is not None
+
+    system.start()
+    system.wait_for_completion(timeout=5)
+    assert len(dest) == 20
+
+
+# Test process mode
+def square_data(item):
+    item.data = item.data * item.data
+
+
+def test_shared_memory_queue_round_trips_items():
+    q = SharedMemoryQueue(maxsize=2, slot_size=128)
+    q.put(Item(id=7, data={"k": [1, 2]}, timestamp=1.5))
+    q.put("plain")
+    try:
+        q.put("overflow", timeout=0.01)
+        assert False, "expected queue.Full"
+    except queue.Full:
+        pass
+
+    item = q.get()
+    assert (item.id, item.data, item.timestamp, item.status) == (7, {"k": [1, 2]}, 1.5, ItemStatus.IN_QUEUE)
+    assert q.get() == "plain"
+    q.task_done_many(2)
+    q.join()
+
+    try:
+        q.put("x" * 200)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    q.close()
+
+
+def test_shared_memory_queue_wake_releases_getters():
+    q = SharedMemoryQueue(maxsize=4)
+    threading.Timer(0.05, q.wake).start()
+    start = time.monotonic()
+    try:
+        q.get(timeout=5)
+        assert False, "expected queue.Empty"
+    except queue.Empty:
+        pass
+    assert time.monotonic() - start < 1
+    q.close()
+
+
+def test_process_mode_runs_handlers_in_workers():
+    system = ProducerConsumerSystem(mode="process")
+    system.add_queue("a", 8)
+    system.add_queue("b", 8)
+    system.add_producer("P1", list(range(50)), 0, queue_name="a", batch_size=8)
+    system.add_producer("P2", list(range(50, 100)), 0, queue_name="b")
+    dest1, dest2 = [], []
+    system.add_consumer("C1", dest1, 0, queue_names=["a", "b"], handler=square_data)
+    system.add_consumer("C2", dest2, 0, queue_names="a", batch_size=4, handler=square_data)
+
+    system.start()
+    system.wait_for_completion(timeout=10)
+
+    assert sorted(item.data for item in dest1 + dest2) == [x * x for x in range(100)]
+    assert all(item.status == ItemStatus.CONSUMED for item in dest1 + dest2)
+    stats = system.get_statistics()
+    assert stats['mode'] == "process"
+    assert stats['total_produced'] == stats['total_consumed'] == 100
+    assert stats['total_queue_remaining'] == 0
+    assert sum(c['destination_size'] for c in stats['consumers']) == 100
+
+
+def test_process_mode_with_spawn_start_method():
+    dest = []
+    system = ProducerConsumerSystem(mode="process", mp_context="spawn")
+    system.add_queue("main", 4)
+    system.add_producer("P1", list(range(20)), 0, queue_name="main")
+    system.add_consumer("C1", dest, 0, queue_names="main", max_items=20, handler=square_data)
+    system.start()
+    system.wait_for_completion(timeout=20)
+    assert [item.data for item in dest] == [x * x for x in range(20)]
+
+
+def test_process_mode_validates_configuration():
+    system = ProducerConsumerSystem(mode="process")
+    assert isinstance(system.add_queue("main"), SharedMemoryQueue)
+    try:
+        system.add_queue("threads-only", backend="mpmc")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    try:
+        ProducerConsumerSystem(mode="fibers")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+# Test asyncio runtime
+async def slow_io(item):
+    await asyncio.sleep(0.001)
+
+
+def test_async_system_transfers_all_items():
+    async def scenario():
+        system = AsyncProducerConsumerSystem(verbose=False)
+        system.add_queue("main", 4)
+        system.add_producer("P1", [f"p1-{i}" for i in range(100)], 0, queue_name="main")
+        system.add_producer("P2", [f"p2-{i}" for i in range(100)], 0, queue_name="main")
+        dest = []
+        for i in range(20):
+            system.add_consumer(f"C{i}", dest, 0, queue_names="main", handler=slow_io)
+        stats = await system.run(timeout=10)
+        return dest, stats
+
+    dest, stats = asyncio.run(scenario())
+    assert len(dest) == 200
+    assert all(item.status == ItemStatus.CONSUMED for item in dest)
+    assert stats['mode'] == "async"
+    assert stats['total_produced'] == stats['total_consumed'] == 200
+    assert stats['total_queue_remaining'] == 0
+
+
+def test_async_fan_in_and_max_items():
+    async def scenario():
+        system = AsyncProducerConsumerSystem(verbose=False)
+        names = ["a", "b", "c"]
+        for name in names:
+            system.add_queue(name, 2)
+            system.add_producer(f"P-{name}", [f"{name}-{i}" for i in range(30)], 0.001, queue_name=name)
+        fan_in, capped = [], []
+        system.add_consumer("Agg", fan_in, 0, queue_names=names, selection="weighted", weights=[3, 2, 1])
+        system.add_consumer("Capped", capped, 0, queue_names="a", max_items=5)
+        start = time.monotonic()
+        await system.run(timeout=10)
+        return fan_in, capped, time.monotonic() - start
+
+    fan_in, capped, elapsed = asyncio.run(scenario())
+    assert len(capped) == 5
+    assert sorted(item.data for item in fan_in + capped) == sorted(
+        f"{name}-{i}" for name in "abc" for i in range(30))
+    assert elapsed < 2  # no get timeouts or polling on shutdown
+
+
+def test_async_selector_waits_on_all_queues():
+    async def scenario():
+        queues = [AsyncQueue(2), AsyncQueue(2)]
+        selector = AsyncQueueSelector(queues, selection="priority")
+        waiting = asyncio.create_task(selector.get())
+        await asyncio.sleep(0.01)
+        await queues[1].put("late")
+        index, item = await asyncio.wait_for(waiting, 1)
+
+        await queues[1].put("second")
+        await queues[0].put("first")
+        return (index, item), await selector.get(), selector.wakeups
+
+    woken, prioritized, wakeups = asyncio.run(scenario())
+    assert woken == (1, "late")
+    assert prioritized == (0, "first")
+    assert wakeups == 1
+
+
+def test_async_queue_matches_asyncio_queue_interface():
+    async def scenario():
+        q = AsyncQueue(1)
+        q.put_nowait("a")
+        assert q.full() and q.qsize() == 1
+        try:
+            q.put_nowait("b")
+            assert False, "expected QueueFull"
+        except asyncio.QueueFull:
+            pass
+
+        # A blocked put resumes once a get frees space
+        putter = asyncio.create_task(q.put("b"))
+        await asyncio.sleep(0.01)
+        assert not putter.done() and await q.get() == "a"
+        await asyncio.wait_for(putter, 1)
+
+        # A getter cancelled after being woken hands the wakeup to the next getter
+        assert await q.get() == "b" and q.empty()
+        first, second = asyncio.create_task(q.get()), asyncio.create_task(q.get())
+        await asyncio.sleep(0.01)
+        q.put_nowait("c")
+        first.cancel()
+        assert await asyncio.wait_for(second, 1) == "c"
+        try:
+            q.get_nowait()
+            assert False, "expected QueueEmpty"
+        except asyncio.QueueEmpty:
+            pass
+
+        # join waits for one task_done per put
+        joined = asyncio.create_task(q.join())
+        await asyncio.sleep(0.01)
+        assert not joined.done()
+        for _ in range(3):
+            q.task_done()
+        await asyncio.wait_for(joined, 1)
+        try:
+            q.task_done()
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+    asyncio.run(scenario())
+
+
+def test_async_stop_cancels_only_idle_workers():
+    async def scenario():
+        system = AsyncProducerConsumerSystem(verbose=False)
+        system.add_queue("main", 2)
+        system.add_producer("P1", list(range(10)), 0, queue_name="main")
+        dest = []
+        system.add_consumer("C1", dest, 0.2, queue_names="main")
+        await system.start()
+        await asyncio.sleep(0.3)
+        await system.stop()
+        return system, dest
+
+    system, dest = asyncio.run(scenario())
+    stats = system.get_statistics()
+    assert len(dest) == 2  # the item in progress at stop was finished, not dropped
+    assert all(item.status == ItemStatus.CONSUMED for item in dest)
+    assert stats['total_produced'] == len(dest) + stats['total_queue_remaining']
+    assert all(worker.task.done() for worker in system.producers + system.consumers)
+
+
+def test_async_system_runs_many_consumers():
+    async def scenario():
+        system = AsyncProducerConsumerSystem(verbose=False)
+        system.add_queue("main", 100)
+        system.add_producer("P1", range(5000), 0, queue_name="main")
+        dest = []
+        for i in range(5000):
+            system.add_consumer(f"C{i}", dest, 0.01, queue_names="main")
+        return await system.run(timeout=30)
+
+    stats = asyncio.run(scenario())
+    assert stats['total_consumed'] == 5000
+    assert len(stats['consumers']) == 5000